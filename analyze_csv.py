@@ -12,6 +12,8 @@ Usage:
 """
 
 import argparse
+import hashlib
+import struct
 import sys
 from pathlib import Path
 from typing import Optional
@@ -23,6 +25,105 @@ from lib.csv_analyzer_lib import (
 )
 
 
+# Bump when analysis results change so stale cached analyses are ignored
+ANALYSIS_CACHE_VERSION = 1
+
+
+def analysis_fingerprint(
+    input_file: Path,
+    encoding: str,
+    sample_size: Optional[int],
+    values_may_contain_newlines: bool
+) -> str:
+    """Compute a cache key for the analysis of a CSV file.
+    
+    The key covers the file's path, size, modification time and first MiB
+    of content, plus every option that changes the analysis result, so a
+    cached analysis is only reused for an unchanged file.
+    
+    Args:
+        input_file: Path to the CSV file.
+        encoding: File encoding used for analysis.
+        sample_size: Maximum number of rows analyzed (None = all).
+        values_may_contain_newlines: Whether quoted values may span lines.
+        
+    Returns:
+        Hex digest identifying the analysis.
+    """
+    stat = input_file.stat()
+    digest = hashlib.blake2b(digest_size=16)
+    
+    with open(input_file, 'rb') as f:
+        digest.update(f.read(1 << 20))
+    
+    digest.update(struct.pack("QQ", stat.st_size, stat.st_mtime_ns))
+    digest.update(repr((
+        ANALYSIS_CACHE_VERSION,
+        str(input_file.resolve()),
+        encoding,
+        sample_size,
+        values_may_contain_newlines,
+    )).encode('utf-8'))
+    
+    return digest.hexdigest()
+
+
+def analysis_cache_file(cache_dir: Path, input_file: Path, fingerprint: str) -> Path:
+    """Return the cache entry path for an analysis of a CSV file.
+    
+    Entry names start with a key derived from the file's resolved path, so
+    the entries left behind by earlier versions of the same file can be
+    found and removed.
+    
+    Args:
+        cache_dir: Directory holding the .analysis_cache directory.
+        input_file: Path to the CSV file.
+        fingerprint: Result of analysis_fingerprint() for the file.
+        
+    Returns:
+        Path of the cache entry.
+    """
+    path_key = hashlib.blake2b(
+        str(input_file.resolve()).encode('utf-8'), digest_size=8
+    ).hexdigest()
+    return cache_dir / '.analysis_cache' / f"{path_key}-{fingerprint}.json"
+
+
+def save_cached_analysis(config: CSVConfiguration, cache_file: Path) -> bool:
+    """Write an analysis to the cache and remove older entries for the file.
+    
+    The cache only saves time, so a failed write (permissions, full disk,
+    read-only directory) is not an error: any partial entry is removed and
+    the next run analyzes the file again.
+    
+    Args:
+        config: Analysis result to cache.
+        cache_file: Entry path from analysis_cache_file().
+        
+    Returns:
+        True if the entry was written, False otherwise.
+    """
+    try:
+        config.save(cache_file)
+    except OSError:
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+        return False
+    
+    # Entries for the same file with another fingerprint are stale
+    path_key = cache_file.name.split('-', 1)[0]
+    for stale_file in cache_file.parent.glob(f"{path_key}-*.json"):
+        if stale_file != cache_file:
+            try:
+                stale_file.unlink()
+            except OSError:
+                pass
+    
+    return True
+
+
 def analyze_csv_file(
     input_path: str,
     output_path: Optional[str] = None,
@@ -30,7 +131,10 @@ def analyze_csv_file(
     compare: bool = False,
     sample_size: Optional[int] = None,
     encoding: str = 'utf-8',
-    verbose: bool = False
+    verbose: bool = False,
+    values_may_contain_newlines: bool = True,
+    workers: Optional[int] = 1,
+    use_cache: bool = True
 ) -> None:
     """Analyze a CSV file and generate configuration.
     
@@ -42,6 +146,9 @@ def analyze_csv_file(
         sample_size: Maximum number of rows to analyze (None = all).
         encoding: File encoding to use.
         verbose: Whether to print detailed information.
+        values_may_contain_newlines: Whether quoted values may span lines.
+        workers: Number of processes for column analysis (None = one per CPU).
+        use_cache: Whether to reuse a cached analysis of an unchanged file.
     """
     # Convert paths
     input_file = Path(input_path)
@@ -66,43 +173,75 @@ def analyze_csv_file(
         print()
     
     try:
-        # Create analyzer and perform analysis
-        analyzer = CSVAnalyzer(
-            filepath=input_file,
-            encoding=encoding,
-            sample_size=sample_size
-        )
+        # Reuse the analysis of an unchanged file from a previous run
+        config = None
+        cache_file = None
+        if use_cache and input_file.exists():
+            cache_dir = Path(config_dir) if config_dir else output_file.parent
+            fingerprint = analysis_fingerprint(
+                input_file, encoding, sample_size, values_may_contain_newlines
+            )
+            cache_file = analysis_cache_file(cache_dir, input_file, fingerprint)
+            
+            try:
+                config = CSVConfiguration.load(cache_file)
+            except (OSError, ValueError, KeyError, TypeError):
+                config = None
+            
+            if config is not None and verbose:
+                print(f"Using cached analysis: {cache_file}")
         
-        config = analyzer.analyze()
+        if config is None:
+            # Create analyzer and perform analysis
+            analyzer = CSVAnalyzer(
+                filepath=input_file,
+                encoding=encoding,
+                sample_size=sample_size,
+                values_may_contain_newlines=values_may_contain_newlines,
+                workers=workers
+            )
+            
+            config = analyzer.analyze()
+            
+            if cache_file is not None:
+                if not save_cached_analysis(config, cache_file) and verbose:
+                    print(f"Could not write analysis cache: {cache_file}")
         
         if verbose:
-            print("Analysis completed successfully!")
-            print(f"  Delimiter: {repr(config.delimiter)}")
-            print(f"  Quote character: {repr(config.quotechar)}")
-            print(f"  Has header: {config.has_header}")
-            print(f"  Number of columns: {len(config.columns)}")
-            print(f"  Number of rows: {config.line_count}")
-            print()
+            # Build the whole report first and write it once; wide files
+            # produce several lines per column
+            lines = [
+                "Analysis completed successfully!",
+                f"  Delimiter: {repr(config.delimiter)}",
+                f"  Quote character: {repr(config.quotechar)}",
+                f"  Has header: {config.has_header}",
+                f"  Number of columns: {len(config.columns)}",
+                f"  Number of rows: {config.line_count}",
+                "",
+                "Column Analysis:",
+                "-" * 80,
+            ]
+            append = lines.append
             
-            # Print column information
-            print("Column Analysis:")
-            print("-" * 80)
+            # Column information
             for col in config.columns:
-                print(f"  {col.name} (index {col.index}):")
-                print(f"    Type: {col.data_type.value}")
-                print(f"    Nullable: {col.nullable} ({col.null_percentage:.1%} null)")
-                print(f"    Unique values: {col.unique_count} of {col.total_count}")
+                append(f"  {col.name} (index {col.index}):")
+                append(f"    Type: {col.data_type.value}")
+                append(f"    Nullable: {col.nullable} ({col.null_percentage:.1%} null)")
+                append(f"    Unique values: {col.unique_count} of {col.total_count}")
                 
                 if col.enum_values:
-                    print(f"    Enum values: {sorted(list(col.enum_values))[:5]}...")
+                    append(f"    Enum values: {sorted(col.enum_values)[:5]}...")
                 
                 if col.statistics:
                     if 'min' in col.statistics:
-                        print(f"    Range: [{col.statistics['min']:.2f}, {col.statistics['max']:.2f}]")
+                        append(f"    Range: [{col.statistics['min']:.2f}, {col.statistics['max']:.2f}]")
                     if 'min_length' in col.statistics:
-                        print(f"    Length: [{col.statistics['min_length']}, {col.statistics['max_length']}]")
+                        append(f"    Length: [{col.statistics['min_length']}, {col.statistics['max_length']}]")
                 
-                print()
+                append("")
+            
+            sys.stdout.write("\n".join(lines) + "\n")
         
         # Compare with existing configurations if requested
         if compare and config_dir:
@@ -224,6 +363,25 @@ Examples:
         help='Print detailed analysis information'
     )
     
+    parser.add_argument(
+        '--no-multiline-values',
+        action='store_true',
+        help='Assume no quoted value contains a line break (faster sampling)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of processes for column analysis (default: 1, 0 = one per CPU)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-analyze instead of reusing a cached analysis'
+    )
+    
     args = parser.parse_args()
     
     # Call analysis function
@@ -234,7 +392,10 @@ Examples:
         compare=args.compare,
         sample_size=args.sample,
         encoding=args.encoding,
-        verbose=args.verbose
+        verbose=args.verbose,
+        values_may_contain_newlines=not args.no_multiline_values,
+        workers=args.workers or None,
+        use_cache=not args.no_cache
     )
 
 
@@ -7,32 +7,59 @@ concurrently query multiple Oracle database tables for their maximum
 'insert_dtm' column values.
 
 The example showcases:
-    - multiprocessing.Manager for shared state (Queue and dict)
-    - multiprocessing.Process for worker processes
+    - multiprocessing.Pool with a per-worker session pool initializer
+    - imap_unordered for batched task distribution and result collection
+    - UNION ALL batching to query many tables in one round-trip
+    - A thread pool alternative for the I/O-bound queries
     - Proper logging with process names
     - Oracle database connectivity patterns
-    - Clean shutdown with sentinel values
+    - Clean shutdown with worker finalizers
 
 Example Usage:
     python oracle_max_dtm_query.py
 
 Requirements:
-    - Python 3.7+
+    - Python 3.10+
     - oracledb or cx_Oracle package
 
 Author: Training Example
 Version: 1.0.0
 """
 
+import functools
 import logging
 import multiprocessing
-from multiprocessing import Process, Manager
-from multiprocessing.managers import DictProxy
-from queue import Empty
-from typing import Any, Dict, List, Optional, Tuple
+import multiprocessing.util
+import os
+import re
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 import time
 from datetime import datetime
 
+# Resolve the Oracle driver once at import time: the newer oracledb driver
+# is preferred, with cx_Oracle as a fallback. Worker processes then only
+# look the module up instead of retrying the imports per connection.
+try:
+    import oracledb as oracle_driver
+except ImportError:
+    try:
+        import cx_Oracle as oracle_driver
+    except ImportError:
+        oracle_driver = None
+
+MISSING_DRIVER_MESSAGE = (
+    "No Oracle database driver found. "
+    "Please install one of the following:\n"
+    "  pip install oracledb    (recommended)\n"
+    "  pip install cx_Oracle"
+)
+
 
 # =============================================================================
 # LOGGING CONFIGURATION
@@ -76,10 +103,91 @@ def configure_logging(level: int = logging.DEBUG) -> logging.Logger:
 logger = configure_logging(logging.DEBUG)
 
 
+# Maximum number of tables queried together in one UNION ALL statement
+QUERY_BATCH_SIZE = 32
+
+# Seconds to wait for the next batch of results before giving up on the
+# remaining workers (e.g. one stuck on a lock or a dead connection)
+BATCH_TIMEOUT = 600
+
+# Unquoted Oracle identifier: a letter followed by letters, digits, _, $ or #
+ORACLE_IDENTIFIER = re.compile(r'[A-Za-z][A-Za-z0-9_$#]{0,127}')
+
+
+# =============================================================================
+# RESULT TYPE
+# =============================================================================
+
+@dataclass(slots=True)
+class TableResult:
+    """
+    Result of querying one table for its maximum insert_dtm.
+
+    Slots keep each result small and make attribute reads direct offset
+    lookups, and results pickle compactly when returned from a worker.
+
+    Attributes:
+        table_name: The name of the table queried.
+        schema_name: The schema containing the table.
+        status: 'pending' until queried, then 'success' or 'error'.
+        max_insert_dtm: Maximum insert_dtm value, or None if the table is
+            empty or the query failed.
+        error: Error message if status is 'error'.
+        query_time: ISO format timestamp of query execution.
+        row_count: Number of rows returned (0 or 1).
+    """
+    table_name: str
+    schema_name: str
+    status: str = 'pending'
+    max_insert_dtm: Optional[datetime] = None
+    error: Optional[str] = None
+    query_time: str = ''
+    row_count: int = 0
+
+
 # =============================================================================
 # DATABASE CONNECTION FUNCTIONS
 # =============================================================================
 
+# ==========================================================================
+# STUB IMPLEMENTATION - REPLACE WITH ACTUAL CREDENTIAL RETRIEVAL
+# ==========================================================================
+# In production, retrieve credentials securely:
+#
+# Option 1: Environment Variables
+#     dsn = os.environ.get('ORACLE_DSN')
+#     user = os.environ.get('ORACLE_USER')
+#     password = os.environ.get('ORACLE_PASSWORD')
+#
+# Option 2: AWS Secrets Manager
+#     import boto3
+#     client = boto3.client('secretsmanager')
+#     secret = client.get_secret_value(SecretId='oracle-credentials')
+#
+# Option 3: Configuration file (with encryption)
+#     from configparser import ConfigParser
+#     config = ConfigParser()
+#     config.read('config.ini')
+# ==========================================================================
+CONNECTION_MAP: Dict[str, Tuple[str, str, str]] = {
+    "MY_SCHEMA": (
+        "localhost:1521/ORCL",  # DSN: host:port/service_name
+        "my_schema_user",  # Username
+        "my_secure_password"  # Password
+    ),
+    "TEST_SCHEMA": (
+        "testdb.example.com:1521/TESTDB",
+        "test_user",
+        "test_password"
+    ),
+    "PROD_SCHEMA": (
+        "proddb.example.com:1521/PRODDB",
+        "prod_user",
+        "prod_password"
+    ),
+}
+
+
 def get_connection_details(schema_name: str) -> Tuple[str, str, str]:
     """
     Retrieve database connection details for the specified schema.
@@ -111,72 +219,55 @@ def get_connection_details(schema_name: str) -> Tuple[str, str, str]:
         >>> print(dsn)
         'localhost:1521/ORCL'
 
+    Note:
+        Details are retrieved once per schema and cached for the life of
+        the process, which matters once the stub is replaced by a call to
+        a secrets service.
+
     Warning:
         This stub contains hardcoded credentials for demonstration
         purposes only. Never hardcode credentials in production code!
     """
-    logger.debug(f"Retrieving connection details for schema: {schema_name}")
-
-    # ==========================================================================
-    # STUB IMPLEMENTATION - REPLACE WITH ACTUAL CREDENTIAL RETRIEVAL
-    # ==========================================================================
-    # In production, retrieve credentials securely:
-    #
-    # Option 1: Environment Variables
-    #     dsn = os.environ.get('ORACLE_DSN')
-    #     user = os.environ.get('ORACLE_USER')
-    #     password = os.environ.get('ORACLE_PASSWORD')
-    #
-    # Option 2: AWS Secrets Manager
-    #     import boto3
-    #     client = boto3.client('secretsmanager')
-    #     secret = client.get_secret_value(SecretId='oracle-credentials')
-    #
-    # Option 3: Configuration file (with encryption)
-    #     from configparser import ConfigParser
-    #     config = ConfigParser()
-    #     config.read('config.ini')
-    # ==========================================================================
-
-    connection_map: Dict[str, Tuple[str, str, str]] = {
-        "MY_SCHEMA": (
-            "localhost:1521/ORCL",  # DSN: host:port/service_name
-            "my_schema_user",  # Username
-            "my_secure_password"  # Password
-        ),
-        "TEST_SCHEMA": (
-            "testdb.example.com:1521/TESTDB",
-            "test_user",
-            "test_password"
-        ),
-        "PROD_SCHEMA": (
-            "proddb.example.com:1521/PRODDB",
-            "prod_user",
-            "prod_password"
-        ),
-    }
-
-    # Normalize schema name to uppercase for case-insensitive lookup
+    # Normalize schema name to uppercase for case-insensitive lookup, so
+    # every spelling of a schema shares one cache entry
     normalized_schema = schema_name.upper()
 
-    if normalized_schema not in connection_map:
-        available_schemas = list(connection_map.keys())
+    if normalized_schema not in CONNECTION_MAP:
+        available_schemas = list(CONNECTION_MAP.keys())
         raise ValueError(
             f"Unknown schema: '{schema_name}'. "
             f"Available schemas: {available_schemas}"
         )
 
-    logger.debug(f"Successfully retrieved connection details for {schema_name}")
-    return connection_map[normalized_schema]
+    return _lookup_connection_details(normalized_schema)
+
+
+@functools.lru_cache(maxsize=None)
+def _lookup_connection_details(normalized_schema: str) -> Tuple[str, str, str]:
+    """
+    Look up and cache connection details for an upper-case schema name.
+
+    Only runs on a cache miss, so the retrieval is logged once per schema.
+
+    Args:
+        normalized_schema: Upper-case schema name present in CONNECTION_MAP.
+
+    Returns:
+        A (dsn, user, password) tuple.
+    """
+    logger.debug("Retrieving connection details for schema: %s", normalized_schema)
+    details = CONNECTION_MAP[normalized_schema]
+    logger.debug("Successfully retrieved connection details for %s", normalized_schema)
+    return details
 
 
 def create_oracle_connection(dsn: str, user: str, password: str) -> Any:
     """
     Create and return an Oracle database connection.
 
-    This function attempts to create a database connection using the
-    newer 'oracledb' driver first, falling back to 'cx_Oracle' if
-    oracledb is not available.
+    This function creates a database connection using the driver
+    resolved at import time: the newer 'oracledb' driver, or 'cx_Oracle'
+    if oracledb is not available.
 
     Args:
         dsn: Data Source Name in the format "host:port/service_name".
@@ -205,59 +296,137 @@ def create_oracle_connection(dsn: str, user: str, password: str) -> Any:
         The connection should be closed when no longer needed to
         release database resources.
     """
-    connection = None
+    if oracle_driver is None:
+        logger.error(MISSING_DRIVER_MESSAGE)
+        raise ImportError(MISSING_DRIVER_MESSAGE)
+
+    driver_name = oracle_driver.__name__
+    logger.debug("Attempting connection using %s driver", driver_name)
+
+    # oracledb can run in thin mode (no Oracle Client needed)
+    # or thick mode (requires Oracle Client libraries)
+    connection = oracle_driver.connect(
+        user=user,
+        password=password,
+        dsn=dsn
+    )
+    logger.debug("Successfully connected using %s driver", driver_name)
+    return connection
 
-    # Try the newer oracledb driver first (recommended by Oracle)
-    try:
-        import oracledb
-        logger.debug("Attempting connection using oracledb driver")
-
-        # oracledb can run in thin mode (no Oracle Client needed)
-        # or thick mode (requires Oracle Client libraries)
-        connection = oracledb.connect(
-            user=user,
-            password=password,
-            dsn=dsn
-        )
-        logger.debug("Successfully connected using oracledb driver")
-        return connection
 
-    except ImportError:
-        logger.debug("oracledb not available, trying cx_Oracle")
+def create_oracle_pool(
+        dsn: str,
+        user: str,
+        password: str,
+        size: int = 1,
+        max_size: Optional[int] = None
+) -> Any:
+    """
+    Create and return an Oracle connection pool.
 
-    # Fall back to cx_Oracle if oracledb is not installed
-    try:
-        import cx_Oracle
-        logger.debug("Attempting connection using cx_Oracle driver")
+    Like create_oracle_connection(), this uses the 'oracledb' driver, or
+    'cx_Oracle' if oracledb is not available. The pool opens its sessions once
+    and hands them out with acquire(); release() returns a session for
+    reuse instead of closing it, and a session that has gone stale is
+    replaced by the pool instead of failing every later query.
 
-        connection = cx_Oracle.connect(
-            user=user,
-            password=password,
-            dsn=dsn
-        )
-        logger.debug("Successfully connected using cx_Oracle driver")
-        return connection
+    Args:
+        dsn: Data Source Name in the format "host:port/service_name".
+        user: Database username for authentication.
+        password: Database password for authentication.
+        size: Number of sessions to open and keep open. Defaults to 1.
+        max_size: Maximum number of sessions; the pool grows one session
+            at a time up to this when all are busy. Defaults to size,
+            which gives a fixed-size pool.
 
-    except ImportError:
-        error_message = (
-            "No Oracle database driver found. "
-            "Please install one of the following:\n"
-            "  pip install oracledb    (recommended)\n"
-            "  pip install cx_Oracle"
-        )
-        logger.error(error_message)
-        raise ImportError(error_message)
+    Returns:
+        A connection pool object with acquire(), release() and close().
+
+    Raises:
+        ImportError: If neither oracledb nor cx_Oracle package is installed.
+        Exception: If the pool cannot be created (e.g., invalid
+            credentials, network issues, database unavailable).
+
+    Example:
+        >>> pool = create_oracle_pool("localhost:1521/ORCL", "myuser", "mypassword")
+        >>> connection = pool.acquire()
+        >>> try:
+        ...     cursor = connection.cursor()
+        ... finally:
+        ...     pool.release(connection)
+
+    Note:
+        A pool cannot be shared across processes, so each worker process
+        creates its own; threads in one process can share a single pool.
+        Close it with close(force=True) when done.
+    """
+    if oracle_driver is None:
+        logger.error(MISSING_DRIVER_MESSAGE)
+        raise ImportError(MISSING_DRIVER_MESSAGE)
+
+    driver_name = oracle_driver.__name__
+    logger.debug("Creating connection pool using %s driver", driver_name)
+
+    # oracledb names the factory create_pool(); cx_Oracle calls it SessionPool
+    if hasattr(oracle_driver, 'create_pool'):
+        create_pool = oracle_driver.create_pool
+    else:
+        create_pool = oracle_driver.SessionPool
+
+    if max_size is None:
+        max_size = size
+
+    pool = create_pool(
+        user=user,
+        password=password,
+        dsn=dsn,
+        min=size,
+        max=max_size,
+        increment=1 if max_size > size else 0
+    )
+    logger.debug(
+        "Created %s connection pool with %s to %s session(s)",
+        driver_name, size, max_size
+    )
+    return pool
 
 
 # =============================================================================
 # DATABASE QUERY FUNCTIONS
 # =============================================================================
 
+def validate_identifier(name: str) -> str:
+    """
+    Check that a schema or table name is a plain Oracle identifier.
+
+    Identifiers cannot be passed as bind variables, so they are placed
+    directly in the SQL text. Only names matching ORACLE_IDENTIFIER are
+    allowed there, which rules out quotes, spaces and SQL fragments.
+
+    Args:
+        name: The schema or table name to check.
+
+    Returns:
+        The name, unchanged.
+
+    Raises:
+        ValueError: If the name is not a valid unquoted identifier.
+
+    Example:
+        >>> validate_identifier("ORDER_ITEMS")
+        'ORDER_ITEMS'
+    """
+    if not ORACLE_IDENTIFIER.fullmatch(name):
+        raise ValueError(f"Invalid Oracle identifier: {name!r}")
+    return name
+
+
 def query_max_insert_dtm(
         connection: Any,
         schema_name: str,
-        table_name: str
-) -> Dict[str, Any]:
+        table_name: str,
+        since: Optional[datetime] = None
+) -> TableResult:
     """
     Query a table for its maximum insert_dtm column value.
 
@@ -269,79 +438,81 @@ def query_max_insert_dtm(
         connection: An active Oracle database connection object.
         schema_name: The name of the schema containing the table.
         table_name: The name of the table to query.
+        since: The maximum insert_dtm found by an earlier run, if any.
+            Only newer rows are then scanned, which an index on insert_dtm
+            turns into a short range scan, and this value is reported
+            when there are none.
 
     Returns:
-        A dictionary containing the query results with the following keys:
-            - 'table_name' (str): The name of the table queried
-            - 'schema_name' (str): The schema containing the table
-            - 'max_insert_dtm' (datetime|None): Maximum insert_dtm value,
-                or None if the table is empty or column doesn't exist
-            - 'status' (str): 'success' or 'error'
-            - 'error' (str|None): Error message if status is 'error'
-            - 'query_time' (str): ISO format timestamp of query execution
-            - 'row_count' (int): Number of rows returned (0 or 1)
+        A TableResult with status 'success' or 'error'.
 
     Example:
         >>> result = query_max_insert_dtm(conn, "MY_SCHEMA", "CUSTOMERS")
-        >>> if result['status'] == 'success':
-        ...     print(f"Max insert_dtm: {result['max_insert_dtm']}")
+        >>> if result.status == 'success':
+        ...     print(f"Max insert_dtm: {result.max_insert_dtm}")
         ... else:
-        ...     print(f"Error: {result['error']}")
+        ...     print(f"Error: {result.error}")
 
     Note:
         Table and schema names are incorporated directly into the SQL
         query because Oracle does not support bind variables for
-        identifiers. Ensure these values are validated to prevent
-        SQL injection in production environments.
+        identifiers. They are checked with validate_identifier() first,
+        and an invalid name is reported as an error result.
     """
     process_name = multiprocessing.current_process().name
     query_time = datetime.now().isoformat()
 
     # Build the result template
-    result: Dict[str, Any] = {
-        'table_name': table_name,
-        'schema_name': schema_name,
-        'max_insert_dtm': None,
-        'status': 'pending',
-        'error': None,
-        'query_time': query_time,
-        'row_count': 0
-    }
+    result = TableResult(table_name, schema_name, query_time=query_time)
 
-    # Construct the SQL query
-    # Note: In production, validate schema_name and table_name to prevent
-    # SQL injection. Oracle identifiers should match pattern [A-Z][A-Z0-9_$#]*
+    # Construct the SQL query; the names are validated before it is executed
     sql_query = f"""
         SELECT MAX(insert_dtm) AS max_insert_dtm
         FROM {schema_name}.{table_name}
     """
+    binds: Dict[str, Any] = {}
+    if since is not None:
+        sql_query += "WHERE insert_dtm > :since"
+        binds['since'] = since
 
-    logger.debug(f"Executing query: SELECT MAX(insert_dtm) FROM {schema_name}.{table_name}")
+    logger.debug("Executing query: SELECT MAX(insert_dtm) FROM %s.%s", schema_name, table_name)
 
     cursor = None
     try:
-        # Create cursor and execute the query
+        validate_identifier(schema_name)
+        validate_identifier(table_name)
+
+        # Create cursor and execute the query. It returns exactly one row,
+        # so size the fetch for that; prefetching one row more lets the
+        # driver see the end of the result in the same round-trip.
         cursor = connection.cursor()
-        cursor.execute(sql_query)
+        cursor.arraysize = 1
+        cursor.prefetchrows = 2
+        cursor.execute(sql_query, binds)
 
         # Fetch the result (should be exactly one row)
         row = cursor.fetchone()
 
         if row is not None:
-            result['max_insert_dtm'] = row[0]
-            result['row_count'] = 1
+            result.max_insert_dtm = row[0]
+            result.row_count = 1
+
+        # No rows newer than the previous maximum: it is still the maximum
+        if result.max_insert_dtm is None:
+            result.max_insert_dtm = since
 
-        result['status'] = 'success'
+        result.status = 'success'
         logger.debug(
-            f"Query successful for {table_name}: max_insert_dtm = {result['max_insert_dtm']}"
+            "Query successful for %s: max_insert_dtm = %s",
+            table_name, result.max_insert_dtm
         )
 
     except Exception as e:
         # Capture any database errors
         error_message = str(e)
-        result['status'] = 'error'
-        result['error'] = error_message
-        logger.error(f"Query failed for {schema_name}.{table_name}: {error_message}")
+        result.status = 'error'
+        result.error = error_message
+        logger.error("Query failed for %s.%s: %s", schema_name, table_name, error_message)
 
     finally:
         # Always close the cursor to release resources
@@ -349,177 +520,417 @@ def query_max_insert_dtm(
             try:
                 cursor.close()
             except Exception as close_error:
-                logger.warning(f"Error closing cursor: {close_error}")
+                logger.warning("Error closing cursor: %s", close_error)
 
     return result
 
 
+def query_max_insert_dtm_batch(
+        connection: Any,
+        schema_name: str,
+        table_names: List[str],
+        since: Optional[Dict[str, datetime]] = None
+) -> List[TableResult]:
+    """
+    Query several tables for their maximum insert_dtm in one round-trip.
+
+    Builds a single UNION ALL statement with one
+    ``SELECT MAX(insert_dtm)`` branch per table, so N tables cost one
+    network round-trip instead of N. Each branch is labelled with the
+    table name through a bind variable.
+
+    If the combined statement fails (for example because one of the
+    tables does not exist), every table is queried on its own with
+    query_max_insert_dtm() so that only the failing tables report errors.
+
+    Args:
+        connection: An active Oracle database connection object.
+        schema_name: The name of the schema containing the tables.
+        table_names: The names of the tables to query.
+        since: Maximum insert_dtm per table from an earlier run, used as
+            in query_max_insert_dtm(). Tables without an entry are
+            scanned in full.
+
+    Returns:
+        One TableResult per table, in the order of table_names.
+
+    Example:
+        >>> results = query_max_insert_dtm_batch(
+        ...     conn, "MY_SCHEMA", ["CUSTOMERS", "ORDERS"]
+        ... )
+        >>> for result in results:
+        ...     print(result.table_name, result.max_insert_dtm)
+
+    Note:
+        As in query_max_insert_dtm(), table and schema names are placed
+        directly in the SQL text. If any name fails validate_identifier(),
+        the tables are queried one by one so only the invalid ones fail.
+    """
+    since = since or {}
+
+    names_valid = all(
+        ORACLE_IDENTIFIER.fullmatch(name) for name in (schema_name, *table_names)
+    )
+    if len(table_names) == 1 or not names_valid:
+        return [
+            query_max_insert_dtm(
+                connection, schema_name, table_name, since.get(table_name)
+            )
+            for table_name in table_names
+        ]
+
+    query_time = datetime.now().isoformat()
+
+    # One branch per table; the label and any previous maximum are bound
+    # rather than placed inline
+    branches = []
+    binds: Dict[str, Any] = {}
+    for i, table_name in enumerate(table_names):
+        branch = (
+            f"SELECT :t{i} AS table_name, MAX(insert_dtm) AS max_insert_dtm "
+            f"FROM {schema_name}.{table_name}"
+        )
+        binds[f"t{i}"] = table_name
+        if table_name in since:
+            branch += f" WHERE insert_dtm > :s{i}"
+            binds[f"s{i}"] = since[table_name]
+        branches.append(branch)
+    sql_query = "\nUNION ALL\n".join(branches)
+
+    logger.debug(
+        "Executing UNION ALL query for %s tables in %s",
+        len(table_names), schema_name
+    )
+
+    cursor = None
+    try:
+        # One row per table, fetched in a single round-trip
+        cursor = connection.cursor()
+        cursor.arraysize = len(table_names)
+        cursor.prefetchrows = len(table_names) + 1
+        cursor.execute(sql_query, binds)
+        max_values = dict(cursor.fetchall())
+
+    except Exception as e:
+        # Fall back to one query per table to isolate the failing ones
+        logger.warning(
+            "Batch query failed for %s tables, retrying individually: %s",
+            len(table_names), e
+        )
+        return [
+            query_max_insert_dtm(
+                connection, schema_name, table_name, since.get(table_name)
+            )
+            for table_name in table_names
+        ]
+
+    finally:
+        # Always close the cursor to release resources
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception as close_error:
+                logger.warning("Error closing cursor: %s", close_error)
+
+    return [
+        TableResult(
+            table_name,
+            schema_name,
+            status='success',
+            max_insert_dtm=max_values.get(table_name) or since.get(table_name),
+            query_time=query_time,
+            row_count=1 if table_name in max_values else 0
+        )
+        for table_name in table_names
+    ]
+
+
+def find_empty_tables(
+        connection: Any,
+        schema_name: str,
+        table_names: List[str]
+) -> Set[str]:
+    """
+    Find tables that the optimizer statistics show to be empty.
+
+    One dictionary query checks every table, so the empty ones can be
+    reported without running a MAX(insert_dtm) query against each. A
+    table only counts as empty if its statistics recorded zero rows and
+    ALL_TAB_MODIFICATIONS has no inserts recorded since they were
+    gathered.
+
+    Args:
+        connection: An active Oracle database connection object.
+        schema_name: The name of the schema containing the tables.
+        table_names: The names of the tables to check.
+
+    Returns:
+        The names from table_names whose tables appear to be empty.
+
+    Example:
+        >>> find_empty_tables(conn, "MY_SCHEMA", ["CUSTOMERS", "AUDIT_LOG"])
+        {'AUDIT_LOG'}
+
+    Note:
+        Statistics and table monitoring data lag behind recent changes
+        (monitoring data is flushed to the dictionary periodically), so
+        a table that was empty when last analyzed and received rows
+        very recently can still be reported as empty.
+    """
+    # Dictionary views store unquoted identifiers in upper case
+    names_by_key = {table_name.upper(): table_name for table_name in table_names}
+    binds: Dict[str, Any] = {'owner': schema_name.upper()}
+    placeholders = []
+    for i, key in enumerate(names_by_key):
+        binds[f"t{i}"] = key
+        placeholders.append(f":t{i}")
+
+    sql_query = f"""
+        SELECT t.table_name
+        FROM all_tables t
+        WHERE t.owner = :owner
+          AND t.table_name IN ({', '.join(placeholders)})
+          AND t.num_rows = 0
+          AND NOT EXISTS (
+              SELECT 1 FROM all_tab_modifications m
+              WHERE m.table_owner = t.owner
+                AND m.table_name = t.table_name
+                AND m.inserts > 0
+          )
+    """
+
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql_query, binds)
+        return {names_by_key[row[0]] for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+
+def error_results(
+        schema_name: str,
+        table_names: Sequence[str],
+        error: Exception
+) -> List[TableResult]:
+    """
+    Build error results for tables that could not be queried.
+
+    Args:
+        schema_name: The name of the schema containing the tables.
+        table_names: The names of the tables that failed.
+        error: The exception that prevented the query.
+
+    Returns:
+        One TableResult per table, in the order of table_names.
+    """
+    query_time = datetime.now().isoformat()
+    return [
+        TableResult(
+            table_name,
+            schema_name,
+            status='error',
+            error=str(error),
+            query_time=query_time
+        )
+        for table_name in table_names
+    ]
+
+
+def make_batches(
+        table_names: List[str],
+        num_workers: int
+) -> List[Tuple[str, ...]]:
+    """
+    Split table names into batches for the workers.
+
+    Each batch is queried in one database round-trip, so batches are as
+    large as possible (up to QUERY_BATCH_SIZE) while still giving every
+    worker a share of the work.
+
+    Args:
+        table_names: The names of the tables to query.
+        num_workers: The number of workers that will run the batches.
+
+    Returns:
+        A list of tuples of table names, in the order of table_names.
+    """
+    batch_size = min(QUERY_BATCH_SIZE, -(-len(table_names) // num_workers))
+    return [
+        tuple(table_names[start:start + batch_size])
+        for start in range(0, len(table_names), batch_size)
+    ]
+
+
 # =============================================================================
-# WORKER PROCESS FUNCTION
+# WORKER PROCESS FUNCTIONS
 # =============================================================================
 
-def worker_process(
-        task_queue: multiprocessing.Queue,
-        results_dict: DictProxy,
+# Per-process state, set up once by init_worker() in each pool process.
+# Module globals are the standard way to hand state from a Pool initializer
+# to the task function, since only the task arguments are sent per call.
+_worker_pool: Any = None
+_worker_schema: Optional[str] = None
+_worker_since: Dict[str, datetime] = {}
+_worker_stats: Dict[str, int] = {'processed': 0, 'succeeded': 0, 'failed': 0}
+
+
+def init_worker(
         schema_name: str,
         dsn: str,
         user: str,
-        password: str
+        password: str,
+        since: Optional[Dict[str, datetime]] = None
 ) -> None:
     """
-    Worker process that queries tables for maximum insert_dtm values.
+    Initialize a pool worker process with its own database session pool.
 
-    This function runs in a separate process and performs the following:
-        1. Establishes its own database connection
-        2. Continuously retrieves table names from the shared task queue
-        3. Queries each table for its maximum insert_dtm value
-        4. Stores results in the shared results dictionary
-        5. Shuts down gracefully when receiving a None sentinel value
+    Used as the ``initializer`` of the multiprocessing.Pool, so it runs
+    exactly once in each worker process before any tasks. The session
+    pool is kept in a module-level global; every table acquires a
+    session from it and releases it afterwards, so sessions are opened
+    once per worker rather than once per table. The pool is closed by a
+    finalizer when the worker exits.
 
-    Each worker maintains its own database connection to avoid
-    connection sharing issues across process boundaries.
+    Each worker maintains its own session pool because database
+    connections (and pools) cannot be shared across process boundaries.
 
     Args:
-        task_queue: A multiprocessing Queue containing table names to
-            process. Workers expect None as a sentinel value to signal
-            shutdown.
-        results_dict: A Manager-created shared dictionary for storing
-            query results. Keys are table names, values are result dicts.
         schema_name: The Oracle schema containing the tables to query.
         dsn: Data Source Name for establishing database connection.
         user: Database username for authentication.
         password: Database password for authentication.
+        since: Maximum insert_dtm per table from an earlier run, passed
+            on to query_max_insert_dtm_batch().
 
     Note:
-        This function is designed to be used as the target for a
-        multiprocessing.Process. It handles its own exceptions and
-        ensures proper cleanup of database resources.
+        A failed pool creation is logged rather than raised. An exception in
+        a Pool initializer makes the pool restart the worker forever, so
+        instead every task in this worker reports the error as its result.
 
     Example:
-        >>> # This function is typically not called directly
-        >>> # It's used as a Process target:
-        >>> worker = Process(
-        ...     target=worker_process,
-        ...     args=(queue, results, schema, dsn, user, password)
+        >>> pool = multiprocessing.Pool(
+        ...     processes=4,
+        ...     initializer=init_worker,
+        ...     initargs=(schema, dsn, user, password)
         ... )
-        >>> worker.start()
     """
-    process_name = multiprocessing.current_process().name
-    logger.info(f"Worker process starting up")
+    global _worker_pool, _worker_schema, _worker_since
 
-    connection = None
-    tables_processed = 0
-    tables_succeeded = 0
-    tables_failed = 0
+    logger.info("Worker process starting up")
+    _worker_schema = schema_name
+    _worker_since = since or {}
 
     try:
         # =====================================================================
         # ESTABLISH DATABASE CONNECTION
         # =====================================================================
-        # Each worker creates its own connection because database connections
-        # cannot be safely shared across process boundaries
-        logger.debug(f"Establishing database connection to {dsn}")
-        connection = create_oracle_connection(dsn, user, password)
-        logger.info(f"Database connection established successfully")
+        # Each worker creates its own pool because database connections
+        # cannot be safely shared across process boundaries. One session
+        # is enough since a worker runs one query at a time.
+        logger.debug("Creating database session pool for %s", dsn)
+        _worker_pool = create_oracle_pool(dsn, user, password, size=1)
+        logger.info("Database session pool created successfully")
 
-        # =====================================================================
-        # MAIN PROCESSING LOOP
-        # =====================================================================
-        # Process tables until we receive the shutdown sentinel (None)
-        while True:
-            table_name: Optional[str] = None
+    except Exception as worker_error:
+        # Handle critical errors that prevent the worker from functioning
+        logger.error("Critical worker error: %s", worker_error)
 
-            try:
-                # Get the next table from the queue with a timeout
-                # The timeout allows us to periodically check for issues
-                # and prevents indefinite blocking
-                table_name = task_queue.get(timeout=5.0)
-
-            except Empty:
-                # Queue is temporarily empty, continue waiting
-                logger.debug(f"Queue empty, waiting for more tasks...")
-                continue
-
-            except Exception as queue_error:
-                logger.error(f"Error getting task from queue: {queue_error}")
-                continue
-
-            # Check for the shutdown sentinel value
-            if table_name is None:
-                logger.debug(f"Received shutdown sentinel, exiting loop")
-                break
+    # Close the pool and log statistics when the worker exits. This
+    # runs when the pool is closed and joined (not when it is terminated).
+    multiprocessing.util.Finalize(None, shutdown_worker, exitpriority=10)
 
-            # Process the table
-            logger.info(f"Processing table: {table_name}")
 
-            try:
-                # Execute the query for this table
-                result = query_max_insert_dtm(
-                    connection=connection,
-                    schema_name=schema_name,
-                    table_name=table_name
-                )
+def shutdown_worker() -> None:
+    """
+    Close the worker's database session pool and log its statistics.
 
-                # Store the result in the shared dictionary
-                results_dict[table_name] = result
-                tables_processed += 1
-
-                # Track success/failure counts
-                if result['status'] == 'success':
-                    tables_succeeded += 1
-                    logger.info(
-                        f"Completed {table_name}: "
-                        f"max_insert_dtm = {result['max_insert_dtm']}"
-                    )
-                else:
-                    tables_failed += 1
-                    logger.warning(
-                        f"Failed {table_name}: {result.get('error', 'Unknown error')}"
-                    )
-
-                # Log detailed result at DEBUG level
-                logger.debug(f"Full result for {table_name}: {result}")
-
-            except Exception as processing_error:
-                # Handle unexpected errors during table processing
-                tables_processed += 1
-                tables_failed += 1
-
-                error_result = {
-                    'table_name': table_name,
-                    'schema_name': schema_name,
-                    'max_insert_dtm': None,
-                    'status': 'error',
-                    'error': str(processing_error),
-                    'query_time': datetime.now().isoformat(),
-                    'row_count': 0
-                }
-                results_dict[table_name] = error_result
-                logger.error(f"Unexpected error processing {table_name}: {processing_error}")
+    Registered as a multiprocessing finalizer by init_worker(), so it runs
+    once as each pool worker process exits.
+    """
+    global _worker_pool
 
-    except Exception as worker_error:
-        # Handle critical errors that prevent the worker from functioning
-        logger.error(f"Critical worker error: {worker_error}")
+    # =========================================================================
+    # CLEANUP
+    # =========================================================================
+    # Ensure the session pool is properly closed
+    if _worker_pool is not None:
+        try:
+            _worker_pool.close(force=True)
+            logger.debug("Database session pool closed successfully")
+        except Exception as close_error:
+            logger.warning("Error closing database session pool: %s", close_error)
+        _worker_pool = None
+
+    # Log worker statistics
+    logger.info(
+        "Worker shutting down - Processed: %s, Succeeded: %s, Failed: %s",
+        _worker_stats['processed'], _worker_stats['succeeded'], _worker_stats['failed']
+    )
 
-    finally:
-        # =====================================================================
-        # CLEANUP
-        # =====================================================================
-        # Ensure database connection is properly closed
-        if connection is not None:
-            try:
-                connection.close()
-                logger.debug(f"Database connection closed successfully")
-            except Exception as close_error:
-                logger.warning(f"Error closing database connection: {close_error}")
 
-        # Log worker statistics
-        logger.info(
-            f"Worker shutting down - "
-            f"Processed: {tables_processed}, "
-            f"Succeeded: {tables_succeeded}, "
-            f"Failed: {tables_failed}"
-        )
+def query_tables(table_names: Tuple[str, ...]) -> List[TableResult]:
+    """
+    Query a batch of tables using a session from the worker's pool.
+
+    This is the task function mapped over the table batches by the pool.
+    The whole batch is queried with one UNION ALL statement, and the list
+    of results is sent back to the parent process, which collects them
+    into a regular dict.
+
+    Args:
+        table_names: The names of the tables to query.
+
+    Returns:
+        One TableResult per table from query_max_insert_dtm_batch(),
+        or error results if the worker has no session pool or the query
+        raised.
+    """
+    logger.info("Processing %s table(s): %s", len(table_names), ', '.join(table_names))
+
+    try:
+        if _worker_pool is None:
+            raise RuntimeError("Worker has no database session pool")
+
+        # Borrow a session for this batch and always hand it back
+        connection = _worker_pool.acquire()
+        try:
+            # Execute the query for this batch of tables
+            results = query_max_insert_dtm_batch(
+                connection=connection,
+                schema_name=_worker_schema,
+                table_names=list(table_names),
+                since=_worker_since
+            )
+        finally:
+            _worker_pool.release(connection)
+
+    except Exception as processing_error:
+        # Handle unexpected errors during batch processing
+        results = error_results(_worker_schema, table_names, processing_error)
+        logger.error("Unexpected error processing batch: %s", processing_error)
+
+    for result in results:
+        table_name = result.table_name
+
+        # Track success/failure counts
+        _worker_stats['processed'] += 1
+        if result.status == 'success':
+            _worker_stats['succeeded'] += 1
+            logger.info(
+                "Completed %s: max_insert_dtm = %s",
+                table_name, result.max_insert_dtm
+            )
+        else:
+            _worker_stats['failed'] += 1
+            logger.warning(
+                "Failed %s: %s",
+                table_name, result.error or 'Unknown error'
+            )
+
+        # Log detailed result at DEBUG level
+        logger.debug("Full result for %s: %s", table_name, result)
+
+    return results
 
 
 # =============================================================================
@@ -529,22 +940,28 @@ def worker_process(
 def process_tables(
         schema_name: str,
         table_names: List[str],
-        num_workers: int = 12
-) -> Dict[str, Dict[str, Any]]:
+        num_workers: int = 12,
+        since: Optional[Dict[str, datetime]] = None
+) -> Dict[str, TableResult]:
     """
     Process multiple tables concurrently to find maximum insert_dtm values.
 
     This function orchestrates the parallel processing of multiple Oracle
-    database tables using a pool of worker processes. It implements the
-    producer-consumer pattern with a shared queue for work distribution
-    and a shared dictionary for result collection.
+    database tables using a pool of worker processes. Table names are
+    mapped over the pool and each worker returns its results directly,
+    so no shared state or Manager server process is needed.
 
     Architecture:
-        1. A Manager creates process-safe shared data structures
-        2. The main process (producer) populates the task queue
-        3. Worker processes (consumers) query tables and store results
-        4. Sentinel values (None) signal workers to shut down
-        5. Results are collected and returned after all workers complete
+        1. A multiprocessing.Pool starts the workers; its initializer opens
+           one database session pool per worker
+        2. imap_unordered() sends batches of table names to the workers,
+           and each batch is queried with a single UNION ALL statement
+        3. Each batch of results is returned to the main process as soon
+           as it is ready and stored in a regular dict
+        4. Closing and joining the pool shuts the workers down, and a
+           finalizer in each worker closes its session pool. If no batch
+           completes within BATCH_TIMEOUT seconds the pool is terminated
+           and the unfinished tables are left out of the results.
 
     Args:
         schema_name: The Oracle schema containing the tables to query.
@@ -557,14 +974,12 @@ def process_tables(
             - Number of CPU cores available
             - Database connection pool limits
             - Expected query execution time
+        since: Maximum insert_dtm per table from an earlier run, e.g. from
+            load_checkpoint(). Only rows newer than it are scanned.
 
     Returns:
-        A dictionary mapping table names to their query results.
-        Each value is a dictionary containing:
-            - 'max_insert_dtm': The maximum datetime value or None
-            - 'status': 'success' or 'error'
-            - 'error': Error message if applicable
-            - Other metadata fields
+        A dictionary mapping table names to their TableResult, with
+        status 'success' or 'error'.
 
     Raises:
         ValueError: If table_names is empty or schema_name is empty/None.
@@ -577,12 +992,12 @@ def process_tables(
         ...     num_workers=4
         ... )
         >>> for table, result in results.items():
-        ...     if result['status'] == 'success':
-        ...         print(f"{table}: {result['max_insert_dtm']}")
+        ...     if result.status == 'success':
+        ...         print(f"{table}: {result.max_insert_dtm}")
 
     Note:
-        The number of workers should not exceed the number of tables,
-        as excess workers will immediately receive shutdown signals.
+        The number of workers is capped at the number of tables, since
+        excess workers would only open connections that are never used.
     """
     # =========================================================================
     # INPUT VALIDATION
@@ -597,128 +1012,384 @@ def process_tables(
     effective_workers = min(num_workers, len(table_names))
     if effective_workers < num_workers:
         logger.info(
-            f"Reducing worker count from {num_workers} to {effective_workers} "
-            f"(only {len(table_names)} tables to process)"
+            "Reducing worker count from %s to %s (only %s tables to process)",
+            num_workers, effective_workers, len(table_names)
         )
 
-    logger.info(f"Starting parallel table processing")
-    logger.info(f"  Schema: {schema_name}")
-    logger.info(f"  Tables to process: {len(table_names)}")
-    logger.info(f"  Worker processes: {effective_workers}")
-    logger.debug(f"  Table list: {table_names}")
+    logger.info("Starting parallel table processing")
+    logger.info("  Schema: %s", schema_name)
+    logger.info("  Tables to process: %s", len(table_names))
+    logger.info("  Worker processes: %s", effective_workers)
+    logger.debug("  Table list: %s", table_names)
 
     # =========================================================================
     # GET DATABASE CONNECTION DETAILS
     # =========================================================================
     dsn, user, password = get_connection_details(schema_name)
-    logger.debug(f"Retrieved connection details for schema '{schema_name}'")
+    logger.debug("Retrieved connection details for schema '%s'", schema_name)
+
+    batches = make_batches(table_names, effective_workers)
 
     # =========================================================================
-    # CREATE MANAGER AND SHARED DATA STRUCTURES
+    # CREATE THE POOL AND COLLECT RESULTS
     # =========================================================================
-    # The Manager provides a way to create data that can be shared between
-    # processes. It runs a server process that holds the actual data, and
-    # provides proxy objects for other processes to access it.
+    final_results: Dict[str, TableResult] = {}
 
-    with Manager() as manager:
-        # Create a process-safe Queue for distributing work
-        # Workers will pull table names from this queue
-        task_queue: multiprocessing.Queue = manager.Queue()
+    logger.info(
+        "Spawning %s worker processes (%s batches of up to %s tables)",
+        effective_workers, len(batches), len(batches[0])
+    )
+    with Pool(
+            processes=effective_workers,
+            initializer=init_worker,
+            initargs=(schema_name, dsn, user, password, since)
+    ) as pool:
+        # Results arrive in completion order; each batch is a single
+        # pickled list sent back over the pool's result pipe. Exactly one
+        # result list comes back per batch, so the parent makes a bounded
+        # number of blocking reads and can report progress as they arrive.
+        batch_iter = pool.imap_unordered(query_tables, batches)
+        timed_out = False
+        for _ in range(len(batches)):
+            try:
+                batch_results = batch_iter.next(timeout=BATCH_TIMEOUT)
+            except multiprocessing.TimeoutError:
+                logger.error(
+                    "No results for %s seconds; abandoning %s unfinished table(s)",
+                    BATCH_TIMEOUT, len(table_names) - len(final_results)
+                )
+                timed_out = True
+                break
 
-        # Create a process-safe dictionary for collecting results
-        # Workers will store their query results here
-        results_dict: DictProxy = manager.dict()
+            for result in batch_results:
+                final_results[result.table_name] = result
+            logger.info("Collected %s of %s results", len(final_results), len(table_names))
 
-        # =====================================================================
-        # POPULATE THE TASK QUEUE
-        # =====================================================================
-        logger.info("Populating task queue with table names")
-        for table_name in table_names:
-            task_queue.put(table_name)
-            logger.debug(f"  Added to queue: {table_name}")
-
-        # Add sentinel values (None) to signal workers to shut down
-        # We need one sentinel per worker to ensure all workers receive
-        # the shutdown signal
-        logger.debug(f"Adding {effective_workers} shutdown sentinels to queue")
-        for _ in range(effective_workers):
-            task_queue.put(None)
+        if timed_out:
+            # A stuck worker would never finish, so joining would hang
+            pool.terminate()
+        else:
+            # Close and join rather than letting the context manager terminate
+            # the workers, so their finalizers close the database connections
+            logger.info("Waiting for all workers to complete...")
+            pool.close()
+            pool.join()
 
-        logger.info(
-            f"Task queue populated: {len(table_names)} tables + "
-            f"{effective_workers} sentinels"
-        )
+    logger.info("All worker processes have completed")
+    logger.debug("Collected %s results", len(final_results))
 
-        # =====================================================================
-        # CREATE AND START WORKER PROCESSES
-        # =====================================================================
-        workers: List[Process] = []
-
-        logger.info(f"Spawning {effective_workers} worker processes")
-        for worker_id in range(effective_workers):
-            # Create a worker process with a descriptive name
-            worker = Process(
-                target=worker_process,
-                name=f"Worker-{worker_id + 1:02d}",  # e.g., "Worker-01"
-                args=(
-                    task_queue,
-                    results_dict,
-                    schema_name,
-                    dsn,
-                    user,
-                    password
-                )
-            )
-            workers.append(worker)
+    return final_results
 
-            # Start the worker process
-            worker.start()
-            logger.debug(
-                f"Started {worker.name} (PID: {worker.pid})"
-            )
 
-        logger.info(f"All {effective_workers} worker processes started")
+def process_tables_threaded(
+        schema_name: str,
+        table_names: List[str],
+        num_workers: int = 12,
+        since: Optional[Dict[str, datetime]] = None
+) -> Dict[str, TableResult]:
+    """
+    Process multiple tables concurrently using threads instead of processes.
 
-        # =====================================================================
-        # WAIT FOR ALL WORKERS TO COMPLETE
-        # =====================================================================
-        logger.info("Waiting for all workers to complete...")
+    The workers spend nearly all of their time waiting on the database, and
+    the Oracle drivers release the GIL while they wait, so threads in this
+    process query tables just as concurrently as worker processes do. They
+    avoid starting and importing into new interpreters, and results are
+    returned without being pickled.
 
-        for worker in workers:
-            # join() blocks until the worker process terminates
-            worker.join()
+    Architecture:
+        1. One session pool is created and shared by all threads
+        2. A ThreadPoolExecutor runs the batches of table names
+        3. Each batch acquires a session, queries its tables with a single
+           UNION ALL statement and releases the session for the next batch
+        4. The session pool is closed once every batch is done
 
-            # Log the worker completion status
-            exit_code = worker.exitcode
-            if exit_code == 0:
-                logger.debug(f"{worker.name} completed successfully (exit code: 0)")
-            else:
-                logger.warning(
-                    f"{worker.name} completed with exit code: {exit_code}"
+    Args:
+        schema_name: The Oracle schema containing the tables to query.
+            Must be a valid schema name recognized by get_connection_details().
+        table_names: A list of table names to query for max insert_dtm.
+        num_workers: Maximum number of threads to use. Defaults to 12.
+        since: Maximum insert_dtm per table from an earlier run, as in
+            process_tables().
+
+    Returns:
+        A dictionary mapping table names to their query results, in the
+        same format as process_tables().
+
+    Raises:
+        ValueError: If table_names is empty or schema_name is empty/None.
+
+    Example:
+        >>> results = process_tables_threaded("MY_SCHEMA", ["CUSTOMERS", "ORDERS"])
+        >>> results["ORDERS"].status
+        'success'
+    """
+    if not table_names:
+        raise ValueError("table_names list cannot be empty")
+
+    if not schema_name or not schema_name.strip():
+        raise ValueError("schema_name is required and cannot be empty")
+
+    effective_workers = min(num_workers, len(table_names))
+    dsn, user, password = get_connection_details(schema_name)
+    batches = make_batches(table_names, effective_workers)
+
+    logger.info(
+        "Querying %s tables in %s with %s threads (%s batches)",
+        len(table_names), schema_name, effective_workers, len(batches)
+    )
+
+    # Unlike worker processes, threads can share one session pool. It
+    # starts small and grows to one session per thread if they are all busy.
+    session_pool = create_oracle_pool(
+        dsn, user, password,
+        size=min(2, effective_workers),
+        max_size=effective_workers
+    )
+
+    def query_batch(batch: Tuple[str, ...]) -> List[TableResult]:
+        try:
+            # Borrow a session for this batch and always hand it back
+            connection = session_pool.acquire()
+            try:
+                return query_max_insert_dtm_batch(
+                    connection, schema_name, list(batch), since
                 )
+            finally:
+                session_pool.release(connection)
 
-        logger.info("All worker processes have completed")
+        except Exception as batch_error:
+            logger.error("Unexpected error processing batch: %s", batch_error)
+            return error_results(schema_name, batch, batch_error)
 
-        # =====================================================================
-        # EXTRACT RESULTS FROM SHARED DICTIONARY
-        # =====================================================================
-        # Convert the Manager's DictProxy to a regular dict before exiting
-        # the Manager context. The proxy won't be accessible after the
-        # Manager shuts down.
-        final_results: Dict[str, Dict[str, Any]] = dict(results_dict)
+    final_results: Dict[str, TableResult] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=effective_workers) as executor:
+            for batch_results in executor.map(query_batch, batches):
+                for result in batch_results:
+                    final_results[result.table_name] = result
+    finally:
+        try:
+            session_pool.close(force=True)
+        except Exception as close_error:
+            logger.warning("Error closing database session pool: %s", close_error)
+
+    logger.info("Collected %s results", len(final_results))
+    return final_results
+
+
+def process_tables_batched(
+        schema_name: str,
+        table_names: List[str],
+        since: Optional[Dict[str, datetime]] = None
+) -> Dict[str, TableResult]:
+    """
+    Query all tables from this process over a single connection.
+
+    No workers are started: the tables are queried with UNION ALL
+    statements of up to QUERY_BATCH_SIZE tables each, so a typical table
+    list costs one database round-trip in total. This is usually the
+    fastest option when each MAX(insert_dtm) is cheap for the database
+    and the cost is dominated by round-trips and connection setup.
+
+    Args:
+        schema_name: The Oracle schema containing the tables to query.
+            Must be a valid schema name recognized by get_connection_details().
+        table_names: A list of table names to query for max insert_dtm.
+        since: Maximum insert_dtm per table from an earlier run, as in
+            process_tables().
+
+    Returns:
+        A dictionary mapping table names to their query results, in the
+        same format as process_tables().
+
+    Raises:
+        ValueError: If table_names is empty or schema_name is empty/None.
+
+    Example:
+        >>> results = process_tables_batched("MY_SCHEMA", ["CUSTOMERS", "ORDERS"])
+        >>> results["ORDERS"].status
+        'success'
+    """
+    if not table_names:
+        raise ValueError("table_names list cannot be empty")
+
+    if not schema_name or not schema_name.strip():
+        raise ValueError("schema_name is required and cannot be empty")
+
+    dsn, user, password = get_connection_details(schema_name)
+    batches = make_batches(table_names, 1)
 
-        logger.debug(f"Extracted {len(final_results)} results from shared dictionary")
+    logger.info(
+        "Querying %s tables in %s with %s UNION ALL statement(s)",
+        len(table_names), schema_name, len(batches)
+    )
 
-    # Manager context has ended - shared resources are cleaned up
+    final_results: Dict[str, TableResult] = {}
+    try:
+        connection = create_oracle_connection(dsn, user, password)
+    except Exception as connection_error:
+        logger.error("Could not connect to %s: %s", dsn, connection_error)
+        for result in error_results(schema_name, table_names, connection_error):
+            final_results[result.table_name] = result
+        return final_results
 
+    try:
+        for batch in batches:
+            batch_results = query_max_insert_dtm_batch(
+                connection, schema_name, list(batch), since
+            )
+            for result in batch_results:
+                final_results[result.table_name] = result
+    finally:
+        try:
+            connection.close()
+        except Exception as close_error:
+            logger.warning("Error closing database connection: %s", close_error)
+
+    logger.info("Collected %s results", len(final_results))
     return final_results
 
 
+def skip_empty_tables(
+        schema_name: str,
+        table_names: List[str],
+        since: Optional[Dict[str, datetime]] = None
+) -> Tuple[Dict[str, TableResult], List[str]]:
+    """
+    Answer the tables that statistics show to be empty without querying them.
+
+    Uses find_empty_tables() over a single connection before any workers
+    are started. If the dictionary query fails (for example for lack of
+    privileges on the views), nothing is skipped.
+
+    Args:
+        schema_name: The Oracle schema containing the tables to query.
+        table_names: A list of table names to query for max insert_dtm.
+        since: Maximum insert_dtm per table from an earlier run; an empty
+            table reports its saved value, as a query finding no newer
+            rows would.
+
+    Returns:
+        A tuple of (results for the empty tables, remaining table names
+        still to be queried, in their original order).
+
+    Example:
+        >>> results, remaining = skip_empty_tables("MY_SCHEMA", tables)
+        >>> if remaining:
+        ...     results.update(process_tables("MY_SCHEMA", remaining))
+    """
+    since = since or {}
+
+    try:
+        dsn, user, password = get_connection_details(schema_name)
+        connection = create_oracle_connection(dsn, user, password)
+        try:
+            empty_tables = find_empty_tables(connection, schema_name, table_names)
+        finally:
+            connection.close()
+    except Exception as stats_error:
+        logger.warning("Could not read table statistics, querying every table: %s", stats_error)
+        return {}, list(table_names)
+
+    query_time = datetime.now().isoformat()
+    results = {
+        table_name: TableResult(
+            table_name,
+            schema_name,
+            status='success',
+            max_insert_dtm=since.get(table_name),
+            query_time=query_time
+        )
+        for table_name in table_names
+        if table_name in empty_tables
+    }
+    logger.info("Skipping %s table(s) that statistics show to be empty", len(results))
+
+    return results, [t for t in table_names if t not in empty_tables]
+
+
+# =============================================================================
+# CHECKPOINT FUNCTIONS
+# =============================================================================
+
+def load_checkpoint(path: str, schema_name: str) -> Dict[str, datetime]:
+    """
+    Load the maximum insert_dtm values saved by an earlier run.
+
+    insert_dtm only grows, so the maximum found by the previous run is a
+    lower bound for this one. Passing it to process_tables() as ``since``
+    restricts each query to newer rows, which an index on insert_dtm
+    turns into a short range scan instead of a full scan.
+
+    Args:
+        path: Path of the SQLite checkpoint file. A missing file is
+            treated as an empty checkpoint.
+        schema_name: The schema whose tables to load.
+
+    Returns:
+        A dictionary mapping table names to their saved maximum insert_dtm.
+
+    Example:
+        >>> since = load_checkpoint("max_insert_dtm.db", "MY_SCHEMA")
+        >>> results = process_tables("MY_SCHEMA", tables, since=since)
+    """
+    if not os.path.exists(path):
+        return {}
+
+    with closing(sqlite3.connect(path)) as db:
+        rows = db.execute(
+            "SELECT table_name, max_insert_dtm FROM max_insert_dtm "
+            "WHERE schema_name = ?",
+            (schema_name,)
+        ).fetchall()
+
+    logger.debug("Loaded %s checkpoint(s) for %s from %s", len(rows), schema_name, path)
+    return {
+        table_name: datetime.fromisoformat(max_dtm)
+        for table_name, max_dtm in rows
+    }
+
+
+def save_checkpoint(
+        path: str,
+        schema_name: str,
+        results: Dict[str, TableResult]
+) -> None:
+    """
+    Save the maximum insert_dtm of every successfully queried table.
+
+    Args:
+        path: Path of the SQLite checkpoint file; created if missing.
+        schema_name: The schema the results belong to.
+        results: Results from process_tables() or one of its variants.
+            Failed queries and tables without a datetime maximum are
+            skipped, keeping any value saved earlier.
+    """
+    rows = [
+        (schema_name, table_name, result.max_insert_dtm.isoformat())
+        for table_name, result in results.items()
+        if result.status == 'success'
+        and isinstance(result.max_insert_dtm, datetime)
+    ]
+
+    with closing(sqlite3.connect(path)) as db, db:
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS max_insert_dtm ("
+            "schema_name TEXT, table_name TEXT, max_insert_dtm TEXT, "
+            "PRIMARY KEY (schema_name, table_name))"
+        )
+        db.executemany(
+            "INSERT OR REPLACE INTO max_insert_dtm VALUES (?, ?, ?)", rows
+        )
+
+    logger.debug("Saved %s checkpoint(s) for %s to %s", len(rows), schema_name, path)
+
+
 # =============================================================================
 # RESULTS LOGGING FUNCTION
 # =============================================================================
 
-def log_results(results: Dict[str, Dict[str, Any]]) -> None:
+def log_results(results: Dict[str, TableResult]) -> None:
     """
     Log the final results from all table queries in a formatted manner.
 
@@ -729,91 +1400,93 @@ def log_results(results: Dict[str, Dict[str, Any]]) -> None:
         - Detailed metadata at DEBUG level
 
     Args:
-        results: Dictionary mapping table names to their query results.
-            Each result should contain 'status', 'max_insert_dtm', and
-            optionally 'error' keys.
+        results: Dictionary mapping table names to their TableResult.
 
     Example:
         >>> results = {
-        ...     'CUSTOMERS': {'status': 'success', 'max_insert_dtm': datetime(2024, 1, 15)},
-        ...     'ORDERS': {'status': 'error', 'error': 'Table not found'}
+        ...     'CUSTOMERS': TableResult('CUSTOMERS', 'MY_SCHEMA', 'success',
+        ...                              max_insert_dtm=datetime(2024, 1, 15)),
+        ...     'ORDERS': TableResult('ORDERS', 'MY_SCHEMA', 'error',
+        ...                           error='Table not found')
         ... }
         >>> log_results(results)
         # Outputs formatted summary to log
 
     Note:
-        This function uses INFO level for summary information and
-        individual results, and DEBUG level for detailed metadata.
+        The summary and individual results are logged as one INFO
+        message, and the detailed metadata as one DEBUG message.
     """
-    # Header
-    logger.info("=" * 70)
-    logger.info("PROCESSING RESULTS SUMMARY")
-    logger.info("=" * 70)
-
-    # Calculate summary statistics
-    total_count = len(results)
-    success_count = sum(
-        1 for result in results.values()
-        if result.get('status') == 'success'
-    )
-    error_count = sum(
-        1 for result in results.values()
-        if result.get('status') == 'error'
-    )
-
-    # Log summary statistics
-    logger.info(f"Total tables processed:  {total_count}")
-    logger.info(f"Successful queries:      {success_count}")
-    logger.info(f"Failed queries:          {error_count}")
-
-    if total_count > 0:
-        success_rate = (success_count / total_count) * 100
-        logger.info(f"Success rate:            {success_rate:.1f}%")
-
-    logger.info("-" * 70)
-
-    # Log individual results, sorted by table name for consistency
-    logger.info("Individual Table Results:")
-    logger.info("-" * 70)
-
-    for table_name in sorted(results.keys()):
+    # Walk the results once, counting outcomes and formatting every line
+    success_count = 0
+    error_count = 0
+    table_lines: List[str] = []
+    error_lines: List[str] = []
+    detail_lines: List[str] = []
+
+    # Individual results are sorted by table name for consistency
+    for table_name in sorted(results):
         result = results[table_name]
-        status = result.get('status', 'unknown')
-        max_dtm = result.get('max_insert_dtm')
+        status = result.status
 
         if status == 'success':
+            success_count += 1
+
             # Format the datetime value for display
+            max_dtm = result.max_insert_dtm
             if max_dtm is not None:
-                if hasattr(max_dtm, 'strftime'):
-                    dtm_str = max_dtm.strftime('%Y-%m-%d %H:%M:%S')
+                if isinstance(max_dtm, datetime):
+                    # Same text as strftime('%Y-%m-%d %H:%M:%S') for the
+                    # naive values Oracle returns, without parsing a format
+                    dtm_str = max_dtm.isoformat(sep=' ', timespec='seconds')
                 else:
                     dtm_str = str(max_dtm)
             else:
                 dtm_str = "NULL (table may be empty)"
 
-            logger.info(f"  {table_name:30} | SUCCESS | {dtm_str}")
+            table_lines.append(f"  {table_name:30} | SUCCESS | {dtm_str}")
         else:
-            error_msg = result.get('error', 'Unknown error')
+            if status == 'error':
+                error_count += 1
+                error_lines.append(f"  - {table_name}: {result.error}")
+
+            error_msg = result.error or 'Unknown error'
             # Truncate long error messages for readability
             if len(error_msg) > 40:
                 error_msg = error_msg[:37] + "..."
-            logger.info(f"  {table_name:30} | ERROR   | {error_msg}")
+            table_lines.append(f"  {table_name:30} | ERROR   | {error_msg}")
 
-        # Log full details at DEBUG level
-        logger.debug(f"  Full result for {table_name}: {result}")
+        detail_lines.append(f"  Full result for {table_name}: {result}")
 
-    logger.info("-" * 70)
+    # Assemble the whole report and log it in one call, so the handler
+    # lock is taken once instead of once per line
+    total_count = len(results)
+    report = [
+        "=" * 70,
+        "PROCESSING RESULTS SUMMARY",
+        "=" * 70,
+        f"Total tables processed:  {total_count}",
+        f"Successful queries:      {success_count}",
+        f"Failed queries:          {error_count}",
+    ]
 
-    # Log any tables that were in the queue but have no results
-    # (this shouldn't happen in normal operation)
-    if error_count > 0:
-        logger.info("Tables with errors:")
-        for table_name in sorted(results.keys()):
-            result = results[table_name]
-            if result.get('status') == 'error':
-                logger.info(f"  - {table_name}: {result.get('error')}")
+    if total_count > 0:
+        success_rate = (success_count / total_count) * 100
+        report.append(f"Success rate:            {success_rate:.1f}%")
 
-    logger.info("=" * 70)
+    report += ["-" * 70, "Individual Table Results:", "-" * 70]
+    report += table_lines
+    report.append("-" * 70)
+
+    if error_lines:
+        report.append("Tables with errors:")
+        report += error_lines
+
+    report.append("=" * 70)
+    logger.info("\n".join(report))
+
+    # Log full details at DEBUG level
+    if detail_lines and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("\n".join(detail_lines))
 
 
 # =============================================================================
@@ -856,6 +1529,16 @@ def main() -> None:
 
     schema_name = "MY_SCHEMA"
     num_workers = 12  # Default number of worker processes
+    # How to run the queries: "processes" (worker processes), "threads"
+    # (a thread pool in this process; the queries are I/O-bound, so both
+    # run them concurrently) or "batched" (one connection, one UNION ALL)
+    mode = "processes"
+    # Maximum insert_dtm values from the previous run, so each query only
+    # scans newer rows; set to None to always scan whole tables
+    checkpoint_path = "max_insert_dtm_checkpoint.db"
+    # Answer tables that optimizer statistics show to be empty without
+    # querying them. Off by default: statistics can lag behind inserts.
+    skip_empty = False
 
     # List of tables to query for maximum insert_dtm
     # In production, this might come from:
@@ -896,9 +1579,9 @@ def main() -> None:
     logger.info("=" * 70)
     logger.info("ORACLE MAX INSERT_DTM QUERY TOOL")
     logger.info("=" * 70)
-    logger.info(f"Schema:           {schema_name}")
-    logger.info(f"Number of tables: {len(table_names)}")
-    logger.info(f"Worker processes: {num_workers}")
+    logger.info("Schema:           %s", schema_name)
+    logger.info("Number of tables: %s", len(table_names))
+    logger.info("Mode:             %s (%s workers)", mode, num_workers)
     logger.info("=" * 70)
 
     # Record start time for performance measurement
@@ -908,29 +1591,45 @@ def main() -> None:
     # MAIN PROCESSING
     # =========================================================================
     try:
-        # Process all tables using parallel workers
-        results = process_tables(
-            schema_name=schema_name,
-            table_names=table_names,
-            num_workers=num_workers
-        )
+        since = load_checkpoint(checkpoint_path, schema_name) if checkpoint_path else None
+
+        results: Dict[str, TableResult] = {}
+        remaining = table_names
+        if skip_empty:
+            results, remaining = skip_empty_tables(schema_name, table_names, since)
+
+        # Process the remaining tables using the selected mode
+        if remaining and mode == "batched":
+            results.update(process_tables_batched(schema_name, remaining, since=since))
+        elif remaining:
+            run = process_tables_threaded if mode == "threads" else process_tables
+            results.update(run(
+                schema_name=schema_name,
+                table_names=remaining,
+                num_workers=num_workers,
+                since=since
+            ))
+
+        if checkpoint_path:
+            save_checkpoint(checkpoint_path, schema_name, results)
 
         # Log all results
         log_results(results)
 
         # Check for any missing results (tables that weren't processed)
-        missing_tables = set(table_names) - set(results.keys())
+        missing_tables = [t for t in table_names if t not in results]
         if missing_tables:
             logger.warning(
-                f"The following tables were not processed: {missing_tables}"
+                "The following tables were not processed: %s",
+                missing_tables
             )
 
     except ValueError as validation_error:
-        logger.error(f"Validation error: {validation_error}")
+        logger.error("Validation error: %s", validation_error)
         raise
 
     except Exception as unexpected_error:
-        logger.error(f"Unexpected error during processing: {unexpected_error}")
+        logger.error("Unexpected error during processing: %s", unexpected_error)
         raise
 
     finally:
@@ -941,11 +1640,11 @@ def main() -> None:
         elapsed_time = time.time() - start_time
 
         logger.info("=" * 70)
-        logger.info(f"Total execution time: {elapsed_time:.2f} seconds")
+        logger.info("Total execution time: %.2f seconds", elapsed_time)
 
         if len(table_names) > 0:
             avg_time_per_table = elapsed_time / len(table_names)
-            logger.info(f"Average time per table: {avg_time_per_table:.3f} seconds")
+            logger.info("Average time per table: %.3f seconds", avg_time_per_table)
 
         logger.info("ORACLE MAX INSERT_DTM QUERY TOOL - COMPLETE")
         logger.info("=" * 70)
@@ -956,10 +1655,13 @@ def main() -> None:
 # =============================================================================
 
 if __name__ == "__main__":
-    # Use the spawn method for creating new processes
-    # This is the default on Windows and more portable across platforms
-    # It also avoids potential issues with forking and certain libraries
-    multiprocessing.set_start_method('spawn', force=True)
+    # Keep the platform's default start method. On Linux that is fork,
+    # which starts workers without re-importing this module; it is safe
+    # here because each worker opens its database sessions after it has
+    # been created, and the driver holds no connections at import time.
+    # Windows only supports spawn, so make that explicit there.
+    if sys.platform == 'win32':
+        multiprocessing.set_start_method('spawn', force=True)
 
     # Run the main function
     main()
@@ -968,40 +1670,26 @@ if __name__ == "__main__":
 ## Key Features of This Example
 
 ### 1. **Multiprocessing Architecture**
-- Uses
-`Manager`
-to
-create
-shared
-`Queue`(
-for task distribution) and `dict` ( for results)
-- Implements
-producer - consumer
-pattern
-with sentinel values for clean shutdown
-- Each
-worker
-maintains
-its
-own
-database
-connection(connections
-can
-'t be shared across processes)
+- Uses a `multiprocessing.Pool` whose initializer opens one database
+  session pool per worker (connections can't be shared across processes)
+- Distributes batches of table names with `imap_unordered` and collects
+  the returned results in a regular dict, with no `Manager` server process
+- Queries each batch with one `UNION ALL` statement, falling back to one
+  query per table if the batch fails
+- Closes session pools in worker finalizers when the pool is closed and joined
+- Offers `process_tables_threaded()`, which runs the same batches on a
+  `ThreadPoolExecutor` sharing one session pool, since the queries spend
+  their time waiting on I/O
+- Offers `process_tables_batched()`, which queries every table over one
+  connection with as few `UNION ALL` round-trips as possible
+- Validates schema and table names before placing them in SQL text
+- Keeps each table's maximum in a SQLite checkpoint so later runs only
+  scan rows newer than it
+- Can skip tables that optimizer statistics show to be empty
 
 ### 2. **Logging**
-- Includes
-process
-name in all
-log
-messages
-via
-` % (processName)
-s
-`
-- Uses
-INFO
-for progress updates and DEBUG for detailed information
+- Includes process name in all log messages via `%(processName)s`
+- Uses INFO for progress updates and DEBUG for detailed information
 - Comprehensive result logging at the end
 
 ### 3. **Documentation**
@@ -1012,29 +1700,12 @@ for progress updates and DEBUG for detailed information
 ### 4. **Best Practices**
 - Type hints throughout
 - Proper exception handling with specific error messages
-- Resource cleanup in `finally` blocks
-- Input
-validation
-- Configurable
-worker
-count
-with sensible defaults
+- Resource cleanup in `finally` blocks and finalizers
+- Input validation
+- Configurable worker count with sensible defaults
 
 ### 5. **Safety Features**
-- Graceful
-shutdown
-using
-sentinel
-values
-- Timeout
-on
-queue
-operations
-to
-prevent
-deadlocks
-- Proper
-connection
-lifecycle
-management
-"""
\ No newline at end of file
+- Connection failures are reported per table instead of crashing the pool
+- Graceful shutdown with `close()`/`join()` instead of terminating workers
+- Proper connection lifecycle management
+"""
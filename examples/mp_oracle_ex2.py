@@ -7,13 +7,13 @@ query multiple Oracle database tables in parallel to find the maximum
 value of an 'insert_dtm' column in each table.
 
 The example uses:
-    - A Manager to share data between processes (Queue and Dictionary)
-    - A Queue to distribute table names to worker processes
-    - A shared Dictionary to collect results from all workers
+    - A static partition of the table names across worker processes
+    - A shared memory block of fixed-size records to collect results
     - Logging with process names for debugging and monitoring
 
 Example Usage:
-    python oracle_multiprocess_query.py
+    python oracle_multiprocess_query.py        # INFO level logging
+    python oracle_multiprocess_query.py -v     # include DEBUG messages
 
 Requirements:
     - oracledb (or cx_Oracle) package
@@ -23,25 +23,76 @@ Author: Training Example
 Date: 2024
 """
 
+import argparse
+import functools
 import logging
 import multiprocessing
-from multiprocessing import Manager, Process, Queue
-from typing import Any
+import re
+import struct
+from datetime import datetime, timedelta
+from multiprocessing import shared_memory
+from types import MappingProxyType
+from typing import Any, Mapping
 import time
 import sys
 
-# Configure logging with process name included in the format
+# Configure logging with process name included in the format. DEBUG
+# messages are skipped before any formatting unless main() is given -v.
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(levelname)s - [%(processName)s] - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# Only pass on the Oracle driver's own warnings and errors
+logging.getLogger('oracledb').setLevel(logging.WARNING)
+
 # Create a logger for this module
 logger = logging.getLogger(__name__)
 
+# Layout of one result record in shared memory: a status code, a datetime
+# as microseconds since the epoch, and UTF-8 text for anything else
+RESULT_TEXT_SIZE = 256
+RESULT_RECORD = struct.Struct(f'<bq{RESULT_TEXT_SIZE}s')
+
+# Status codes stored in the first field of a result record
+STATUS_PENDING = 0  # Slot not written (worker never processed the table)
+STATUS_DATETIME = 1  # Value field holds a naive datetime
+STATUS_NULL = 2  # Query returned NULL (empty table)
+STATUS_TEXT = 3  # Text field holds the value (e.g. an "ERROR: ..." message)
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Start workers with fork on Linux, whatever the interpreter's default. A
+# forked worker inherits its task slice and schema name from the parent's
+# memory, while spawn and forkserver (the Linux default from Python 3.14)
+# pickle the arguments of every Process. Other platforms keep spawn.
+if sys.platform.startswith('linux'):
+    MP_CONTEXT = multiprocessing.get_context('fork')
+else:
+    MP_CONTEXT = multiprocessing.get_context('spawn')
+
+# Process names for the workers, formatted once rather than per spawn
+WORKER_NAMES = tuple(f"Worker-{i:02d}" for i in range(1, 65))
+
+# Maximum number of tables combined into one UNION ALL query
+QUERY_BATCH_SIZE = 16
+
+# Up to this many tables are queried in the current process, since starting
+# worker processes would take longer than the queries themselves
+SEQUENTIAL_TABLE_LIMIT = 4
+
+# Plain (unquoted) Oracle identifier, the only form allowed in the SQL text
+ORACLE_IDENTIFIER = re.compile(r'[A-Za-z][A-Za-z0-9_$#]{0,127}')
+
+# Slowly changing tables whose MAX query carries the RESULT_CACHE hint, so
+# that repeat queries are answered from the server result cache until the
+# table is next modified. Busy tables do not belong here: every commit to
+# a table invalidates its cached results.
+RESULT_CACHE_TABLES = frozenset({'DEPARTMENTS', 'PRODUCTS'})
 
-def get_connection_details(schema_name: str) -> dict[str, str]:
+
+def get_connection_details(schema_name: str) -> Mapping[str, str]:
     """
     Retrieve database connection details for the specified schema.
 
@@ -53,7 +104,7 @@ def get_connection_details(schema_name: str) -> dict[str, str]:
         schema_name: The name of the Oracle schema to connect to.
 
     Returns:
-        A dictionary containing:
+        A read-only mapping containing:
             - 'dsn': The Oracle Data Source Name (host:port/service_name)
             - 'user': The database username
             - 'password': The database password
@@ -65,20 +116,42 @@ def get_connection_details(schema_name: str) -> dict[str, str]:
         >>> details = get_connection_details('MY_SCHEMA')
         >>> print(details['dsn'])
         'localhost:1521/ORCL'
+
+    Note:
+        Details are retrieved once per schema and cached for the life of
+        the process, which matters once the stub calls a secrets service.
+        The cached mapping is returned as is; it is read-only, so callers
+        cannot modify it and no copy is made per call.
     """
     if not schema_name:
         raise ValueError("Schema name cannot be empty or None")
 
-    logger.debug(f"Retrieving connection details for schema: {schema_name}")
+    return _lookup_connection_details(schema_name)
+
+
+@functools.lru_cache(maxsize=32)
+def _lookup_connection_details(schema_name: str) -> Mapping[str, str]:
+    """
+    Look up and cache connection details for a schema.
+
+    Only runs on a cache miss, so the retrieval is logged once per schema.
+
+    Args:
+        schema_name: The name of the Oracle schema to connect to.
+
+    Returns:
+        The connection details mapping described in get_connection_details().
+    """
+    logger.debug("Retrieving connection details for schema: %s", schema_name)
 
     # STUB: Replace with actual credential retrieval logic
     # This could read from environment variables, a config file,
     # or a secrets management system like AWS Secrets Manager
-    return {
+    return MappingProxyType({
         'dsn': 'localhost:1521/ORCL',  # Format: host:port/service_name
         'user': schema_name,
         'password': 'your_password_here'  # NEVER hardcode in production!
-    }
+    })
 
 
 def get_database_connection(schema_name: str) -> Any:
@@ -108,7 +181,7 @@ def get_database_connection(schema_name: str) -> Any:
 
     connection_details = get_connection_details(schema_name)
 
-    logger.debug(f"Attempting to connect to DSN: {connection_details['dsn']}")
+    logger.debug("Attempting to connect to DSN: %s", connection_details['dsn'])
 
     connection = oracledb.connect(
         user=connection_details['user'],
@@ -116,18 +189,37 @@ def get_database_connection(schema_name: str) -> Any:
         dsn=connection_details['dsn']
     )
 
-    logger.info(f"Successfully connected to database for schema: {schema_name}")
+    logger.info("Successfully connected to database for schema: %s", schema_name)
     return connection
 
 
-def query_max_insert_dtm(table_name: str, schema_name: str) -> tuple[str, Any]:
+def result_cache_hint(table_name: str) -> str:
+    """
+    Return the optimizer hint to place after SELECT in a table's MAX query.
+
+    Args:
+        table_name: The name of the table queried.
+
+    Returns:
+        "/*+ RESULT_CACHE */ " for tables in RESULT_CACHE_TABLES, otherwise
+        an empty string.
+    """
+    return "/*+ RESULT_CACHE */ " if table_name.upper() in RESULT_CACHE_TABLES else ""
+
+
+def query_max_insert_dtm(
+    connection: Any,
+    table_name: str,
+    schema_name: str
+) -> tuple[str, Any]:
     """
     Query the maximum insert_dtm value from the specified table.
 
-    This function connects to the database, executes a MAX query on the
-    insert_dtm column, and returns the result.
+    This function executes a MAX query on the insert_dtm column over an
+    open connection and returns the result.
 
     Args:
+        connection: An open database connection, reused across tables.
         table_name: The name of the table to query.
         schema_name: The schema containing the table.
 
@@ -137,110 +229,294 @@ def query_max_insert_dtm(table_name: str, schema_name: str) -> tuple[str, Any]:
             - max_value: The maximum insert_dtm value, or None if empty/error
 
     Note:
-        Each call creates its own database connection. In production,
-        consider using connection pooling for better performance.
+        Only a cursor is opened per call. Cursors are cheap, whereas a
+        connection costs a network handshake and a login, so the caller
+        keeps one connection open for all of its tables.
+
+        The names are placed directly in the SQL text and are not checked
+        here; run_parallel_queries() checks them all once up front.
     """
-    logger.debug(f"Querying max insert_dtm for table: {table_name}")
+    logger.debug("Querying max insert_dtm for table: %s", table_name)
 
     try:
-        # Get a database connection
-        connection = get_database_connection(schema_name)
-
-        try:
-            # Create a cursor for executing the query
-            cursor = connection.cursor()
+        # The cursor is closed when the block exits. The query returns one
+        # row, so the fetch is sized for it; prefetching one row more lets
+        # the driver see the end of the result in the same round trip.
+        with connection.cursor() as cursor:
+            cursor.arraysize = 1
+            cursor.prefetchrows = 2
 
             # Build and execute the query
             # Using bind variables would be preferred if table_name came from user input
-            query = f"SELECT MAX(insert_dtm) FROM {schema_name}.{table_name}"
-            logger.debug(f"Executing query: {query}")
+            query = (
+                f"SELECT {result_cache_hint(table_name)}MAX(insert_dtm) "
+                f"FROM {schema_name}.{table_name}"
+            )
+            logger.debug("Executing query: %s", query)
 
             cursor.execute(query)
             result = cursor.fetchone()
 
-            # Extract the max value from the result tuple
-            max_value = result[0] if result else None
-
-            logger.info(f"Table {table_name}: max insert_dtm = {max_value}")
-            return (table_name, max_value)
+        # Extract the max value from the result tuple
+        max_value = result[0] if result else None
 
-        finally:
-            # Always close the cursor and connection
-            cursor.close()
-            connection.close()
-            logger.debug(f"Closed database connection for table: {table_name}")
+        logger.info("Table %s: max insert_dtm = %s", table_name, max_value)
+        return (table_name, max_value)
 
     except Exception as e:
-        logger.error(f"Error querying table {table_name}: {str(e)}")
+        logger.error("Error querying table %s: %s", table_name, e)
         return (table_name, f"ERROR: {str(e)}")
 
 
-def worker_process(
-    task_queue: Queue,
-    results_dict: dict,
+def query_max_insert_dtm_batch(
+    connection: Any,
+    table_names: list[str],
     schema_name: str
+) -> list[tuple[str, Any]]:
+    """
+    Query several tables for their maximum insert_dtm in one round trip.
+
+    Builds a single UNION ALL statement with one MAX query per table, so
+    the tables cost one network round trip instead of one each. Each
+    branch is labelled with its table name through a bind variable.
+
+    Args:
+        connection: An open database connection, reused across tables.
+        table_names: The names of the tables to query.
+        schema_name: The schema containing the tables.
+
+    Returns:
+        One (table_name, max_value) tuple per table, in the order of
+        table_names, as query_max_insert_dtm() returns them.
+
+    Note:
+        Schema and table names are placed directly in the SQL text and
+        must already have been checked against ORACLE_IDENTIFIER, as
+        run_parallel_queries() does. If the combined query fails (for
+        example because one table does not exist), each table is queried
+        on its own so that only the failing tables report errors.
+    """
+    if len(table_names) == 1:
+        return [
+            query_max_insert_dtm(connection, table_name, schema_name)
+            for table_name in table_names
+        ]
+
+    query = "\nUNION ALL\n".join(
+        f"SELECT {result_cache_hint(table_name)}:t{i}, MAX(insert_dtm) "
+        f"FROM {schema_name}.{table_name}"
+        for i, table_name in enumerate(table_names)
+    )
+    binds = {f"t{i}": table_name for i, table_name in enumerate(table_names)}
+    logger.debug("Executing UNION ALL query for %s tables", len(table_names))
+
+    try:
+        # One row per table, fetched in a single round trip
+        with connection.cursor() as cursor:
+            cursor.arraysize = len(table_names)
+            cursor.prefetchrows = len(table_names) + 1
+            cursor.execute(query, binds)
+            max_values = dict(cursor.fetchall())
+
+    except Exception as e:
+        logger.warning(
+            "Batch query failed for %s tables, retrying individually: %s",
+            len(table_names), e
+        )
+        return [
+            query_max_insert_dtm(connection, table_name, schema_name)
+            for table_name in table_names
+        ]
+
+    for table_name in table_names:
+        logger.info("Table %s: max insert_dtm = %s", table_name, max_values.get(table_name))
+    return [(table_name, max_values.get(table_name)) for table_name in table_names]
+
+
+def encode_result(max_value: Any) -> tuple[int, int, bytes]:
+    """
+    Convert a query result into the fields of a shared memory record.
+
+    Args:
+        max_value: The maximum insert_dtm value, None, or an error string.
+
+    Returns:
+        A tuple of (status code, microseconds since the epoch, text bytes)
+        ready to be packed with RESULT_RECORD.
+    """
+    if max_value is None:
+        return STATUS_NULL, 0, b''
+
+    if isinstance(max_value, datetime) and max_value.tzinfo is None:
+        return STATUS_DATETIME, (max_value - _EPOCH) // timedelta(microseconds=1), b''
+
+    # Anything else is stored as text, truncated to the record size
+    text = str(max_value).encode('utf-8')[:RESULT_TEXT_SIZE]
+    return STATUS_TEXT, 0, text
+
+
+def decode_result(status: int, micros: int, text: bytes) -> Any:
+    """
+    Convert the fields of a shared memory record back into a result value.
+
+    Args:
+        status: The status code of the record.
+        micros: Microseconds since the epoch, for datetime results.
+        text: NUL-padded UTF-8 text, for text results.
+
+    Returns:
+        The datetime, None, or text value stored by encode_result().
+    """
+    if status == STATUS_DATETIME:
+        return _EPOCH + timedelta(microseconds=micros)
+    if status == STATUS_TEXT:
+        return text.rstrip(b'\0').decode('utf-8', errors='replace')
+    return None
+
+
+def worker_process(
+    tasks: list[tuple[int, str]],
+    results_name: str,
+    schema_name: str,
+    log_level: int = logging.INFO
 ) -> None:
     """
-    Worker process that consumes table names from a queue and queries each table.
+    Worker process that queries its share of the tables.
 
-    This function runs in a separate process and continuously pulls table names
-    from the shared queue until it receives a sentinel value (None). For each
-    table, it queries the maximum insert_dtm value and stores the result in
-    the shared results dictionary.
+    This function runs in a separate process and works through the
+    (index, table name) pairs it was given when it started. It opens one
+    database connection up front and reuses it for every table. The tables
+    are queried QUERY_BATCH_SIZE at a time with a single UNION ALL query,
+    and each table's maximum insert_dtm value is written into its record
+    in shared memory.
 
     Args:
-        task_queue: A multiprocessing Queue containing table names to process.
-                   A None value signals the worker to terminate.
-        results_dict: A Manager dictionary to store the query results.
-                     Keys are table names, values are max insert_dtm values.
+        tasks: The (index, table name) tuples assigned to this worker.
+        results_name: Name of the shared memory block holding one
+                     RESULT_RECORD per table, addressed by the task index.
         schema_name: The Oracle schema name containing the tables.
+        log_level: Root logger level of the parent process. A spawned worker
+                   re-imports this module and starts at INFO, so the level
+                   is passed in rather than inherited.
 
     Returns:
-        None. Results are stored in the shared results_dict.
+        None. Results are written to the shared memory block.
 
     Note:
         This function is designed to be run as a target for multiprocessing.Process.
-        It handles the sentinel pattern for graceful termination.
+        The worker exits once its task list is exhausted.
     """
+    logging.getLogger().setLevel(log_level)
     process_name = multiprocessing.current_process().name
-    logger.info(f"Worker started: {process_name}")
+    logger.info("Worker started: %s (%s tables)", process_name, len(tasks))
 
     tables_processed = 0
 
-    while True:
-        try:
-            # Get the next table name from the queue
-            # This will block until an item is available
-            table_name = task_queue.get()
-
-            # Check for sentinel value indicating shutdown
-            if table_name is None:
-                logger.info(
-                    f"Worker {process_name} received shutdown signal. "
-                    f"Processed {tables_processed} tables."
-                )
-                break
+    # Attach to the results block created by the parent process. Each worker
+    # writes only the records of its own tasks, so no locking is needed and
+    # nothing is pickled or sent back to the parent.
+    results_memory = shared_memory.SharedMemory(name=results_name)
 
-            logger.debug(f"Worker {process_name} processing table: {table_name}")
+    # Connect once for all of this worker's tables. If that fails, every
+    # table reports the connection error instead of retrying it.
+    connection = None
+    connection_error = None
+    try:
+        connection = get_database_connection(schema_name)
+    except Exception as e:
+        logger.error("Worker %s could not connect: %s", process_name, e)
+        connection_error = f"ERROR: {str(e)}"
 
-            # Query the table and get the result
-            table_name, max_value = query_max_insert_dtm(table_name, schema_name)
+    for start in range(0, len(tasks), QUERY_BATCH_SIZE):
+        batch = tasks[start:start + QUERY_BATCH_SIZE]
+        batch_tables = [table_name for _, table_name in batch]
+        try:
+            logger.debug("Worker %s processing tables: %s", process_name, batch_tables)
+
+            # Query the whole batch in one round trip
+            if connection is None:
+                batch_results = [
+                    (table_name, connection_error) for table_name in batch_tables
+                ]
+            else:
+                batch_results = query_max_insert_dtm_batch(
+                    connection, batch_tables, schema_name
+                )
 
-            # Store the result in the shared dictionary
-            results_dict[table_name] = max_value
-            tables_processed += 1
+            # Write each result into its table's record
+            for (index, _), (table_name, max_value) in zip(batch, batch_results):
+                RESULT_RECORD.pack_into(
+                    results_memory.buf,
+                    index * RESULT_RECORD.size,
+                    *encode_result(max_value)
+                )
+                tables_processed += 1
 
-            logger.debug(
-                f"Worker {process_name} stored result for {table_name}: {max_value}"
-            )
+                logger.debug(
+                    "Worker %s stored result for %s: %s",
+                    process_name, table_name, max_value
+                )
 
         except Exception as e:
             logger.error(
-                f"Worker {process_name} encountered an error: {str(e)}",
+                "Worker %s encountered an error: %s",
+                process_name, e,
                 exc_info=True
             )
 
-    logger.info(f"Worker {process_name} shutting down gracefully")
+    if connection is not None:
+        try:
+            connection.close()
+            logger.debug("Worker %s closed its database connection", process_name)
+        except Exception as e:
+            logger.warning("Worker %s could not close its connection: %s", process_name, e)
+
+    results_memory.close()
+    logger.info(
+        "Worker %s shutting down gracefully. Processed %s tables.",
+        process_name, tables_processed
+    )
+
+
+def run_sequential_queries(
+    table_names: list[str],
+    schema_name: str
+) -> dict[str, Any]:
+    """
+    Query the tables in the current process over a single connection.
+
+    Used by run_parallel_queries() when worker processes would not pay for
+    themselves: with one worker, or no more than SEQUENTIAL_TABLE_LIMIT
+    tables. The tables are queried QUERY_BATCH_SIZE at a time, as a
+    worker would query them.
+
+    Args:
+        table_names: A list of table names to query.
+        schema_name: The Oracle schema containing the tables.
+
+    Returns:
+        A dictionary mapping table names to their maximum insert_dtm values,
+        with error messages as the values of tables that failed.
+    """
+    try:
+        connection = get_database_connection(schema_name)
+    except Exception as e:
+        logger.error("Could not connect: %s", e)
+        return {table_name: f"ERROR: {str(e)}" for table_name in table_names}
+
+    final_results = {}
+    try:
+        for start in range(0, len(table_names), QUERY_BATCH_SIZE):
+            final_results.update(query_max_insert_dtm_batch(
+                connection, table_names[start:start + QUERY_BATCH_SIZE], schema_name
+            ))
+    finally:
+        try:
+            connection.close()
+        except Exception as e:
+            logger.warning("Could not close the database connection: %s", e)
+
+    return final_results
 
 
 def run_parallel_queries(
@@ -251,24 +527,30 @@ def run_parallel_queries(
     """
     Execute parallel queries to find max insert_dtm for multiple tables.
 
-    This function orchestrates the parallel querying process:
-    1. Creates a Manager for shared data structures
-    2. Populates a Queue with table names
-    3. Spawns worker processes
+    With a single worker, or no more than SEQUENTIAL_TABLE_LIMIT tables,
+    the tables are queried in this process by run_sequential_queries().
+    Otherwise this function orchestrates the parallel querying process:
+    1. Creates a shared memory block for the results
+    2. Splits the (index, table name) tasks into one slice per worker
+    3. Spawns worker processes, each with its own slice
     4. Waits for all workers to complete
-    5. Returns the collected results
+    5. Decodes and returns the collected results
 
     Args:
         table_names: A list of table names to query.
         schema_name: The Oracle schema containing the tables.
-        num_workers: Number of worker processes to spawn. Defaults to 12.
+        num_workers: Maximum number of worker processes to spawn, which is
+                    also the number of concurrent database sessions.
+                    No more workers than tables are started. Defaults to 12.
 
     Returns:
         A dictionary mapping table names to their maximum insert_dtm values.
         Tables that encountered errors will have error messages as values.
 
     Raises:
-        ValueError: If table_names is empty or num_workers is less than 1.
+        ValueError: If table_names is empty, num_workers is less than 1,
+                   or a schema or table name is not a plain Oracle
+                   identifier (see ORACLE_IDENTIFIER).
 
     Example:
         >>> tables = ['TABLE1', 'TABLE2', 'TABLE3']
@@ -282,67 +564,92 @@ def run_parallel_queries(
     if num_workers < 1:
         raise ValueError("num_workers must be at least 1")
 
-    logger.info(
-        f"Starting parallel query execution for {len(table_names)} tables "
-        f"using {num_workers} workers"
-    )
-    logger.info(f"Schema: {schema_name}")
-
-    # Create a Manager to handle shared data structures
-    # The Manager runs in a separate process and provides proxies
-    # that can be safely shared between worker processes
-    manager = Manager()
+    # The names go into the SQL text, so check them all here once rather
+    # than in every query
+    invalid_names = [
+        name for name in (schema_name, *table_names)
+        if not ORACLE_IDENTIFIER.fullmatch(name)
+    ]
+    if invalid_names:
+        raise ValueError(f"Invalid Oracle identifiers: {invalid_names}")
 
-    # Create a Queue for distributing table names to workers
-    task_queue = manager.Queue()
+    if num_workers == 1 or len(table_names) <= SEQUENTIAL_TABLE_LIMIT:
+        logger.debug("Querying %s tables in the main process", len(table_names))
+        return run_sequential_queries(table_names, schema_name)
 
-    # Create a shared dictionary for collecting results
-    # This is a proxy object that synchronizes access across processes
-    results_dict = manager.dict()
+    # A worker without tables would only cost a process start and a login
+    num_workers = min(num_workers, len(table_names))
 
-    # Populate the queue with table names
-    logger.debug("Populating task queue with table names")
-    for table_name in table_names:
-        task_queue.put(table_name)
-        logger.debug(f"Added table to queue: {table_name}")
-
-    # Add sentinel values (None) to signal workers to shut down
-    # We need one sentinel per worker
-    logger.debug(f"Adding {num_workers} sentinel values to queue")
-    for _ in range(num_workers):
-        task_queue.put(None)
+    logger.info(
+        "Starting parallel query execution for %s tables using %s workers",
+        len(table_names), num_workers
+    )
+    logger.info("Schema: %s", schema_name)
+
+    # Create a shared memory block with one fixed-size record per table.
+    # Workers write their results straight into it, so nothing is pickled
+    # or sent back through a queue.
+    results_memory = shared_memory.SharedMemory(
+        create=True,
+        size=RESULT_RECORD.size * len(table_names)
+    )
 
-    # Create and start worker processes
+    # The work list is known up front, so each worker is handed its own
+    # slice of (index, table name) tasks when it starts instead of pulling
+    # them one at a time from a shared queue. The index is the table's
+    # record in the results block. There are at least as many tables as
+    # workers, so no slice is empty.
+    tasks = list(enumerate(table_names))
+    partitions = [tasks[i::num_workers] for i in range(num_workers)]
+    logger.debug("Split %s tables into %s partitions", len(tasks), len(partitions))
+
+    # Create and start worker processes. They are given the current log
+    # level, which spawned workers would otherwise reset to INFO.
     workers = []
-    logger.info(f"Spawning {num_workers} worker processes")
+    log_level = logging.getLogger().getEffectiveLevel()
+    logger.info("Spawning %s worker processes", len(partitions))
 
-    for i in range(num_workers):
+    for i, partition in enumerate(partitions):
         # Create a descriptive process name
-        process_name = f"Worker-{i+1:02d}"
+        if i < len(WORKER_NAMES):
+            process_name = WORKER_NAMES[i]
+        else:
+            process_name = f"Worker-{i + 1:02d}"
 
         # Create the worker process
-        worker = Process(
+        worker = MP_CONTEXT.Process(
             target=worker_process,
-            args=(task_queue, results_dict, schema_name),
+            args=(partition, results_memory.name, schema_name, log_level),
             name=process_name
         )
 
         workers.append(worker)
         worker.start()
-        logger.debug(f"Started worker process: {process_name} (PID: {worker.pid})")
+        logger.debug("Started worker process: %s (PID: %s)", process_name, worker.pid)
 
     # Wait for all workers to complete
     logger.info("Waiting for all workers to complete...")
 
     for worker in workers:
         worker.join()
-        logger.debug(f"Worker {worker.name} has completed (exit code: {worker.exitcode})")
+        logger.debug("Worker %s has completed (exit code: %s)", worker.name, worker.exitcode)
 
     logger.info("All worker processes have completed")
 
-    # Convert the Manager dict proxy to a regular dictionary
-    # This creates a snapshot of the results
-    final_results = dict(results_dict)
+    # Decode the result records into a regular dictionary. Tables whose
+    # record was never written (e.g. a worker crashed) are left out.
+    try:
+        final_results = {}
+        for index, table_name in enumerate(table_names):
+            status, micros, text = RESULT_RECORD.unpack_from(
+                results_memory.buf, index * RESULT_RECORD.size
+            )
+            if status != STATUS_PENDING:
+                final_results[table_name] = decode_result(status, micros, text)
+    finally:
+        # Release the shared memory block now that all workers are done
+        results_memory.close()
+        results_memory.unlink()
 
     return final_results
 
@@ -351,8 +658,10 @@ def log_results(results: dict[str, Any]) -> None:
     """
     Log the final results from all table queries.
 
-    This function iterates through the results dictionary and logs each
-    table's maximum insert_dtm value. It also provides summary statistics.
+    This function sorts the results into successful and failed tables in
+    one pass. The successful tables' maximum insert_dtm values and the
+    summary statistics are logged as one INFO record, and the failed
+    tables as one WARNING record, rather than one record per table.
 
     Args:
         results: A dictionary mapping table names to max insert_dtm values.
@@ -360,32 +669,31 @@ def log_results(results: dict[str, Any]) -> None:
     Returns:
         None. Output is written to the log.
     """
-    logger.info("=" * 60)
-    logger.info("FINAL RESULTS")
-    logger.info("=" * 60)
-
-    # Count successful and failed queries
-    successful = 0
-    failed = 0
+    success_lines = []
+    failure_lines = []
 
     # Sort results by table name for consistent output
-    for table_name in sorted(results.keys()):
-        max_value = results[table_name]
-
+    for table_name, max_value in sorted(results.items()):
         # Check if this was an error result
         if isinstance(max_value, str) and max_value.startswith("ERROR:"):
-            logger.warning(f"  {table_name}: {max_value}")
-            failed += 1
+            failure_lines.append(f"  {table_name}: {max_value}")
         else:
-            logger.info(f"  {table_name}: {max_value}")
-            successful += 1
+            success_lines.append(f"  {table_name}: {max_value}")
+
+    # Assemble the report with the summary statistics and log it in one call
+    report = ["=" * 60, "FINAL RESULTS", "=" * 60]
+    report += success_lines
+    report += [
+        "-" * 60,
+        f"Total tables processed: {len(results)}",
+        f"Successful queries: {len(success_lines)}",
+        f"Failed queries: {len(failure_lines)}",
+        "=" * 60,
+    ]
+    logger.info("\n".join(report))
 
-    # Log summary statistics
-    logger.info("-" * 60)
-    logger.info(f"Total tables processed: {len(results)}")
-    logger.info(f"Successful queries: {successful}")
-    logger.info(f"Failed queries: {failed}")
-    logger.info("=" * 60)
+    if failure_lines:
+        logger.warning("Failed tables:\n%s", "\n".join(failure_lines))
 
 
 def main() -> None:
@@ -393,20 +701,35 @@ def main() -> None:
     Main entry point for the Oracle multiprocessing query example.
 
     This function:
-    1. Defines a list of sample table names
-    2. Configures the schema and worker count
-    3. Executes the parallel queries
-    4. Logs the results
+    1. Parses the command line (-v enables DEBUG logging)
+    2. Defines a list of sample table names
+    3. Configures the schema and worker count
+    4. Executes the parallel queries
+    5. Logs the results
 
     This is designed as a demonstration/training example.
     """
+    parser = argparse.ArgumentParser(
+        description="Query the maximum insert_dtm of Oracle tables in parallel."
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help="Log DEBUG messages as well"
+    )
+    args = parser.parse_args()
+
+    # Workers are started with this level, however they are started
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
     logger.info("Oracle Multiprocessing Query Example Starting")
-    logger.info(f"Python version: {sys.version}")
-    logger.info(f"Number of CPU cores available: {multiprocessing.cpu_count()}")
+    logger.info("Python version: %s", sys.version)
+    logger.info("Number of CPU cores available: %s", multiprocessing.cpu_count())
 
     # Configuration
     schema_name = "MY_SCHEMA"
-    num_workers = 12  # Default number of worker processes
+    num_workers = 12  # Upper limit on worker processes and database sessions
 
     # Sample list of table names to query
     # In production, this might come from a database query, config file, or API
@@ -428,8 +751,8 @@ def main() -> None:
         "NOTIFICATIONS",
     ]
 
-    logger.info(f"Tables to process: {len(table_names)}")
-    logger.debug(f"Table list: {table_names}")
+    logger.info("Tables to process: %s", len(table_names))
+    logger.debug("Table list: %s", table_names)
 
     # Record start time for performance measurement
     start_time = time.time()
@@ -444,13 +767,13 @@ def main() -> None:
 
         # Calculate elapsed time
         elapsed_time = time.time() - start_time
-        logger.info(f"Total execution time: {elapsed_time:.2f} seconds")
+        logger.info("Total execution time: %.2f seconds", elapsed_time)
 
         # Log all results
         log_results(results)
 
     except Exception as e:
-        logger.error(f"Fatal error in main: {str(e)}", exc_info=True)
+        logger.error("Fatal error in main: %s", e, exc_info=True)
         sys.exit(1)
 
     logger.info("Oracle Multiprocessing Query Example Complete")
@@ -459,7 +782,7 @@ def main() -> None:
 if __name__ == "__main__":
     # This guard ensures the code only runs when executed directly,
     # not when imported as a module. This is essential for multiprocessing
-    # on Windows, which uses 'spawn' instead of 'fork'.
+    # with 'spawn', which re-imports this module in every worker.
     main()
 
 
@@ -469,11 +792,11 @@ This example demonstrates several key concepts for training purposes:
 
 ## Key Features
 
-1. **Multiprocessing with Manager**: Uses `Manager()` to create shared data structures (Queue and dict) that can be safely accessed by multiple processes.
+1. **Multiprocessing with Shared Memory**: Uses a `shared_memory.SharedMemory` block of fixed-size records that workers write their results into without any pickling, and no `Manager` server process.
 
-2. **Queue-based Task Distribution**: The manager populates a Queue with table names, and workers consume from it until they receive a sentinel value (None).
+2. **Static Task Partitioning**: The table list is split into one slice per worker up front and passed as a process argument, so no task queue is needed.
 
-3. **Sentinel Pattern**: Uses `None` values in the queue to signal workers to shut down gracefully.
+3. **Clean Shutdown**: Each worker exits once its slice is done, so no sentinel values are needed to stop it.
 
 4. **Logging with Process Names**: Configures logging to include `%(processName)s` so you can trace which worker performed each action.
 
@@ -485,6 +808,8 @@ This example demonstrates several key concepts for training purposes:
 
 8. **Best Practices**:
    - Type hints throughout
+   - One database connection per worker, reused for all of its tables
+   - Tables queried in batches with a single UNION ALL query each
    - Proper resource cleanup (connections, cursors)
    - Input validation
    - Performance timing
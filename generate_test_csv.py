@@ -8,14 +8,19 @@ data characteristics of the original files and are suitable for testing.
 Usage:
     python generate_test_csv.py config.json -o test_data.csv -n 100
     python generate_test_csv.py config.json --rows 1000 --seed 42
+    python generate_test_csv.py config.json -o - -n 1000000 | gzip > test_data.csv.gz
+    python generate_test_csv.py config.json --format parquet -n 1000000
 """
 
 import argparse
+import io
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
-from lib.csv_analyzer_lib import CSVConfiguration, DataGenerator
+# Display names of the supported output formats
+FORMAT_NAMES = {'csv': 'CSV', 'parquet': 'Parquet', 'arrow': 'Arrow'}
 
 
 def generate_test_csv(
@@ -24,17 +29,21 @@ def generate_test_csv(
     num_rows: int = 100,
     seed: Optional[int] = None,
     no_header: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    workers: Optional[int] = 1,
+    file_format: str = 'csv'
 ) -> int:
     """Generate a test CSV file from a configuration.
     
     Args:
         config_path: Path to the configuration JSON file.
-        output_path: Path where CSV should be written.
+        output_path: Path where CSV should be written ('-' for stdout).
         num_rows: Number of data rows to generate.
         seed: Random seed for reproducibility.
         no_header: Omit header row even if config has one.
         verbose: Print detailed information.
+        workers: Number of processes generating rows (None = one per CPU).
+        file_format: 'csv', or 'parquet' or 'arrow' (requires pyarrow).
         
     Returns:
         Exit code (0 for success, non-zero for errors).
@@ -45,59 +54,88 @@ def generate_test_csv(
         print(f"Error: Configuration file not found: {config_file}", file=sys.stderr)
         return 1
     
-    # Determine output path
-    if output_path:
+    if output_path == '-' and file_format != 'csv':
+        print("Error: Only CSV output can be written to stdout", file=sys.stderr)
+        return 1
+    
+    # Imported here, after the arguments are checked, since loading the
+    # analyzer library (and pyarrow, when installed) dominates startup time
+    from lib.csv_analyzer_lib import CSVConfiguration, DataGenerator
+    
+    # Determine output path. With '-' the CSV is written to stdout, so all
+    # other messages go to stderr to keep the data stream clean.
+    to_stdout = output_path == '-'
+    info = sys.stderr if to_stdout else sys.stdout
+    
+    if to_stdout:
+        output_file = '<stdout>'
+    elif output_path:
         output_file = Path(output_path)
     else:
-        output_file = config_file.parent / f"test_{config_file.stem.replace('_config', '')}.csv"
+        output_file = config_file.parent / f"test_{config_file.stem.replace('_config', '')}.{file_format}"
     
     if verbose:
-        print(f"Loading configuration from: {config_file}")
-        print(f"Output file: {output_file}")
-        print(f"Number of rows: {num_rows}")
+        print(f"Loading configuration from: {config_file}", file=info)
+        print(f"Output file: {output_file}", file=info)
+        print(f"Number of rows: {num_rows}", file=info)
         if seed is not None:
-            print(f"Random seed: {seed}")
-        print()
+            print(f"Random seed: {seed}", file=info)
+        print(file=info)
     
     try:
         # Load configuration
         config = CSVConfiguration.load(config_file)
         
         if verbose:
-            print("Configuration loaded:")
-            print(f"  Source file: {config.source_file}")
-            print(f"  Columns: {len(config.columns)}")
-            print(f"  Delimiter: {repr(config.delimiter)}")
-            print(f"  Has header: {config.has_header}")
-            print()
+            print("Configuration loaded:", file=info)
+            print(f"  Source file: {config.source_file}", file=info)
+            print(f"  Columns: {len(config.columns)}", file=info)
+            print(f"  Delimiter: {repr(config.delimiter)}", file=info)
+            print(f"  Has header: {config.has_header}", file=info)
+            print(file=info)
         
         # Create generator
-        generator = DataGenerator(config=config, seed=seed)
+        generator = DataGenerator(config=config, seed=seed, workers=workers)
         
         # Determine whether to include header
         include_header = config.has_header and not no_header
         
         if verbose:
-            print("Generating CSV data...")
+            print("Generating CSV data...", file=info)
         
-        # Generate CSV file
-        generator.generate_csv(
-            output_path=output_file,
-            num_rows=num_rows,
-            include_header=include_header
-        )
+        # Generate the output file
+        if file_format != 'csv':
+            generator.generate_table_file(
+                output_path=output_file,
+                num_rows=num_rows,
+                file_format=file_format
+            )
+        elif to_stdout:
+            # Text layer over stdout's bytes, in the configured encoding
+            stdout = io.TextIOWrapper(sys.stdout.buffer, encoding=config.encoding, newline='')
+            try:
+                generator.write_csv(stdout, num_rows, include_header)
+            finally:
+                stdout.flush()
+                stdout.detach()
+        else:
+            generator.generate_csv(
+                output_path=output_file,
+                num_rows=num_rows,
+                include_header=include_header
+            )
         
-        print(f"Test CSV generated successfully: {output_file}")
-        print(f"Rows generated: {num_rows}")
+        print(f"Test {FORMAT_NAMES[file_format]} file generated successfully: {output_file}", file=info)
+        print(f"Rows generated: {num_rows}", file=info)
         
         if verbose:
-            print()
-            print("Column summary:")
+            print(file=info)
+            print("Column summary:", file=info)
             for col in config.columns:
                 type_info = col.data_type.value
                 if col.enum_values:
                     type_info += f" (enum with {len(col.enum_values)} values)"
-                print(f"  {col.name}: {type_info}")
+                print(f"  {col.name}: {type_info}", file=info)
         
         return 0
     
@@ -105,8 +143,14 @@ def generate_test_csv(
         print(f"Error: {e}", file=sys.stderr)
         return 1
     
+    except BrokenPipeError:
+        # The reader of stdout exited early (e.g. head). Point stdout at
+        # devnull so the final flush at exit does not fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    
     except Exception as e:
-        print(f"Error generating CSV: {e}", file=sys.stderr)
+        print(f"Error generating {FORMAT_NAMES[file_format]} file: {e}", file=sys.stderr)
         if verbose:
             import traceback
             traceback.print_exc()
@@ -130,11 +174,17 @@ Examples:
   # Generate 1000 rows and save to specific file
   python generate_test_csv.py config.json -o test_data.csv -n 1000
   
-  # Generate with reproducible random seed
+  # Generate with reproducible random seed (the same rows for any --workers)
   python generate_test_csv.py config.json --seed 42 --rows 500
   
   # Generate without header row
   python generate_test_csv.py config.json --no-header
+  
+  # Stream to stdout, e.g. to compress without writing the CSV to disk
+  python generate_test_csv.py config.json -o - -n 1000000 | gzip > data.csv.gz
+  
+  # Generate a Parquet file instead of CSV (requires pyarrow)
+  python generate_test_csv.py config.json --format parquet -n 1000000
         """
     )
     
@@ -145,7 +195,14 @@ Examples:
     
     parser.add_argument(
         '-o', '--output',
-        help='Output CSV file path (default: test_CONFIGNAME.csv)'
+        help="Output file path, or '-' for stdout (default: test_CONFIGNAME.FORMAT)"
+    )
+    
+    parser.add_argument(
+        '--format',
+        choices=['csv', 'parquet', 'arrow'],
+        default='csv',
+        help='Output file format; parquet and arrow require pyarrow (default: csv)'
     )
     
     parser.add_argument(
@@ -173,6 +230,13 @@ Examples:
         help='Print detailed information'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of processes generating rows (default: 1, 0 = one per CPU)'
+    )
+    
     args = parser.parse_args()
     
     return generate_test_csv(
@@ -181,7 +245,9 @@ Examples:
         num_rows=args.rows,
         seed=args.seed,
         no_header=args.no_header,
-        verbose=args.verbose
+        verbose=args.verbose,
+        workers=args.workers or None,
+        file_format=args.format
     )
 
 
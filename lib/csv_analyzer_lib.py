@@ -13,20 +13,36 @@ Typical usage example:
     generator.generate_csv('test_output.csv', num_rows=100)
 """
 
+import codecs
 import csv
+import functools
+import hashlib
+import io
+import itertools
 import json
+import math
+import mmap
+import os
 import re
-import statistics
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
-from dataclasses import dataclass, asdict, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, TextIO, Tuple, Union
+from dataclasses import dataclass, field
 from enum import Enum
 import random
 import string
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    # pyarrow is optional; the csv module path is used without it
+    pa = None
+    pa_csv = None
+
 
 class DataType(Enum):
     """Enumeration of supported data types for CSV columns."""
@@ -87,14 +103,46 @@ class ColumnMetadata:
         Returns:
             Dictionary representation suitable for JSON serialization.
         """
-        result = asdict(self)
-        result['data_type'] = self.data_type.value
+        # Built field by field rather than with dataclasses.asdict(), which
+        # deep-copies every nested value; sets become sorted lists for JSON
+        return {
+            'name': self.name,
+            'index': self.index,
+            'data_type': self.data_type.value,
+            'nullable': self.nullable,
+            'null_percentage': self.null_percentage,
+            'unique_count': self.unique_count,
+            'total_count': self.total_count,
+            'sample_values': list(self.sample_values),
+            'patterns': self._serialize_mapping(self.patterns),
+            'statistics': self._serialize_mapping(self.statistics),
+            'enum_values': sorted(self.enum_values) if self.enum_values is not None else None,
+            'max_length': self.max_length,
+            'min_length': self.min_length,
+        }
+    
+    @staticmethod
+    def _serialize_mapping(mapping: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a patterns/statistics dict with sets turned into sorted lists.
+        
+        Sets nested in lists and dicts are converted too.
         
-        # Convert set to sorted list for JSON serialization
-        if self.enum_values is not None:
-            result['enum_values'] = sorted(list(self.enum_values))
+        Args:
+            mapping: Dictionary of scalars, lists, dicts and sets.
         
-        return result
+        Returns:
+            New dictionary suitable for JSON serialization.
+        """
+        def convert(value: Any) -> Any:
+            if isinstance(value, set):
+                return sorted(value)
+            if isinstance(value, dict):
+                return {k: convert(v) for k, v in value.items()}
+            if isinstance(value, list):
+                return [convert(item) for item in value]
+            return value
+        
+        return {key: convert(value) for key, value in mapping.items()}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ColumnMetadata':
@@ -171,19 +219,8 @@ class CSVConfiguration:
             'columns': [col.to_dict() for col in self.columns]
         }
         
-        # Helper function to convert sets to lists for JSON serialization
-        def convert_sets(obj):
-            if isinstance(obj, dict):
-                return {k: convert_sets(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_sets(item) for item in obj]
-            elif isinstance(obj, set):
-                return sorted(list(obj))
-            else:
-                return obj
-        
-        config_dict = convert_sets(config_dict)
-        
+        # ColumnMetadata.to_dict() already turns sets into lists, so the
+        # dictionary is passed to json as it is
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(config_dict, f, indent=2)
     
@@ -234,41 +271,66 @@ class DataTypeDetector:
     
     # Common date format patterns
     DATE_PATTERNS = [
-        (r'^\d{4}-\d{2}-\d{2}$', '%Y-%m-%d'),
-        (r'^\d{2}/\d{2}/\d{4}$', '%m/%d/%Y'),
-        (r'^\d{2}-\d{2}-\d{4}$', '%m-%d-%Y'),
-        (r'^\d{4}/\d{2}/\d{2}$', '%Y/%m/%d'),
-        (r'^\d{1,2}/\d{1,2}/\d{4}$', '%m/%d/%Y'),
-        (r'^\d{4}\d{2}\d{2}$', '%Y%m%d'),
+        (re.compile(r'^\d{4}-\d{2}-\d{2}$'), '%Y-%m-%d'),
+        (re.compile(r'^\d{2}/\d{2}/\d{4}$'), '%m/%d/%Y'),
+        (re.compile(r'^\d{2}-\d{2}-\d{4}$'), '%m-%d-%Y'),
+        (re.compile(r'^\d{4}/\d{2}/\d{2}$'), '%Y/%m/%d'),
+        (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'), '%m/%d/%Y'),
+        (re.compile(r'^\d{4}\d{2}\d{2}$'), '%Y%m%d'),
     ]
     
     # Common datetime patterns
     DATETIME_PATTERNS = [
-        (r'^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}$', '%Y-%m-%d %H:%M:%S'),
-        (r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$', '%Y-%m-%dT%H:%M:%S'),
-        (r'^\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}$', '%m/%d/%Y %H:%M:%S'),
+        (re.compile(r'^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}$'), '%Y-%m-%d %H:%M:%S'),
+        (re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$'), '%Y-%m-%dT%H:%M:%S'),
+        (re.compile(r'^\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}$'), '%m/%d/%Y %H:%M:%S'),
     ]
     
     # Common time patterns
     TIME_PATTERNS = [
-        (r'^\d{2}:\d{2}:\d{2}$', '%H:%M:%S'),
-        (r'^\d{2}:\d{2}$', '%H:%M'),
-        (r'^\d{1,2}:\d{2}\s*[AaPp][Mm]$', '%I:%M %p'),
+        (re.compile(r'^\d{2}:\d{2}:\d{2}$'), '%H:%M:%S'),
+        (re.compile(r'^\d{2}:\d{2}$'), '%H:%M'),
+        (re.compile(r'^\d{1,2}:\d{2}\s*[AaPp][Mm]$'), '%I:%M %p'),
     ]
     
+    # Each family of patterns combined into one compiled regex, used to reject
+    # values cheaply before trying the individual patterns and strptime
+    DATE_PREFILTER = re.compile('|'.join(f'(?:{p.pattern})' for p, _ in DATE_PATTERNS))
+    DATETIME_PREFILTER = re.compile('|'.join(f'(?:{p.pattern})' for p, _ in DATETIME_PATTERNS))
+    TIME_PREFILTER = re.compile('|'.join(f'(?:{p.pattern})' for p, _ in TIME_PATTERNS))
+    
+    # Columns with at most this many distinct values are treated as enums
+    ENUM_MAX_VALUES = 20
+    
+    # Formats that datetime.fromisoformat() parses much faster than strptime
+    ISO_FORMATS = frozenset(['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S'])
+    
+    # Results of the date, datetime and time checks are cached per value, as
+    # date columns repeat the same values many times
+    TEMPORAL_CACHE_SIZE = 8192
+    
     # Email pattern
-    EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
     
     # Phone patterns (various formats)
     PHONE_PATTERNS = [
-        r'^\d{3}-\d{3}-\d{4}$',  # 123-456-7890
-        r'^\(\d{3}\)\s*\d{3}-\d{4}$',  # (123) 456-7890
-        r'^\d{10}$',  # 1234567890
-        r'^\+\d{1,3}\s*\d{10}$',  # +1 1234567890
+        re.compile(r'^\d{3}-\d{3}-\d{4}$'),  # 123-456-7890
+        re.compile(r'^\(\d{3}\)\s*\d{3}-\d{4}$'),  # (123) 456-7890
+        re.compile(r'^\d{10}$'),  # 1234567890
+        re.compile(r'^\+\d{1,3}\s*\d{10}$'),  # +1 1234567890
     ]
     
+    # All phone patterns as one regex, so a value is checked with one match
+    PHONE_PATTERN = re.compile('|'.join(f'(?:{p.pattern})' for p in PHONE_PATTERNS))
+    
     # URL pattern
-    URL_PATTERN = r'^https?://[^\s<>"{}|\\^`\[\]]+$'
+    URL_PATTERN = re.compile(r'^https?://[^\s<>"{}|\\^`\[\]]+$')
+    
+    # Lowercase spellings accepted as boolean values
+    BOOLEAN_VALUES = frozenset(['true', 'false', 't', 'f', 'yes', 'no', 'y', 'n', '1', '0'])
+    
+    # Lowercase spellings treated as null, after stripping whitespace
+    NULL_VALUES = frozenset(['', 'null', 'none', 'na', 'n/a', 'nan', '#n/a'])
     
     @staticmethod
     def is_null(value: str) -> bool:
@@ -284,11 +346,20 @@ class DataTypeDetector:
             return True
         
         # Strip and check common null representations
-        value_stripped = value.strip()
-        return (
-            value_stripped == '' or
-            value_stripped.lower() in ('null', 'none', 'na', 'n/a', 'nan', '#n/a')
-        )
+        return value.strip().lower() in DataTypeDetector.NULL_VALUES
+    
+    @staticmethod
+    def remove_nulls(values: List[str]) -> List[str]:
+        """Return the values of a column that are not null/empty.
+        
+        Args:
+            values: List of string values from a column.
+        
+        Returns:
+            The non-null values, in their original order.
+        """
+        null_values = DataTypeDetector.NULL_VALUES
+        return [v for v in values if v is not None and v.strip().lower() not in null_values]
     
     @staticmethod
     def detect_type(values: List[str]) -> Tuple[DataType, Dict[str, Any]]:
@@ -304,82 +375,158 @@ class DataTypeDetector:
             Tuple of (detected DataType, dictionary of patterns/metadata).
         """
         # Filter out null values for type detection
-        non_null_values = [v for v in values if not DataTypeDetector.is_null(v)]
+        return DataTypeDetector.detect_non_null_type(DataTypeDetector.remove_nulls(values))
+    
+    @staticmethod
+    def detect_non_null_type(non_null_values: List[str]) -> Tuple[DataType, Dict[str, Any]]:
+        """Detect the data type of values that have already had nulls removed.
+        
+        Same as detect_type() for callers that filter nulls themselves with
+        remove_nulls(), so the column is not scanned for nulls twice.
+        
+        Args:
+            non_null_values: Non-null string values from a column.
         
+        Returns:
+            Tuple of (detected DataType, dictionary of patterns/metadata).
+        """
         if not non_null_values:
             return DataType.EMPTY, {}
         
-        # Count how many values match each type
-        type_matches = {
-            DataType.BOOLEAN: 0,
-            DataType.INTEGER: 0,
-            DataType.FLOAT: 0,
-            DataType.DECIMAL: 0,
-            DataType.EMAIL: 0,
-            DataType.PHONE: 0,
-            DataType.URL: 0,
-            DataType.DATE: 0,
-            DataType.DATETIME: 0,
-            DataType.TIME: 0,
-        }
-        
         patterns: Dict[str, Any] = {}
         
-        for value in non_null_values:
+        total_values = len(non_null_values)
+        threshold = 0.8
+        
+        # Match counts are kept in plain locals during the loop and only put
+        # into type_matches afterwards
+        booleans = integers = floats = decimals = 0
+        emails = phones = urls = datetimes = dates = times = 0
+        
+        # Types are only probed while they can still reach the threshold;
+        # the -1 keeps the cutoff on the safe side of float rounding
+        min_matches = threshold * total_values - 1
+        check_boolean = check_integer = check_float = check_decimal = True
+        check_email = check_phone = check_url = True
+        check_datetime = check_date = check_time = True
+        
+        boolean_values = DataTypeDetector.BOOLEAN_VALUES
+        email_match = DataTypeDetector.EMAIL_PATTERN.match
+        phone_match = DataTypeDetector.PHONE_PATTERN.match
+        url_match = DataTypeDetector.URL_PATTERN.match
+        datetime_prefilter = DataTypeDetector.DATETIME_PREFILTER.match
+        date_prefilter = DataTypeDetector.DATE_PREFILTER.match
+        time_prefilter = DataTypeDetector.TIME_PREFILTER.match
+        
+        for position, value in enumerate(non_null_values):
+            if position and position % 64 == 0:
+                # Counts of unchecked types never grow, so a type once
+                # dropped here stays dropped
+                remaining = total_values - position
+                check_boolean = booleans + remaining >= min_matches
+                check_integer = integers + remaining >= min_matches
+                check_float = floats + remaining >= min_matches
+                check_decimal = decimals + remaining >= min_matches
+                check_email = emails + remaining >= min_matches
+                check_phone = phones + remaining >= min_matches
+                check_url = urls + remaining >= min_matches
+                # A temporal type that has already reached the threshold
+                # cannot fall below it, so its parsing stops there
+                check_datetime = (datetimes + remaining >= min_matches
+                                  and datetimes / total_values < threshold)
+                check_date = dates + remaining >= min_matches and dates / total_values < threshold
+                check_time = times + remaining >= min_matches and times / total_values < threshold
+                if not (check_boolean or check_integer or check_float or check_decimal
+                        or check_email or check_phone or check_url
+                        or check_datetime or check_date or check_time):
+                    break
+            
             value_stripped = value.strip()
             
             # Check boolean
-            if value_stripped.lower() in ('true', 'false', 't', 'f', 'yes', 'no', 'y', 'n', '1', '0'):
-                type_matches[DataType.BOOLEAN] += 1
-            
-            # Check integer
-            if DataTypeDetector._is_integer(value_stripped):
-                type_matches[DataType.INTEGER] += 1
+            if check_boolean and value_stripped.lower() in boolean_values:
+                booleans += 1
             
-            # Check float
-            if DataTypeDetector._is_float(value_stripped):
-                type_matches[DataType.FLOAT] += 1
-            
-            # Check decimal (financial)
-            if DataTypeDetector._is_decimal(value_stripped):
-                type_matches[DataType.DECIMAL] += 1
+            # Check integer, float and decimal on one cleaned copy of the value
+            if check_integer or check_float or check_decimal:
+                # Remove common thousands separators
+                clean_value = value_stripped.replace(',', '').replace('_', '')
+                try:
+                    int(clean_value)
+                except ValueError:
+                    if check_float:
+                        try:
+                            float(clean_value)
+                            floats += 1
+                        except ValueError:
+                            pass
+                    if check_decimal:
+                        # Remove currency symbols; a decimal needs a decimal point
+                        decimal_value = clean_value.replace('$', '').replace('€', '').replace('£', '').strip()
+                        if '.' in decimal_value:
+                            try:
+                                Decimal(decimal_value)
+                                decimals += 1
+                            except (ArithmeticError, ValueError):
+                                pass
+                else:
+                    # An integer has no decimal point, so it is also a float
+                    # but never a decimal
+                    if check_integer:
+                        integers += 1
+                    if check_float:
+                        floats += 1
             
             # Check email
-            if re.match(DataTypeDetector.EMAIL_PATTERN, value_stripped):
-                type_matches[DataType.EMAIL] += 1
+            if check_email and '@' in value_stripped and email_match(value_stripped):
+                emails += 1
             
             # Check phone
-            if any(re.match(pattern, value_stripped) for pattern in DataTypeDetector.PHONE_PATTERNS):
-                type_matches[DataType.PHONE] += 1
+            if check_phone and phone_match(value_stripped):
+                phones += 1
             
             # Check URL
-            if re.match(DataTypeDetector.URL_PATTERN, value_stripped):
-                type_matches[DataType.URL] += 1
+            if check_url and url_match(value_stripped):
+                urls += 1
             
             # Check datetime (before date)
-            datetime_match = DataTypeDetector._check_datetime(value_stripped)
-            if datetime_match:
-                type_matches[DataType.DATETIME] += 1
-                if 'datetime_format' not in patterns:
-                    patterns['datetime_format'] = datetime_match
+            if check_datetime and datetime_prefilter(value_stripped):
+                datetime_match = DataTypeDetector._check_datetime(value_stripped)
+                if datetime_match:
+                    datetimes += 1
+                    if 'datetime_format' not in patterns:
+                        patterns['datetime_format'] = datetime_match
             
             # Check date
-            date_match = DataTypeDetector._check_date(value_stripped)
-            if date_match:
-                type_matches[DataType.DATE] += 1
-                if 'date_format' not in patterns:
-                    patterns['date_format'] = date_match
+            if check_date and date_prefilter(value_stripped):
+                date_match = DataTypeDetector._check_date(value_stripped)
+                if date_match:
+                    dates += 1
+                    if 'date_format' not in patterns:
+                        patterns['date_format'] = date_match
             
             # Check time
-            time_match = DataTypeDetector._check_time(value_stripped)
-            if time_match:
-                type_matches[DataType.TIME] += 1
-                if 'time_format' not in patterns:
-                    patterns['time_format'] = time_match
+            if check_time and time_prefilter(value_stripped):
+                time_match = DataTypeDetector._check_time(value_stripped)
+                if time_match:
+                    times += 1
+                    if 'time_format' not in patterns:
+                        patterns['time_format'] = time_match
+        
+        type_matches = {
+            DataType.BOOLEAN: booleans,
+            DataType.INTEGER: integers,
+            DataType.FLOAT: floats,
+            DataType.DECIMAL: decimals,
+            DataType.EMAIL: emails,
+            DataType.PHONE: phones,
+            DataType.URL: urls,
+            DataType.DATE: dates,
+            DataType.DATETIME: datetimes,
+            DataType.TIME: times,
+        }
         
         # Determine the best matching type (requires >80% match for specialized types)
-        total_values = len(non_null_values)
-        threshold = 0.8
         
         # Check specialized types first
         for data_type in [DataType.EMAIL, DataType.PHONE, DataType.URL, 
@@ -404,8 +551,8 @@ class DataTypeDetector:
             return DataType.FLOAT, patterns
         
         # Check if it should be treated as enum (few unique values relative to total)
-        unique_values = set(non_null_values)
-        if len(unique_values) <= min(20, total_values * 0.5):
+        unique_values = DataTypeDetector._collect_enum_values(non_null_values)
+        if unique_values is not None and len(unique_values) <= total_values * 0.5:
             patterns['enum_values'] = unique_values
             return DataType.ENUM, patterns
         
@@ -413,6 +560,31 @@ class DataTypeDetector:
         patterns.update(DataTypeDetector._compute_string_stats(non_null_values))
         return DataType.STRING, patterns
     
+    @staticmethod
+    def _collect_enum_values(values: List[str]) -> Optional[Set[str]]:
+        """Collect the distinct values of a column that may be an enum.
+        
+        Values are added in small chunks and collection stops as soon as
+        there are more than ENUM_MAX_VALUES of them, so high-cardinality
+        columns never build a set of every distinct value.
+        
+        Args:
+            values: Non-null values of the column.
+            
+        Returns:
+            Set of distinct values, or None if there are too many for an enum.
+        """
+        limit = DataTypeDetector.ENUM_MAX_VALUES
+        chunk_size = 256
+        unique_values: Set[str] = set()
+        
+        for start in range(0, len(values), chunk_size):
+            unique_values.update(values[start:start + chunk_size])
+            if len(unique_values) > limit:
+                return None
+        
+        return unique_values
+    
     @staticmethod
     def _is_integer(value: str) -> bool:
         """Check if value is a valid integer."""
@@ -438,53 +610,76 @@ class DataTypeDetector:
     @staticmethod
     def _is_decimal(value: str) -> bool:
         """Check if value appears to be a decimal/currency value."""
+        # Remove currency symbols and clean
+        clean_value = value.replace('$', '').replace('€', '').replace('£', '')
+        clean_value = clean_value.replace(',', '').replace('_', '').strip()
+        
+        # Typically has exactly 2 decimal places for currency; values without
+        # a decimal point are rejected before building a Decimal
+        if '.' not in clean_value:
+            return False
         try:
-            # Remove currency symbols and clean
-            clean_value = value.replace('$', '').replace('€', '').replace('£', '')
-            clean_value = clean_value.replace(',', '').replace('_', '').strip()
-            
             Decimal(clean_value)
-            # Typically has exactly 2 decimal places for currency
-            return '.' in clean_value
-        except:
+            return True
+        except (ArithmeticError, ValueError):
             return False
     
     @staticmethod
+    @functools.lru_cache(maxsize=TEMPORAL_CACHE_SIZE)
     def _check_date(value: str) -> Optional[str]:
         """Check if value matches a date pattern."""
+        if not DataTypeDetector.DATE_PREFILTER.match(value):
+            return None
+        
         for pattern, fmt in DataTypeDetector.DATE_PATTERNS:
-            if re.match(pattern, value):
-                try:
-                    datetime.strptime(value, fmt)
-                    return fmt
-                except ValueError:
-                    continue
+            if pattern.match(value) and DataTypeDetector._parses_as(value, fmt):
+                return fmt
         return None
     
     @staticmethod
+    @functools.lru_cache(maxsize=TEMPORAL_CACHE_SIZE)
     def _check_datetime(value: str) -> Optional[str]:
         """Check if value matches a datetime pattern."""
+        if not DataTypeDetector.DATETIME_PREFILTER.match(value):
+            return None
+        
         for pattern, fmt in DataTypeDetector.DATETIME_PATTERNS:
-            if re.match(pattern, value):
-                try:
-                    datetime.strptime(value, fmt)
-                    return fmt
-                except ValueError:
-                    continue
+            if pattern.match(value) and DataTypeDetector._parses_as(value, fmt):
+                return fmt
         return None
     
     @staticmethod
+    @functools.lru_cache(maxsize=TEMPORAL_CACHE_SIZE)
     def _check_time(value: str) -> Optional[str]:
         """Check if value matches a time pattern."""
+        if not DataTypeDetector.TIME_PREFILTER.match(value):
+            return None
+        
         for pattern, fmt in DataTypeDetector.TIME_PATTERNS:
-            if re.match(pattern, value):
-                try:
-                    datetime.strptime(value, fmt)
-                    return fmt
-                except ValueError:
-                    continue
+            if pattern.match(value) and DataTypeDetector._parses_as(value, fmt):
+                return fmt
         return None
     
+    @staticmethod
+    def _parses_as(value: str, fmt: str) -> bool:
+        """Check if value parses with the given strptime format.
+        
+        ISO formats are tried with datetime.fromisoformat() first, falling back
+        to strptime for the inputs it is stricter about (e.g. repeated spaces).
+        """
+        if fmt in DataTypeDetector.ISO_FORMATS:
+            try:
+                datetime.fromisoformat(value)
+                return True
+            except ValueError:
+                pass
+        
+        try:
+            datetime.strptime(value, fmt)
+            return True
+        except ValueError:
+            return False
+    
     @staticmethod
     def _compute_numeric_stats(values: List[str]) -> Dict[str, Any]:
         """Compute statistics for numeric values."""
@@ -496,32 +691,131 @@ class DataTypeDetector:
                 clean_value = value.replace('$', '').replace('€', '').replace('£', '')
                 clean_value = clean_value.replace(',', '').replace('_', '').strip()
                 numeric_values.append(float(clean_value))
-            except:
+            except ValueError:
                 continue
         
         if not numeric_values:
             return {}
         
+        # math.fsum gives a correctly rounded sum in C; statistics.mean and
+        # statistics.stdev convert every float to an exact Fraction instead
+        count = len(numeric_values)
+        mean = math.fsum(numeric_values) / count
+        
+        sorted_values = sorted(numeric_values)
+        middle = count // 2
+        if count % 2:
+            median = sorted_values[middle]
+        else:
+            median = (sorted_values[middle - 1] + sorted_values[middle]) / 2
+        
+        stdev = 0.0
+        if count > 1:
+            squared_deviations = math.fsum((v - mean) * (v - mean) for v in numeric_values)
+            stdev = math.sqrt(squared_deviations / (count - 1))
+        
         return {
-            'min': min(numeric_values),
-            'max': max(numeric_values),
-            'mean': statistics.mean(numeric_values),
-            'median': statistics.median(numeric_values),
-            'stdev': statistics.stdev(numeric_values) if len(numeric_values) > 1 else 0.0,
+            'min': sorted_values[0],
+            'max': sorted_values[-1],
+            'mean': mean,
+            'median': median,
+            'stdev': stdev,
         }
     
     @staticmethod
     def _compute_string_stats(values: List[str]) -> Dict[str, Any]:
         """Compute statistics for string values."""
-        lengths = [len(v) for v in values]
+        lengths = list(map(len, values))
         
         return {
             'min_length': min(lengths),
             'max_length': max(lengths),
-            'avg_length': statistics.mean(lengths),
+            'avg_length': sum(lengths) / len(lengths),
         }
 
 
+class HyperLogLog:
+    """HyperLogLog sketch for estimating the number of distinct strings.
+    
+    Uses 2**precision one-byte registers (16 KB at the default precision)
+    regardless of how many values are added, with a typical relative error
+    of about 1.04 / sqrt(2**precision) (under 1% at the default).
+    
+    Attributes:
+        precision: Number of hash bits used to select a register.
+        registers: Maximum observed rank per register.
+    """
+    
+    def __init__(self, precision: int = 14) -> None:
+        """Initialize an empty sketch.
+        
+        Args:
+            precision: Register index bits, between 4 and 16 (default: 14).
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError(f"precision must be between 4 and 16, got {precision}")
+        
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+    
+    def add(self, value: str) -> None:
+        """Add a single value to the sketch.
+        
+        Args:
+            value: String value to add.
+        """
+        digest = hashlib.blake2b(
+            value.encode('utf-8', 'surrogatepass'), digest_size=8
+        ).digest()
+        hashed = int.from_bytes(digest, 'big')
+        
+        remaining_bits = 64 - self.precision
+        index = hashed >> remaining_bits
+        rank = remaining_bits - (hashed & ((1 << remaining_bits) - 1)).bit_length() + 1
+        
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+    
+    def update(self, values: Iterable[str]) -> None:
+        """Add every value from an iterable to the sketch.
+        
+        Args:
+            values: String values to add.
+        """
+        for value in values:
+            self.add(value)
+    
+    def merge(self, other: 'HyperLogLog') -> None:
+        """Merge another sketch of the same precision into this one.
+        
+        Args:
+            other: Sketch to merge.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        
+        self.registers = bytearray(map(max, self.registers, other.registers))
+    
+    def count(self) -> int:
+        """Estimate the number of distinct values added.
+        
+        Returns:
+            Estimated distinct count.
+        """
+        num_registers = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / num_registers)
+        estimate = alpha * num_registers * num_registers / math.fsum(
+            2.0 ** -rank for rank in self.registers
+        )
+        
+        # Small-range correction (linear counting)
+        empty_registers = self.registers.count(0)
+        if estimate <= 2.5 * num_registers and empty_registers:
+            estimate = num_registers * math.log(num_registers / empty_registers)
+        
+        return int(round(estimate))
+
+
 class CSVAnalyzer:
     """Analyzes CSV files to extract structure and data characteristics.
     
@@ -533,13 +827,27 @@ class CSVAnalyzer:
         filepath: Path to the CSV file being analyzed.
         encoding: Detected or specified file encoding.
         sample_size: Number of rows to sample for analysis (None = all rows).
+        values_may_contain_newlines: Whether quoted values may span lines.
+        workers: Number of processes used to analyze columns.
     """
     
+    # Distinct values are counted exactly up to this many, then estimated
+    # with a HyperLogLog sketch to bound memory on high-cardinality columns
+    EXACT_UNIQUE_LIMIT = 65536
+    
+    # Read buffer / Arrow block size used when reading the file
+    READ_CHUNK_SIZE = 8 << 20
+    
+    # Characters read from the start of the file for dialect/header sniffing
+    SNIFF_SAMPLE_SIZE = 8192
+    
     def __init__(
         self,
         filepath: Union[str, Path],
         encoding: str = 'utf-8',
-        sample_size: Optional[int] = None
+        sample_size: Optional[int] = None,
+        values_may_contain_newlines: bool = True,
+        workers: Optional[int] = 1
     ) -> None:
         """Initialize CSV analyzer.
         
@@ -547,10 +855,24 @@ class CSVAnalyzer:
             filepath: Path to CSV file to analyze.
             encoding: File encoding (default: 'utf-8').
             sample_size: Maximum rows to analyze (None for all rows).
+            values_may_contain_newlines: Set to False when no quoted value
+                contains a line break, so every newline byte ends a row. This
+                lets the pyarrow reader skip multiline quote handling and read
+                only the bytes covering the sample (default: True).
+            workers: Number of processes to analyze columns in parallel
+                (default: 1, None for one per CPU).
         """
         self.filepath = Path(filepath)
         self.encoding = encoding
+        # Files saved as UTF-8 with a byte order mark (as Excel does) are read
+        # without it, the same as the pyarrow reader does
+        self._text_encoding = (
+            'utf-8-sig' if codecs.lookup(encoding).name == 'utf-8' else encoding
+        )
         self.sample_size = sample_size
+        self.values_may_contain_newlines = values_may_contain_newlines
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self._sample: Optional[str] = None
         
         if not self.filepath.exists():
             raise FileNotFoundError(f"CSV file not found: {self.filepath}")
@@ -564,47 +886,44 @@ class CSVAnalyzer:
         Raises:
             ValueError: If CSV cannot be parsed or is invalid.
         """
-        # Detect CSV dialect (delimiter, quotechar, etc.)
+        # Detect CSV dialect (delimiter, quotechar, etc.); the sample read for
+        # it is kept for header detection
+        self._sample = None
         dialect = self._detect_dialect()
         
-        # Read and analyze the CSV data
-        rows, has_header = self._read_csv(dialect)
+        # Read the CSV data into per-column value lists
+        column_data = self._read_columns(dialect)
         
-        if not rows:
+        if not column_data or not column_data[0]:
             raise ValueError("CSV file is empty or unreadable")
         
-        # Extract column data
-        num_columns = len(rows[0])
-        column_data: List[List[str]] = [[] for _ in range(num_columns)]
-        
-        for row in rows:
-            # Handle rows with different column counts (ragged CSV)
-            for i in range(num_columns):
-                if i < len(row):
-                    column_data[i].append(row[i])
-                else:
-                    column_data[i].append('')
+        num_columns = len(column_data)
+        num_rows = len(column_data[0])
+        has_header = self._detect_header(column_data)
         
         # Generate column names
         if has_header:
-            header_row = rows[0]
-            data_rows = rows[1:]
+            header_row = [col[0] for col in column_data]
+            line_count = num_rows - 1
         else:
             header_row = [f"column_{i}" for i in range(num_columns)]
-            data_rows = rows
+            line_count = num_rows
         
-        # Analyze each column
-        columns = []
-        for idx, (col_name, col_values) in enumerate(zip(header_row, column_data)):
-            # For columns with headers, skip the header value in data analysis
-            analysis_values = col_values[1:] if has_header else col_values
-            
-            column_metadata = self._analyze_column(
-                name=col_name,
-                index=idx,
-                values=analysis_values
-            )
-            columns.append(column_metadata)
+        # For columns with headers, skip the header value in data analysis;
+        # it is deleted in place so the columns are not copied a second time
+        if has_header:
+            for col_values in column_data:
+                del col_values[0]
+        indexes = range(num_columns)
+        
+        # Columns are independent, so wide files are analyzed in parallel
+        if self.workers > 1 and num_columns > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, num_columns)) as executor:
+                columns = list(executor.map(
+                    self._analyze_column, header_row, indexes, column_data
+                ))
+        else:
+            columns = list(map(self._analyze_column, header_row, indexes, column_data))
         
         # Create configuration
         config = CSVConfiguration(
@@ -613,7 +932,7 @@ class CSVAnalyzer:
             quotechar=dialect.quotechar,
             has_header=has_header,
             encoding=self.encoding,
-            line_count=len(data_rows),
+            line_count=line_count,
             columns=columns
         )
         
@@ -625,59 +944,248 @@ class CSVAnalyzer:
         Returns:
             Detected csv.Dialect object.
         """
-        with open(self.filepath, 'r', encoding=self.encoding, newline='') as f:
-            # Read sample for dialect detection
-            sample = f.read(8192)
-            
-            try:
-                sniffer = csv.Sniffer()
-                dialect = sniffer.sniff(sample)
-                return dialect
-            except csv.Error:
-                # Fall back to default dialect if detection fails
-                return csv.excel()
+        try:
+            sniffer = csv.Sniffer()
+            dialect = sniffer.sniff(self._read_sample())
+            return dialect
+        except csv.Error:
+            # Fall back to default dialect if detection fails
+            return csv.excel()
+    
+    def _read_sample(self) -> str:
+        """Read the start of the file used for sniffing, once per analysis.
+        
+        Returns:
+            Up to SNIFF_SAMPLE_SIZE characters from the start of the file.
+        """
+        if self._sample is None:
+            with open(self.filepath, 'r', encoding=self._text_encoding, newline='') as f:
+                self._sample = f.read(self.SNIFF_SAMPLE_SIZE)
+        return self._sample
     
-    def _read_csv(self, dialect: csv.Dialect) -> Tuple[List[List[str]], bool]:
-        """Read CSV file and detect if it has a header.
+    def _read_columns(self, dialect: csv.Dialect) -> List[List[str]]:
+        """Read the CSV file into one list of values per column.
+        
+        Uses the pyarrow CSV reader when it is installed and can handle the
+        detected dialect, otherwise falls back to the csv module. The number
+        of columns is taken from the first row; short rows are padded with
+        empty strings and extra cells are ignored.
         
         Args:
             dialect: CSV dialect to use for parsing.
             
         Returns:
-            Tuple of (list of rows, has_header boolean).
+            List of column value lists (header row included if present).
         """
-        rows = []
-        
-        with open(self.filepath, 'r', encoding=self.encoding, newline='') as f:
+        if pa_csv is not None:
+            column_data = self._read_columns_arrow(dialect)
+            if column_data is not None:
+                return column_data
+        
+        with open(
+            self.filepath,
+            'r',
+            encoding=self._text_encoding,
+            newline='',
+            buffering=self.READ_CHUNK_SIZE
+        ) as f:
             reader = csv.reader(f, dialect=dialect)
+            first_row = next(reader, None)
             
-            for idx, row in enumerate(reader):
-                rows.append(row)
-                
+            if first_row is None:
+                return []
+            
+            # Cells go straight into per-column lists, so the file is never
+            # held as a list of rows as well
+            num_columns = len(first_row)
+            column_data: List[List[str]] = [[value] for value in first_row]
+            append_row = self._make_row_appender(column_data)
+            padding = [''] * num_columns
+            
+            for idx, row in enumerate(reader, start=1):
                 # Limit sample size if specified
-                if self.sample_size and idx >= self.sample_size:
+                if self.sample_size and idx > self.sample_size:
                     break
+                
+                # Handle rows with different column counts (ragged CSV)
+                if len(row) != num_columns:
+                    row = (row + padding)[:num_columns]
+                
+                append_row(row)
         
-        # Detect header using csv.Sniffer
-        has_header = False
-        if len(rows) > 1:
-            with open(self.filepath, 'r', encoding=self.encoding, newline='') as f:
-                sample = f.read(8192)
-                try:
-                    sniffer = csv.Sniffer()
-                    has_header = sniffer.has_header(sample)
-                except csv.Error:
-                    # Try heuristic: if first row is all text and subsequent rows have numbers
-                    first_row = rows[0]
-                    second_row = rows[1] if len(rows) > 1 else []
+        return column_data
+    
+    @staticmethod
+    def _make_row_appender(column_data: List[List[str]]) -> Callable[[List[str]], None]:
+        """Generate a function that appends one row to the column lists.
+        
+        Once the column count is known, the per-row loop over columns is
+        unrolled into straight-line code and compiled, e.g. for two columns:
+        
+            def append_row(row):
+                append_0(row[0])
+                append_1(row[1])
+        
+        This avoids the per-cell iteration overhead of a generic loop.
+        
+        Args:
+            column_data: One list per column to append values to.
+            
+        Returns:
+            Function taking a row with exactly len(column_data) values.
+        """
+        names = [f"append_{i}" for i in range(len(column_data))]
+        body = "".join(f"        {name}(row[{i}])\n" for i, name in enumerate(names))
+        source = (
+            f"def make_appender({', '.join(names)}):\n"
+            "    def append_row(row):\n"
+            + (body or "        pass\n")
+            + "    return append_row\n"
+        )
+        
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, '<row appender>', 'exec'), namespace)
+        return namespace['make_appender'](*(values.append for values in column_data))
+    
+    def _read_columns_arrow(self, dialect: csv.Dialect) -> Optional[List[List[str]]]:
+        """Read the CSV file into column value lists using pyarrow.
+        
+        The file is memory-mapped and every column is read as a string column
+        in READ_CHUNK_SIZE blocks by Arrow's multi-threaded C++ parser, so no
+        per-row Python work is done while tokenizing.
+        
+        Args:
+            dialect: CSV dialect to use for parsing.
+            
+        Returns:
+            List of column value lists, or None if the file must be read with
+            the csv module instead (unsupported dialect, ragged rows or blank
+            lines).
+        """
+        if dialect.skipinitialspace or len(dialect.delimiter) != 1:
+            return None
+        
+        # Arrow needs the column names up front to force string columns
+        with open(self.filepath, 'r', encoding=self._text_encoding, newline='') as f:
+            first_row = next(csv.reader(f, dialect=dialect), None)
+        
+        if not first_row:
+            return None
+        
+        column_names = [f"f{i}" for i in range(len(first_row))]
+        
+        read_options = pa_csv.ReadOptions(
+            column_names=column_names,
+            block_size=self.READ_CHUNK_SIZE,
+            encoding=self.encoding
+        )
+        parse_options = pa_csv.ParseOptions(
+            delimiter=dialect.delimiter,
+            quote_char=dialect.quotechar or False,
+            double_quote=dialect.doublequote,
+            escape_char=dialect.escapechar or False,
+            newlines_in_values=self.values_may_contain_newlines,
+            ignore_empty_lines=False
+        )
+        convert_options = pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in column_names},
+            null_values=[],
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False
+        )
+        
+        # Match the csv module path, which reads sample_size + 1 rows
+        row_limit = self.sample_size + 1 if self.sample_size else None
+        column_data: List[List[str]] = [[] for _ in column_names]
+        rows_read = 0
+        
+        try:
+            with pa.memory_map(str(self.filepath)) as source:
+                sample_end = self._sample_end_offset(row_limit)
+                if sample_end is not None:
+                    # Only hand Arrow the bytes that hold the sampled rows
+                    source = pa.BufferReader(source.read_buffer(sample_end))
+                
+                reader = pa_csv.open_csv(
+                    source,
+                    read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options
+                )
+                
+                for batch in reader:
+                    if row_limit is not None and rows_read + batch.num_rows > row_limit:
+                        batch = batch.slice(0, row_limit - rows_read)
                     
-                    # Check if first row looks like headers (no numbers, mostly text)
-                    first_numeric = sum(1 for cell in first_row if DataTypeDetector._is_float(cell))
-                    second_numeric = sum(1 for cell in second_row if DataTypeDetector._is_float(cell))
+                    for values, column in zip(column_data, batch.columns):
+                        values.extend(column.to_pylist())
                     
-                    has_header = (first_numeric == 0 and second_numeric > 0)
+                    rows_read += batch.num_rows
+                    if row_limit is not None and rows_read >= row_limit:
+                        break
+        except (pa.ArrowInvalid, UnicodeDecodeError):
+            return None
+        
+        return column_data
+    
+    def _sample_end_offset(self, row_limit: Optional[int]) -> Optional[int]:
+        """Find the byte offset just past the last row of the sample.
+        
+        Only used when values cannot contain newlines, so that the n-th
+        newline byte ends the n-th row. Newlines are located with mmap.find(),
+        which scans with memchr rather than walking the file a byte at a time
+        in Python.
+        
+        Args:
+            row_limit: Number of rows needed, or None to read the whole file.
+            
+        Returns:
+            Offset of the end of the sample, or None if the whole file is needed.
+        """
+        if (row_limit is None or self.values_may_contain_newlines
+                or '\n'.encode(self.encoding) != b'\n'):
+            return None
         
-        return rows, has_header
+        with open(self.filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                offset = 0
+                for _ in range(row_limit):
+                    newline = mapped.find(b'\n', offset)
+                    if newline == -1:
+                        return None
+                    offset = newline + 1
+        
+        return offset
+    
+    def _detect_header(self, column_data: List[List[str]]) -> bool:
+        """Detect whether the first row of the CSV file is a header.
+        
+        Args:
+            column_data: Column value lists as returned by _read_columns().
+            
+        Returns:
+            True if the first row looks like a header row.
+        """
+        has_header = False
+        if len(column_data[0]) > 1:
+            try:
+                sniffer = csv.Sniffer()
+                has_header = sniffer.has_header(self._read_sample())
+            except csv.Error:
+                # Try heuristic: if first row is all text and subsequent rows have numbers
+                first_row = [col[0] for col in column_data]
+                second_row = [col[1] for col in column_data]
+                
+                # Check if first row looks like headers (no numbers, mostly text)
+                first_numeric = sum(1 for cell in first_row if DataTypeDetector._is_float(cell))
+                second_numeric = sum(1 for cell in second_row if DataTypeDetector._is_float(cell))
+                
+                has_header = (first_numeric == 0 and second_numeric > 0)
+        
+        return has_header
     
     def _analyze_column(
         self,
@@ -695,30 +1203,30 @@ class CSVAnalyzer:
         Returns:
             ColumnMetadata with complete analysis results.
         """
-        # Count nulls
-        null_count = sum(1 for v in values if DataTypeDetector.is_null(v))
-        non_null_values = [v for v in values if not DataTypeDetector.is_null(v)]
+        # Separate nulls in a single pass over the column
+        non_null_values = DataTypeDetector.remove_nulls(values)
+        null_count = len(values) - len(non_null_values)
         
         # Detect data type
-        data_type, patterns = DataTypeDetector.detect_type(values)
+        data_type, patterns = DataTypeDetector.detect_non_null_type(non_null_values)
         
         # Count unique values
-        unique_values = set(non_null_values)
-        unique_count = len(unique_values)
-        
-        # Get sample values (up to 10)
-        sample_values = list(unique_values)[:10]
+        unique_count, unique_values, sample_values = self._count_unique(non_null_values)
         
         # Determine if should be treated as enum
         enum_values = None
-        if data_type == DataType.ENUM or (unique_count <= 20 and unique_count < len(non_null_values) * 0.5):
+        if data_type == DataType.ENUM or (
+            unique_count <= DataTypeDetector.ENUM_MAX_VALUES
+            and unique_count < len(non_null_values) * 0.5
+        ):
             enum_values = unique_values
             data_type = DataType.ENUM
         
-        # Compute string lengths
-        string_lengths = [len(str(v)) for v in non_null_values] if non_null_values else [0]
-        max_length = max(string_lengths) if string_lengths else 0
-        min_length = min(string_lengths) if string_lengths else 0
+        # Compute string lengths (values are always str, so len() is mapped
+        # over them directly)
+        string_lengths = list(map(len, non_null_values)) or [0]
+        max_length = max(string_lengths)
+        min_length = min(string_lengths)
         
         return ColumnMetadata(
             name=name,
@@ -735,6 +1243,42 @@ class CSVAnalyzer:
             max_length=max_length,
             min_length=min_length
         )
+    
+    def _count_unique(
+        self,
+        values: List[str]
+    ) -> Tuple[int, Optional[Set[str]], List[str]]:
+        """Count the distinct values in a column.
+        
+        Values are collected into a set until it holds more than
+        EXACT_UNIQUE_LIMIT entries. The set is then folded into a
+        HyperLogLog sketch and the rest of the column is only counted
+        approximately.
+        
+        Args:
+            values: Non-null values of the column.
+            
+        Returns:
+            Tuple of (unique count, set of unique values or None if the
+            count is an estimate, up to 10 sample values).
+        """
+        limit = self.EXACT_UNIQUE_LIMIT
+        unique_values: Set[str] = set()
+        
+        for start in range(0, len(values), limit):
+            unique_values.update(values[start:start + limit])
+            
+            if len(unique_values) > limit:
+                sample_values = list(itertools.islice(unique_values, 10))
+                
+                sketch = HyperLogLog()
+                sketch.update(unique_values)
+                for chunk_start in range(start + limit, len(values), limit):
+                    sketch.update(set(values[chunk_start:chunk_start + limit]))
+                
+                return sketch.count(), None, sample_values
+        
+        return len(unique_values), unique_values, list(itertools.islice(unique_values, 10))
 
 
 class DataGenerator:
@@ -746,19 +1290,60 @@ class DataGenerator:
     Attributes:
         config: CSVConfiguration to use for generation.
         seed: Random seed for reproducible generation (optional).
+        workers: Number of processes used to generate CSV files.
     """
     
-    def __init__(self, config: CSVConfiguration, seed: Optional[int] = None) -> None:
+    # Fixed value pools for the generated types
+    BOOLEAN_VALUES = ('True', 'False', 'true', 'false', '1', '0')
+    EMAIL_DOMAINS = ('example.com', 'test.com', 'demo.com', 'sample.org')
+    URL_PROTOCOLS = ('http', 'https')
+    URL_DOMAINS = ('example.com', 'test.com', 'demo.org', 'sample.net')
+    URL_PATHS = ('', '/page', '/resource', '/api/v1', '/docs')
+    
+    # Rows are generated a column at a time, in chunks of this many rows
+    GENERATE_CHUNK_ROWS = 10000
+    
+    # Write buffer size, so the file is written in a few large writes
+    WRITE_BUFFER_SIZE = 256 << 10
+    
+    # Zero-padded two-digit numbers, for formatting times without strftime
+    TWO_DIGITS = tuple('%02d' % i for i in range(100))
+    
+    # A strftime format made of date directives and literal text only
+    DATE_ONLY_FORMAT = re.compile(r'(?:[^%]|%[YymdbBaAj])*')
+    
+    # Arrow types of the columns written by generate_table_file that are not
+    # stored as strings
+    ARROW_TYPES = {
+        DataType.INTEGER: 'int64',
+        DataType.FLOAT: 'double',
+        DataType.DECIMAL: 'double',
+        DataType.BOOLEAN: 'bool',
+    }
+    
+    def __init__(
+        self,
+        config: CSVConfiguration,
+        seed: Optional[int] = None,
+        workers: Optional[int] = 1
+    ) -> None:
         """Initialize data generator.
         
         Args:
             config: Configuration describing the CSV structure.
             seed: Random seed for reproducibility (default: None).
+            workers: Number of processes to generate CSV files in parallel
+                (default: 1, None for one per CPU).
         """
         self.config = config
-        
-        if seed is not None:
-            random.seed(seed)
+        self.seed = seed
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        
+        # Own random state, so the output depends only on the seed. Chunk
+        # seeds are drawn from _chunk_seeds and each chunk's values from
+        # _random, reseeded per chunk (see _plan_chunks).
+        self._chunk_seeds = random.Random(seed)
+        self._random = random.Random()
     
     def generate_csv(
         self,
@@ -776,109 +1361,283 @@ class DataGenerator:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w', encoding=self.config.encoding, newline='') as f:
-            writer = csv.writer(
-                f,
-                delimiter=self.config.delimiter,
-                quotechar=self.config.quotechar
-            )
-            
-            # Write header if configured
-            if include_header and self.config.has_header:
-                header = [col.name for col in self.config.columns]
-                writer.writerow(header)
+        with open(
+            output_path,
+            'w',
+            encoding=self.config.encoding,
+            newline='',
+            buffering=self.WRITE_BUFFER_SIZE
+        ) as f:
+            self.write_csv(f, num_rows, include_header)
+    
+    def generate_table_file(
+        self,
+        output_path: Union[str, Path],
+        num_rows: int,
+        file_format: str = 'parquet'
+    ) -> None:
+        """Generate a Parquet or Arrow IPC file with synthetic data.
+        
+        Values are generated as for CSV and written a chunk at a time as
+        Arrow record batches. Empty values become nulls, integer, float,
+        decimal and boolean columns are stored as int64, double and bool,
+        and all other columns keep their text in the configured formats.
+        
+        Args:
+            output_path: Path where the file should be written.
+            num_rows: Number of rows to generate.
+            file_format: 'parquet' or 'arrow' (default: 'parquet').
+        
+        Raises:
+            ImportError: If pyarrow is not installed.
+            ValueError: If file_format is not supported.
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required to write Parquet or Arrow files")
+        
+        if file_format not in ('parquet', 'arrow'):
+            raise ValueError(f"Unsupported file format: {file_format}")
+        
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        import pyarrow.compute as pa_compute
+        
+        schema = pa.schema([
+            (col.name, pa.type_for_alias(self.ARROW_TYPES.get(col.data_type, 'string')))
+            for col in self.config.columns
+        ])
+        null = pa.scalar(None, pa.string())
+        
+        if file_format == 'parquet':
+            import pyarrow.parquet as pa_parquet
+            writer = pa_parquet.ParquetWriter(str(output_path), schema, compression='zstd')
+        else:
+            writer = pa.ipc.new_file(str(output_path), schema)
+        
+        with writer:
+            for columns in self._generate_column_chunks(self._plan_chunks(num_rows)):
+                arrays = []
+                
+                for values, column_field in zip(columns, schema):
+                    array = pa.array(values, pa.string())
+                    array = pa_compute.if_else(pa_compute.equal(array, ''), null, array)
+                    arrays.append(array.cast(column_field.type))
+                
+                writer.write_batch(pa.record_batch(arrays, schema=schema))
+    
+    def write_csv(self, f: TextIO, num_rows: int, include_header: bool = True) -> None:
+        """Write synthetic CSV data to an open text file.
+        
+        Args:
+            f: Text file to write to, opened with newline=''.
+            num_rows: Number of data rows to generate.
+            include_header: Whether to include header row (default: True).
+        """
+        writer = csv.writer(
+            f,
+            delimiter=self.config.delimiter,
+            quotechar=self.config.quotechar
+        )
+        
+        # Write header if configured
+        if include_header and self.config.has_header:
+            header = [col.name for col in self.config.columns]
+            writer.writerow(header)
+        
+        # Generate and write data rows
+        if self.workers > 1 and num_rows > self.GENERATE_CHUNK_ROWS:
+            # Chunks are generated and formatted in worker processes and
+            # written in order
+            chunks = list(self._plan_chunks(num_rows))
             
-            # Generate and write data rows
-            for _ in range(num_rows):
-                row = self._generate_row()
-                writer.writerow(row)
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks))) as executor:
+                for text in executor.map(self._format_chunk, chunks):
+                    f.write(text)
+        else:
+            for rows in self._generate_chunks(self._plan_chunks(num_rows)):
+                writer.writerows(rows)
     
     def generate_rows(self, num_rows: int) -> List[List[str]]:
         """Generate rows of synthetic data without writing to file.
         
         Args:
             num_rows: Number of rows to generate.
-            
+        
         Returns:
             List of rows, where each row is a list of string values.
         """
         rows = []
         
-        for _ in range(num_rows):
-            rows.append(self._generate_row())
+        for chunk in self._generate_chunks(self._plan_chunks(num_rows)):
+            rows.extend(map(list, chunk))
         
         return rows
     
-    def _generate_row(self) -> List[str]:
-        """Generate a single row of data.
+    def _format_chunk(self, chunk: Tuple[int, int]) -> str:
+        """Generate a chunk of rows as CSV text.
+        
+        Used by generate_csv in worker processes, so only the text of the
+        chunk has to be sent back.
+        
+        Args:
+            chunk: (seed, number of rows) of the chunk, from _plan_chunks.
         
         Returns:
-            List of string values for each column.
+            The rows formatted as CSV text.
         """
-        row = []
+        output = io.StringIO()
+        writer = csv.writer(
+            output,
+            delimiter=self.config.delimiter,
+            quotechar=self.config.quotechar
+        )
+        
+        for rows in self._generate_chunks([chunk]):
+            writer.writerows(rows)
+        
+        return output.getvalue()
+    
+    def _plan_chunks(self, num_rows: int) -> Iterable[Tuple[int, int]]:
+        """Split rows into chunks of up to GENERATE_CHUNK_ROWS rows.
+        
+        Each chunk gets its own 64-bit seed, drawn in order from the
+        generator's seed, and its values depend only on that seed. So a seed
+        gives the same rows whether the chunks are generated here or in any
+        number of worker processes.
         
-        for column in self.config.columns:
-            # Decide if this value should be null
-            if column.nullable and random.random() < column.null_percentage:
-                row.append('')
-            else:
-                value = self._generate_value(column)
-                row.append(value)
+        Args:
+            num_rows: Total number of rows to generate.
         
-        return row
+        Yields:
+            (seed, number of rows) for each chunk.
+        """
+        for chunk_start in range(0, num_rows, self.GENERATE_CHUNK_ROWS):
+            size = min(self.GENERATE_CHUNK_ROWS, num_rows - chunk_start)
+            yield self._chunk_seeds.getrandbits(64), size
     
-    def _generate_value(self, column: ColumnMetadata) -> str:
-        """Generate a single value for a column.
+    def _generate_chunks(
+        self,
+        chunks: Iterable[Tuple[int, int]]
+    ) -> Iterable[Iterable[Tuple[str, ...]]]:
+        """Generate the rows of chunks.
+        
+        Args:
+            chunks: (seed, number of rows) for each chunk.
+        
+        Yields:
+            Iterable of row tuples for each chunk.
+        """
+        for columns in self._generate_column_chunks(chunks):
+            yield zip(*columns)
+    
+    def _generate_column_chunks(
+        self,
+        chunks: Iterable[Tuple[int, int]]
+    ) -> Iterable[List[List[str]]]:
+        """Generate the columns of chunks.
+        
+        Each column's values for a chunk are drawn together. Everything that
+        depends only on the configuration (which generator each column uses,
+        its bounds and formats) is resolved once, before the first chunk.
+        
+        Args:
+            chunks: (seed, number of rows) for each chunk.
+        
+        Yields:
+            List of column value lists for each chunk.
+        """
+        generators = [
+            self._make_column_generator(column)
+            for column in self.config.columns
+        ]
+        
+        for chunk_seed, size in chunks:
+            self._random.seed(chunk_seed)
+            yield [generate(size) for generate in generators]
+    
+    def _make_column_generator(self, column: ColumnMetadata) -> Callable[[int], List[str]]:
+        """Build a function that generates values for a column.
         
         Args:
             column: ColumnMetadata describing the column.
-            
+        
+        Returns:
+            Function taking a number of values and returning that many
+            generated values as strings.
+        """
+        generate = self._make_value_generator(column)
+        
+        if not column.nullable or not column.null_percentage:
+            return generate
+        
+        # A value is null with the column's observed null percentage
+        null_percentage = column.null_percentage
+        rand = self._random.random
+        
+        def generate_nullable(n: int) -> List[str]:
+            return ['' if rand() < null_percentage else value for value in generate(n)]
+        
+        return generate_nullable
+    
+    def _make_value_generator(self, column: ColumnMetadata) -> Callable[[int], List[str]]:
+        """Build a function that generates non-null values for a column.
+        
+        Args:
+            column: ColumnMetadata describing the column.
+        
         Returns:
-            Generated value as a string.
+            Function taking a number of values and returning that many
+            generated values as strings.
         """
-        # Handle enum type - select from known values
+        choices = self._random.choices
+        
+        # Handle enum type - select from known values. Sorting gives a fixed
+        # order, so a seed reproduces the same values in every process.
         if column.data_type == DataType.ENUM and column.enum_values:
-            return random.choice(list(column.enum_values))
+            values = tuple(sorted(column.enum_values))
+            return lambda n: choices(values, k=n)
         
         # Handle specific data types
         if column.data_type == DataType.INTEGER:
-            return self._generate_integer(column)
+            return self._make_integer_generator(column)
         
         elif column.data_type == DataType.FLOAT:
-            return self._generate_float(column)
+            return self._make_float_generator(column, 1000, '%.6f')
         
         elif column.data_type == DataType.DECIMAL:
-            return self._generate_decimal(column)
+            return self._make_float_generator(column, 10000, '%.2f')
         
         elif column.data_type == DataType.BOOLEAN:
-            return random.choice(['True', 'False', 'true', 'false', '1', '0'])
+            return lambda n: choices(self.BOOLEAN_VALUES, k=n)
         
         elif column.data_type == DataType.DATE:
-            return self._generate_date(column)
+            return self._make_date_generator(column)
         
         elif column.data_type == DataType.DATETIME:
-            return self._generate_datetime(column)
+            return self._make_datetime_generator(column)
         
         elif column.data_type == DataType.TIME:
-            return self._generate_time(column)
+            return self._make_time_generator(column)
         
         elif column.data_type == DataType.EMAIL:
-            return self._generate_email()
+            return self._make_email_generator()
         
         elif column.data_type == DataType.PHONE:
-            return self._generate_phone()
+            return self._make_phone_generator()
         
         elif column.data_type == DataType.URL:
-            return self._generate_url()
+            urls = self._url_pool()
+            return lambda n: choices(urls, k=n)
         
         elif column.data_type == DataType.STRING:
-            return self._generate_string(column)
+            return self._make_string_generator(column)
         
         else:  # EMPTY or MIXED
-            return ''
+            return lambda n: [''] * n
     
-    def _generate_integer(self, column: ColumnMetadata) -> str:
-        """Generate a random integer value."""
+    def _make_integer_generator(self, column: ColumnMetadata) -> Callable[[int], List[str]]:
+        """Build a generator of random integer values."""
         stats = column.statistics
         
         if 'min' in stats and 'max' in stats:
@@ -889,13 +1648,27 @@ class DataGenerator:
             range_size = max_val - min_val
             min_val -= int(range_size * 0.1)
             max_val += int(range_size * 0.1)
-            
-            return str(random.randint(min_val, max_val))
         else:
-            return str(random.randint(1, 1000000))
+            min_val, max_val = 1, 1000000
+        
+        span = max_val - min_val + 1
+        rand = self._random.random
+        
+        return lambda n: [str(min_val + int(rand() * span)) for _ in range(n)]
     
-    def _generate_float(self, column: ColumnMetadata) -> str:
-        """Generate a random float value."""
+    def _make_float_generator(
+        self,
+        column: ColumnMetadata,
+        default_max: float,
+        value_format: str
+    ) -> Callable[[int], List[str]]:
+        """Build a generator of random float or decimal (currency) values.
+        
+        Args:
+            column: ColumnMetadata describing the column.
+            default_max: Upper bound used when the column has no statistics.
+            value_format: %-format for the values, e.g. '%.2f'.
+        """
         stats = column.statistics
         
         if 'min' in stats and 'max' in stats:
@@ -906,126 +1679,200 @@ class DataGenerator:
             range_size = max_val - min_val
             min_val -= range_size * 0.1
             max_val += range_size * 0.1
-            
-            value = random.uniform(min_val, max_val)
-            return f"{value:.6f}"
         else:
-            return f"{random.uniform(0, 1000):.6f}"
-    
-    def _generate_decimal(self, column: ColumnMetadata) -> str:
-        """Generate a random decimal value (typically currency)."""
-        stats = column.statistics
+            min_val, max_val = 0.0, float(default_max)
         
-        if 'min' in stats and 'max' in stats:
-            min_val = float(stats['min'])
-            max_val = float(stats['max'])
-            
-            range_size = max_val - min_val
-            min_val -= range_size * 0.1
-            max_val += range_size * 0.1
-            
-            value = random.uniform(min_val, max_val)
-            return f"{value:.2f}"
-        else:
-            return f"{random.uniform(0, 10000):.2f}"
+        span = max_val - min_val
+        rand = self._random.random
+        
+        return lambda n: [value_format % (min_val + span * rand()) for _ in range(n)]
     
-    def _generate_date(self, column: ColumnMetadata) -> str:
-        """Generate a random date value."""
-        date_format = column.patterns.get('date_format', '%Y-%m-%d')
+    def _make_date_generator(self, column: ColumnMetadata) -> Callable[[int], List[str]]:
+        """Build a generator of random dates within the last 10 years.
         
-        # Generate date within the last 10 years
+        There are only 3650 possible dates, so each is formatted once and
+        generating a date is a single choice from them.
+        """
+        date_format = column.patterns.get('date_format', '%Y-%m-%d')
         start_date = datetime.now() - timedelta(days=3650)
-        end_date = datetime.now()
-        
-        time_between = end_date - start_date
-        random_days = random.randrange(time_between.days)
-        random_date = start_date + timedelta(days=random_days)
+        dates = tuple(
+            (start_date + timedelta(days=days)).strftime(date_format)
+            for days in range(3650)
+        )
+        choices = self._random.choices
         
-        return random_date.strftime(date_format)
+        return lambda n: choices(dates, k=n)
     
-    def _generate_datetime(self, column: ColumnMetadata) -> str:
-        """Generate a random datetime value."""
-        datetime_format = column.patterns.get('datetime_format', '%Y-%m-%d %H:%M:%S')
+    def _make_datetime_generator(self, column: ColumnMetadata) -> Callable[[int], List[str]]:
+        """Build a generator of random datetimes within the last year.
         
-        # Generate datetime within the last year
+        When the format is a date followed by a simple clock format, the
+        date part comes from a table of the 366 days in range and the clock
+        part from _make_clock_formatter, instead of calling strftime.
+        """
+        datetime_format = column.patterns.get('datetime_format', '%Y-%m-%d %H:%M:%S')
         start_date = datetime.now() - timedelta(days=365)
-        end_date = datetime.now()
+        seconds_in_range = 365 * 24 * 60 * 60
+        rand = self._random.random
+        
+        date_part, hour, clock_part = datetime_format.partition('%H')
+        format_clock = self._make_clock_formatter(hour + clock_part)
+        
+        if format_clock is None or not self.DATE_ONLY_FORMAT.fullmatch(date_part):
+            return lambda n: [
+                (start_date + timedelta(seconds=int(rand() * seconds_in_range))).strftime(datetime_format)
+                for _ in range(n)
+            ]
+        
+        midnight = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        first_second = (start_date - midnight).seconds
+        days = tuple(
+            (midnight + timedelta(days=day)).strftime(date_part)
+            for day in range(366)
+        )
         
-        time_between = end_date - start_date
-        random_seconds = random.randrange(int(time_between.total_seconds()))
-        random_datetime = start_date + timedelta(seconds=random_seconds)
+        def generate_datetimes(n: int) -> List[str]:
+            values = []
+            
+            for _ in range(n):
+                day, second = divmod(first_second + int(rand() * seconds_in_range), 86400)
+                values.append(days[day] + format_clock(second))
+            
+            return values
         
-        return random_datetime.strftime(datetime_format)
+        return generate_datetimes
     
-    def _generate_time(self, column: ColumnMetadata) -> str:
-        """Generate a random time value."""
+    def _make_time_generator(self, column: ColumnMetadata) -> Callable[[int], List[str]]:
+        """Build a generator of random times of day."""
         time_format = column.patterns.get('time_format', '%H:%M:%S')
+        format_clock = self._make_clock_formatter(time_format)
+        rand = self._random.random
         
-        random_time = datetime.now().replace(
-            hour=random.randint(0, 23),
-            minute=random.randint(0, 59),
-            second=random.randint(0, 59)
-        )
+        if format_clock is not None:
+            return lambda n: [format_clock(int(rand() * 86400)) for _ in range(n)]
+        
+        midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
         
-        return random_time.strftime(time_format)
+        return lambda n: [
+            (midnight + timedelta(seconds=int(rand() * 86400))).strftime(time_format)
+            for _ in range(n)
+        ]
     
-    def _generate_email(self) -> str:
-        """Generate a random email address."""
-        username_length = random.randint(5, 12)
-        username = ''.join(random.choices(string.ascii_lowercase + string.digits, k=username_length))
+    def _make_clock_formatter(self, clock_format: str) -> Optional[Callable[[int], str]]:
+        """Build a formatter of seconds since midnight for simple clock formats.
         
-        domains = ['example.com', 'test.com', 'demo.com', 'sample.org']
-        domain = random.choice(domains)
+        '%H:%M:%S' and '%H:%M' are built from a table of two-digit strings,
+        which is several times faster than datetime.strftime.
         
-        return f"{username}@{domain}"
-    
-    def _generate_phone(self) -> str:
-        """Generate a random phone number."""
-        formats = [
-            lambda: f"{random.randint(100, 999)}-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-            lambda: f"({random.randint(100, 999)}) {random.randint(100, 999)}-{random.randint(1000, 9999)}",
-            lambda: f"{random.randint(1000000000, 9999999999)}",
-        ]
+        Args:
+            clock_format: strftime format of the time of day.
+        
+        Returns:
+            Function formatting seconds since midnight, or None if the
+            format needs strftime.
+        """
+        digits = self.TWO_DIGITS
         
-        return random.choice(formats)()
+        if clock_format == '%H:%M:%S':
+            return lambda s: f"{digits[s // 3600]}:{digits[s // 60 % 60]}:{digits[s % 60]}"
+        
+        if clock_format == '%H:%M':
+            return lambda s: f"{digits[s // 3600]}:{digits[s // 60 % 60]}"
+        
+        return None
     
-    def _generate_url(self) -> str:
-        """Generate a random URL."""
-        protocols = ['http', 'https']
-        domains = ['example.com', 'test.com', 'demo.org', 'sample.net']
-        paths = ['', '/page', '/resource', '/api/v1', '/docs']
+    def _make_email_generator(self) -> Callable[[int], List[str]]:
+        """Build a generator of random email addresses."""
+        characters = string.ascii_lowercase + string.digits
+        lengths = range(5, 13)
+        domains = self.EMAIL_DOMAINS
+        choices = self._random.choices
+        
+        def generate_emails(n: int) -> List[str]:
+            # Draw the characters of all usernames at once and slice them up
+            username_lengths = choices(lengths, k=n)
+            pool = ''.join(choices(characters, k=sum(username_lengths)))
+            emails = []
+            pos = 0
+            
+            for length, domain in zip(username_lengths, choices(domains, k=n)):
+                emails.append(f"{pool[pos:pos + length]}@{domain}")
+                pos += length
+            
+            return emails
         
-        protocol = random.choice(protocols)
-        domain = random.choice(domains)
-        path = random.choice(paths)
+        return generate_emails
+    
+    def _make_phone_generator(self) -> Callable[[int], List[str]]:
+        """Build a generator of random phone numbers in one of three formats."""
+        formats = ('%d-%d-%d', '(%d) %d-%d', '%d%d%d')
+        rand = self._random.random
+        choices = self._random.choices
+        
+        return lambda n: [
+            phone_format % (
+                100 + int(rand() * 900),
+                100 + int(rand() * 900),
+                1000 + int(rand() * 9000)
+            )
+            for phone_format in choices(formats, k=n)
+        ]
+    
+    def _url_pool(self) -> Tuple[str, ...]:
+        """Build every URL that can be generated.
         
-        return f"{protocol}://{domain}{path}"
+        Every combination of protocol, domain and path is equally likely, so
+        generating a URL is a single choice from this pool.
+        """
+        return tuple(
+            f"{protocol}://{domain}{path}"
+            for protocol in self.URL_PROTOCOLS
+            for domain in self.URL_DOMAINS
+            for path in self.URL_PATHS
+        )
     
-    def _generate_string(self, column: ColumnMetadata) -> str:
-        """Generate a random string value."""
+    def _make_string_generator(self, column: ColumnMetadata) -> Callable[[int], List[str]]:
+        """Build a generator of random strings of words."""
         # Use observed length characteristics
         if column.min_length and column.max_length:
-            target_length = random.randint(column.min_length, column.max_length)
+            min_length, max_length = column.min_length, column.max_length
         else:
-            target_length = random.randint(5, 50)
-        
-        # Generate words to fill the target length
-        words = []
-        current_length = 0
+            min_length, max_length = 5, 50
         
-        while current_length < target_length:
-            word_length = random.randint(3, 10)
-            word = ''.join(random.choices(string.ascii_letters, k=word_length))
-            words.append(word)
-            current_length += word_length + 1  # +1 for space
+        letters = string.ascii_letters
+        randint = self._random.randint
+        choices = self._random.choices
         
-        result = ' '.join(words)
-        
-        # Trim to exact length if needed
-        if len(result) > target_length:
-            result = result[:target_length].strip()
+        def generate_string() -> str:
+            target_length = randint(min_length, max_length)
+            
+            # Pick word lengths to fill the target length
+            word_lengths = []
+            current_length = 0
+            
+            while current_length < target_length:
+                word_length = randint(3, 10)
+                word_lengths.append(word_length)
+                current_length += word_length + 1  # +1 for space
+            
+            # Draw all letters at once and split them into words
+            pool = ''.join(choices(letters, k=current_length))
+            words = []
+            pos = 0
+            
+            for word_length in word_lengths:
+                words.append(pool[pos:pos + word_length])
+                pos += word_length
+            
+            result = ' '.join(words)
+            
+            # Trim to exact length if needed
+            if len(result) > target_length:
+                result = result[:target_length].strip()
+            
+            return result
         
-        return result
+        return lambda n: [generate_string() for _ in range(n)]
 
 
 class ConfigurationComparator:
@@ -1033,8 +1880,18 @@ class ConfigurationComparator:
     
     This class analyzes multiple CSV configurations to find patterns, shared
     structures, and opportunities for test case reuse.
+    
+    find_similar_configs() keeps a cache file in the configuration directory
+    with the comparison-relevant fields of every configuration it has read,
+    so repeated runs only re-parse files whose size or mtime changed. Each
+    signature is also stored as a hash, and configurations with the same
+    hash are only compared once.
     """
     
+    # Name of the per-directory cache of configuration signatures
+    CACHE_FILENAME = '.compare_cache'
+    CACHE_VERSION = 2
+    
     @staticmethod
     def compare_configs(
         config1: CSVConfiguration,
@@ -1144,25 +2001,179 @@ class ConfigurationComparator:
         if not config_dir.exists():
             return []
         
-        similar_configs = []
+        cache_path = config_dir / ConfigurationComparator.CACHE_FILENAME
+        cached_entries = ConfigurationComparator._load_cache(cache_path)
+        entries: Dict[str, Dict[str, Any]] = {}
         
-        # Search for JSON configuration files
-        for config_file in config_dir.glob('*.json'):
-            try:
-                other_config = CSVConfiguration.load(config_file)
+        # Search for JSON configuration files, re-parsing only changed ones
+        with os.scandir(config_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                if not dir_entry.name.endswith('.json') or not dir_entry.is_file():
+                    continue
                 
-                comparison = ConfigurationComparator.compare_configs(config, other_config)
+                stat = dir_entry.stat()
+                cached = cached_entries.get(dir_entry.name)
+                if (cached is not None
+                        and cached['mtime_ns'] == stat.st_mtime_ns
+                        and cached['size'] == stat.st_size):
+                    entries[dir_entry.name] = cached
+                    continue
                 
-                if comparison['overall_similarity'] >= threshold:
-                    similar_configs.append((
-                        str(config_file),
-                        comparison['overall_similarity']
-                    ))
-            except Exception:
-                # Skip files that can't be loaded as configurations
+                try:
+                    signature = ConfigurationComparator._config_signature(
+                        CSVConfiguration.load(dir_entry.path)
+                    )
+                    signature_hash = ConfigurationComparator._signature_hash(signature)
+                except Exception:
+                    # Remember files that can't be loaded as configurations
+                    signature = None
+                    signature_hash = None
+                
+                entries[dir_entry.name] = {
+                    'mtime_ns': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    'signature': signature,
+                    'signature_hash': signature_hash,
+                }
+        
+        if entries != cached_entries:
+            ConfigurationComparator._save_cache(cache_path, entries)
+        
+        similar_configs = []
+        
+        # The signature holds every field compare_configs() reads, so equal
+        # hashes give equal scores; copies of the same configuration (e.g.
+        # re-saved runs of one file) are only compared once
+        scores: Dict[str, float] = {}
+        
+        for filename, entry in entries.items():
+            if entry['signature'] is None:
                 continue
+            
+            score = scores.get(entry['signature_hash'])
+            if score is None:
+                other_config = ConfigurationComparator._config_from_signature(entry['signature'])
+                comparison = ConfigurationComparator.compare_configs(config, other_config)
+                score = scores[entry['signature_hash']] = comparison['overall_similarity']
+            
+            if score >= threshold:
+                similar_configs.append((str(config_dir / filename), score))
         
         # Sort by similarity score (descending)
         similar_configs.sort(key=lambda x: x[1], reverse=True)
         
         return similar_configs
+    
+    @staticmethod
+    def _config_signature(config: CSVConfiguration) -> Dict[str, Any]:
+        """Extract the fields compare_configs() uses from a configuration.
+        
+        Args:
+            config: Configuration to summarize.
+            
+        Returns:
+            JSON-serializable signature of the configuration.
+        """
+        return {
+            'delimiter': config.delimiter,
+            'columns': [
+                [col.name, col.data_type.value, col.nullable,
+                 col.null_percentage, col.unique_count, col.total_count]
+                for col in config.columns
+            ],
+        }
+    
+    @staticmethod
+    def _signature_hash(signature: Dict[str, Any]) -> str:
+        """Hash a configuration signature.
+        
+        Args:
+            signature: Signature created by _config_signature().
+            
+        Returns:
+            Hex digest that is equal for equal signatures.
+        """
+        canonical = json.dumps(signature, sort_keys=True, separators=(',', ':'))
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _config_from_signature(signature: Dict[str, Any]) -> CSVConfiguration:
+        """Rebuild a minimal configuration from a cached signature.
+        
+        Args:
+            signature: Signature created by _config_signature().
+            
+        Returns:
+            CSVConfiguration carrying only the fields used for comparison.
+        """
+        columns = [
+            ColumnMetadata(
+                name=name,
+                index=index,
+                data_type=DataType(data_type),
+                nullable=nullable,
+                null_percentage=null_percentage,
+                unique_count=unique_count,
+                total_count=total_count
+            )
+            for index, (name, data_type, nullable, null_percentage,
+                        unique_count, total_count) in enumerate(signature['columns'])
+        ]
+        
+        return CSVConfiguration(
+            source_file='',
+            delimiter=signature['delimiter'],
+            quotechar='"',
+            has_header=True,
+            encoding='utf-8',
+            line_count=0,
+            columns=columns,
+            analysis_timestamp='cached'
+        )
+    
+    @staticmethod
+    def _load_cache(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+        """Load cached configuration signatures.
+        
+        Args:
+            cache_path: Path to the cache file.
+            
+        Returns:
+            Mapping of configuration file name to cache entry, empty if the
+            cache is missing, unreadable or from another cache version.
+        """
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if (not isinstance(data, dict)
+                or data.get('version') != ConfigurationComparator.CACHE_VERSION):
+            return {}
+        
+        return data.get('entries', {})
+    
+    @staticmethod
+    def _save_cache(cache_path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Write cached configuration signatures, ignoring write failures.
+        
+        Args:
+            cache_path: Path to the cache file.
+            entries: Mapping of configuration file name to cache entry.
+        """
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {'version': ConfigurationComparator.CACHE_VERSION, 'entries': entries},
+                    f
+                )
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # The cache is an optimization; a read-only directory still works
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
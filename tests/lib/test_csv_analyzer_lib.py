@@ -0,0 +1,650 @@
+"""Tests for the CSV analyzer library internals."""
+
+import codecs
+import csv
+import dataclasses
+import datetime
+import json
+import random
+import statistics
+from pathlib import Path
+
+import pytest
+
+import lib.csv_analyzer_lib as csv_analyzer_lib
+from lib.csv_analyzer_lib import (
+    ColumnMetadata,
+    ConfigurationComparator,
+    CSVAnalyzer,
+    CSVConfiguration,
+    DataGenerator,
+    DataType,
+    DataTypeDetector,
+    HyperLogLog,
+)
+
+
+def _write_csv(path: Path, rows, **kwargs) -> Path:
+    """Write rows to a CSV file and return its path."""
+    with open(path, 'w', newline='') as f:
+        csv.writer(f, **kwargs).writerows(rows)
+    return path
+
+
+def _dates(count: int, start: int = 0):
+    """Return count distinct dates as datetime.date objects."""
+    first = datetime.date(2023, 1, 1)
+    return [first + datetime.timedelta(days=i) for i in range(start, start + count)]
+
+
+def _analysis_summary(config):
+    """Reduce a configuration to the fields that must be reader-independent."""
+    return (
+        config.delimiter,
+        config.has_header,
+        config.line_count,
+        [
+            (col.name, col.data_type, col.null_percentage,
+             col.unique_count, col.min_length, col.max_length)
+            for col in config.columns
+        ],
+    )
+
+
+# Pattern keys recording the format of each temporal type
+FORMAT_KEYS = {
+    DataType.DATETIME: 'datetime_format',
+    DataType.DATE: 'date_format',
+    DataType.TIME: 'time_format',
+}
+
+
+def _reference_detect_type(values):
+    """Detect a type by checking every value against every type on its own.
+
+    The straightforward version of DataTypeDetector.detect_type(), without
+    pruning, early stops or caching, that detection must agree with.
+    """
+    non_null = [v for v in values if not DataTypeDetector.is_null(v)]
+    if not non_null:
+        return DataType.EMPTY, {}
+    checks = {
+        DataType.EMAIL: DataTypeDetector.EMAIL_PATTERN.match,
+        DataType.PHONE: DataTypeDetector.PHONE_PATTERN.match,
+        DataType.URL: DataTypeDetector.URL_PATTERN.match,
+        DataType.DATETIME: DataTypeDetector._check_datetime.__wrapped__,
+        DataType.DATE: DataTypeDetector._check_date.__wrapped__,
+        DataType.TIME: DataTypeDetector._check_time.__wrapped__,
+        DataType.BOOLEAN: lambda v: v.lower() in DataTypeDetector.BOOLEAN_VALUES,
+        DataType.DECIMAL: DataTypeDetector._is_decimal,
+        DataType.INTEGER: DataTypeDetector._is_integer,
+        DataType.FLOAT: DataTypeDetector._is_float,
+    }
+    # Dicts keep insertion order, so this is also the priority order
+    for data_type, check in checks.items():
+        matches = [check(v.strip()) for v in non_null]
+        if sum(map(bool, matches)) / len(non_null) >= 0.8:
+            patterns = {}
+            if data_type in FORMAT_KEYS:
+                patterns[FORMAT_KEYS[data_type]] = next(m for m in matches if m)
+            if data_type in (DataType.DECIMAL, DataType.INTEGER, DataType.FLOAT):
+                patterns.update(DataTypeDetector._compute_numeric_stats(non_null))
+            return data_type, patterns
+    enum_values = DataTypeDetector._collect_enum_values(non_null)
+    if enum_values is not None and len(enum_values) <= len(non_null) * 0.5:
+        return DataType.ENUM, {'enum_values': enum_values}
+    return DataType.STRING, DataTypeDetector._compute_string_stats(non_null)
+
+
+def _assert_matches_reference(values, expected):
+    """Check detect_type() against the expected type and the reference."""
+    data_type, patterns = DataTypeDetector.detect_type(values)
+    # Formats of types that lost are recorded only until they are ruled out
+    patterns = {
+        key: value for key, value in patterns.items()
+        if key not in FORMAT_KEYS.values() or key == FORMAT_KEYS.get(data_type)
+    }
+
+    assert data_type == expected
+    assert (data_type, patterns) == _reference_detect_type(values)
+
+
+class TestReadColumns:
+    """Tests for reading CSV files into per-column value lists."""
+
+    def test_ragged_rows_are_padded(self, tmp_path: Path) -> None:
+        """Short rows are padded and extra cells ignored."""
+        path = _write_csv(
+            tmp_path / "ragged.csv",
+            [['a', 'b', 'c'], ['1', '2'], ['3', '4', '5', '6']]
+        )
+        analyzer = CSVAnalyzer(path)
+
+        columns = analyzer._read_columns(csv.excel())
+
+        assert columns == [['a', '1', '3'], ['b', '2', '4'], ['c', '', '5']]
+
+    def test_row_appender_fills_columns(self) -> None:
+        """The generated appender adds each cell to its column."""
+        columns = [['a'], ['b'], ['c']]
+        append_row = CSVAnalyzer._make_row_appender(columns)
+
+        append_row(['1', '2', '3'])
+        append_row(['4', '5', '6'])
+
+        assert columns == [['a', '1', '4'], ['b', '2', '5'], ['c', '3', '6']]
+
+    @pytest.mark.parametrize("sample_size", [None, 10])
+    @pytest.mark.parametrize("bom", [False, True])
+    def test_arrow_reader_matches_csv_module(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        sample_size,
+        bom
+    ) -> None:
+        """The pyarrow reader produces the same analysis as the csv module."""
+        pytest.importorskip("pyarrow")
+
+        rows = [['id', 'label', 'amount']]
+        rows += [[str(i), f'item "{i % 7}", x', f"{i * 1.25:.2f}"] for i in range(200)]
+        path = _write_csv(tmp_path / "data.csv", rows)
+        if bom:
+            path.write_bytes(codecs.BOM_UTF8 + path.read_bytes())
+
+        analyzer = CSVAnalyzer(path, sample_size=sample_size)
+        assert analyzer._read_columns_arrow(analyzer._detect_dialect()) is not None
+        arrow_result = _analysis_summary(analyzer.analyze())
+
+        monkeypatch.setattr(csv_analyzer_lib, 'pa_csv', None)
+        csv_result = _analysis_summary(CSVAnalyzer(path, sample_size=sample_size).analyze())
+
+        assert arrow_result == csv_result
+        assert [name for name, *_ in csv_result[3]] == ['id', 'label', 'amount']
+
+    @pytest.mark.parametrize("encoding", ['utf-8', 'UTF8', 'utf-8-sig'])
+    def test_byte_order_mark_is_not_part_of_header(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        encoding
+    ) -> None:
+        """A UTF-8 byte order mark is dropped by the csv module reader."""
+        monkeypatch.setattr(csv_analyzer_lib, 'pa_csv', None)
+        path = tmp_path / "excel.csv"
+        path.write_bytes(codecs.BOM_UTF8 + b'id,name\r\n1,a\r\n2,b\r\n3,c\r\n')
+
+        config = CSVAnalyzer(path, encoding=encoding).analyze()
+
+        assert [col.name for col in config.columns] == ['id', 'name']
+        assert config.encoding == encoding
+
+    def test_sample_without_multiline_values(self, tmp_path: Path) -> None:
+        """The newline fast path reads exactly the sampled rows."""
+        pytest.importorskip("pyarrow")
+
+        rows = [['id', 'name']] + [[str(i), f'name {i}'] for i in range(500)]
+        path = _write_csv(tmp_path / "data.csv", rows)
+
+        fast = CSVAnalyzer(path, sample_size=20, values_may_contain_newlines=False)
+        assert fast._sample_end_offset(21) == len(
+            ''.join(f'{",".join(row)}\r\n' for row in rows[:21])
+        )
+        assert _analysis_summary(fast.analyze()) == _analysis_summary(
+            CSVAnalyzer(path, sample_size=20).analyze()
+        )
+
+
+class TestParallelAnalysis:
+    """Tests for analyzing columns in worker processes."""
+
+    def test_workers_match_serial_analysis(self, tmp_path: Path) -> None:
+        """Parallel column analysis gives the same result as serial."""
+        rows = [['id', 'price', 'status', 'note']]
+        rows += [
+            [str(i), f"{i * 0.75:.2f}", ['open', 'closed'][i % 2], f'note {i}']
+            for i in range(300)
+        ]
+        path = _write_csv(tmp_path / "wide.csv", rows)
+
+        serial = CSVAnalyzer(path).analyze()
+        parallel = CSVAnalyzer(path, workers=2).analyze()
+
+        assert _analysis_summary(parallel) == _analysis_summary(serial)
+        assert [col.index for col in parallel.columns] == [0, 1, 2, 3]
+
+
+class TestTypeDetection:
+    """Tests for detect_type() against the per-type reference detection."""
+
+    @pytest.mark.parametrize("matches, total", [
+        (80, 100), (79, 100), (160, 200), (159, 200),
+    ])
+    @pytest.mark.parametrize("misses_first", [False, True])
+    def test_threshold(self, matches, total, misses_first) -> None:
+        """A type needs 80% of the values, wherever the misses are."""
+        hits = [str(i * 7) for i in range(matches)]
+        misses = [f'word {i}' for i in range(total - matches)]
+        values = misses + hits if misses_first else hits + misses
+        expected = DataType.INTEGER if matches / total >= 0.8 else DataType.STRING
+
+        _assert_matches_reference(values, expected)
+
+    # Lengths around the 64 values after which ruled-out types are dropped
+    @pytest.mark.parametrize("length", [1, 10, 63, 64, 65, 200])
+    @pytest.mark.parametrize("make_value, expected", [
+        (lambda i: f'user{i}@example.com', DataType.EMAIL),
+        (lambda i: f'{i * 1.5:.2f}', DataType.DECIMAL),
+        (lambda i: f'{i}e3', DataType.FLOAT),
+        (lambda i: f'https://example.com/{i}', DataType.URL),
+    ])
+    def test_column_length(self, length, make_value, expected) -> None:
+        """Short and long columns are detected the same way."""
+        values = [make_value(i) for i in range(length)]
+
+        _assert_matches_reference(values, expected)
+
+    @pytest.mark.parametrize("values, expected", [
+        # Booleans are also integers and floats
+        (['1', '0', '0', '1'] * 30, DataType.BOOLEAN),
+        # Ten digits are a phone number before an integer
+        ([str(5551234567 + i) for i in range(100)], DataType.PHONE),
+        # Compact dates are also integers
+        ([f'202401{day:02d}' for day in range(1, 29)] * 3, DataType.DATE),
+        # Decimals are also floats
+        ([f'{i}.25' for i in range(100)], DataType.DECIMAL),
+        # Integers are also floats
+        ([str(i) for i in range(100)], DataType.INTEGER),
+        # Enough integers but too few booleans among them
+        (['1', '0'] * 10 + [str(i) for i in range(2, 82)], DataType.INTEGER),
+    ])
+    def test_priority_between_matching_types(self, values, expected) -> None:
+        """Values matching several types get the highest priority one."""
+        _assert_matches_reference(values, expected)
+
+    def test_random_columns_match_reference(self) -> None:
+        """Randomly mixed columns agree with the reference detection."""
+        rng = random.Random(42)
+        pool = [
+            '1', '0', 'yes', '42', '-7', '1,234', '3.5', '$9.99', '1e5',
+            'a@b.com', '555-123-4567', 'http://x.org', '2024-01-31',
+            '2024-01-31 10:00:00', '10:30', 'text', '', 'NULL',
+        ]
+        for _ in range(200):
+            main_values = rng.sample(pool, 2)
+            values = [
+                rng.choice(main_values) if rng.random() < 0.85 else rng.choice(pool)
+                for _ in range(rng.randint(1, 300))
+            ]
+            data_type, _ = _reference_detect_type(values)
+
+            _assert_matches_reference(values, data_type)
+
+
+class TestTemporalDetection:
+    """Tests for the date, datetime and time checks."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ('2024-02-29', '%Y-%m-%d'),
+        ('2023-02-29', None),
+        ('03/15/2024', '%m/%d/%Y'),
+        ('hello', None),
+    ])
+    def test_check_date(self, value, expected) -> None:
+        """Dates are recognized with the matching format."""
+        assert DataTypeDetector._check_date(value) == expected
+
+    @pytest.mark.parametrize("value, expected", [
+        ('2024-06-30 23:59:59', '%Y-%m-%d %H:%M:%S'),
+        ('2024-06-30T23:59:59', '%Y-%m-%dT%H:%M:%S'),
+        # Accepted by strptime but not by fromisoformat
+        ('2024-06-30  23:59:59', '%Y-%m-%d %H:%M:%S'),
+        ('2024-06-30 24:00:00', None),
+    ])
+    def test_check_datetime(self, value, expected) -> None:
+        """ISO datetimes take the fast path without changing the result."""
+        assert DataTypeDetector._check_datetime(value) == expected
+
+    # Mixed columns where one type reaches 80% long before the column ends,
+    # so its checks stop early, in either order; the three-part columns are
+    # just under 80% at the check after 256 values and only reach it later
+    @pytest.mark.parametrize("segments, expected", [
+        ([('datetime', 170), ('date', 30)], DataType.DATETIME),
+        ([('date', 30), ('datetime', 170)], DataType.DATETIME),
+        ([('date', 160), ('datetime', 40)], DataType.DATE),
+        ([('datetime', 40), ('date', 160)], DataType.DATE),
+        ([('date', 100), ('datetime', 100)], DataType.STRING),
+        ([('time', 180), ('datetime', 20)], DataType.TIME),
+        ([('date', 190), ('us_date', 10)], DataType.DATE),
+        ([('us_date', 10), ('date', 190)], DataType.DATE),
+        ([('datetime', 250), ('date', 6), ('datetime', 64)], DataType.DATETIME),
+        ([('date', 250), ('time', 6), ('date', 64)], DataType.DATE),
+        ([('time', 250), ('date', 6), ('time', 64)], DataType.TIME),
+    ])
+    def test_mixed_temporal_column(self, segments, expected) -> None:
+        """Stopping a decided type early does not change the detected type."""
+        formats = {
+            'date': '%Y-%m-%d',
+            'us_date': '%m/%d/%Y',
+            'datetime': '%Y-%m-%d %H:%M:%S',
+            'time': '%H:%M:%S',
+        }
+        values = []
+        for kind, count in segments:
+            for day in _dates(count, start=len(values)):
+                moment = datetime.datetime.combine(day, datetime.time(len(values) % 24, 30))
+                values.append(moment.strftime(formats[kind]))
+
+        _assert_matches_reference(values, expected)
+
+    def test_cached_checks_match_uncached(self) -> None:
+        """Repeated values are checked once and give the same results."""
+        values = [day.isoformat() for day in _dates(50)] * 10 + ['2023-02-29', 'soon'] * 5
+        DataTypeDetector._check_date.cache_clear()
+
+        first = DataTypeDetector.detect_type(values)
+        second = DataTypeDetector.detect_type(values)
+
+        assert first == second == _reference_detect_type(values)
+        assert first[0] == DataType.DATE
+        assert DataTypeDetector._check_date.cache_info().misses <= 51
+        for value in set(values):
+            assert (DataTypeDetector._check_date(value)
+                    == DataTypeDetector._check_date.__wrapped__(value))
+
+
+class TestNullDetection:
+    """Tests for null value handling."""
+
+    def test_remove_nulls_matches_is_null(self) -> None:
+        """remove_nulls keeps exactly the values is_null rejects."""
+        values = ['1', '', '  ', 'NULL', ' n/a ', '#N/A', 'NaN', 'none', 'nah', '0', ' x ']
+
+        assert DataTypeDetector.remove_nulls(values) == [
+            v for v in values if not DataTypeDetector.is_null(v)
+        ]
+        assert DataTypeDetector.remove_nulls(values) == ['1', 'nah', '0', ' x ']
+
+
+class TestEnumDetection:
+    """Tests for enum detection on string columns."""
+
+    def test_low_cardinality_column_is_enum(self) -> None:
+        """A column with a few repeated labels is detected as an enum."""
+        values = ['red', 'green', 'blue'] * 50
+
+        data_type, patterns = DataTypeDetector.detect_type(values)
+
+        assert data_type.value == 'enum'
+        assert patterns['enum_values'] == {'red', 'green', 'blue'}
+
+    def test_collection_stops_above_limit(self) -> None:
+        """High-cardinality columns are rejected without a full set."""
+        values = [f'label {i}' for i in range(10000)]
+
+        assert DataTypeDetector._collect_enum_values(values) is None
+        assert DataTypeDetector.detect_type(values)[0].value == 'string'
+
+
+class TestNumericStats:
+    """Tests for numeric column statistics."""
+
+    @pytest.mark.parametrize("values", [
+        ['1', '2', '3', '4'],
+        ['$1,000.50', '2.25', '-3', '7', '11.125'],
+        ['42'],
+    ])
+    def test_matches_statistics_module(self, values) -> None:
+        """Stats agree with the statistics module reference values."""
+        stats = DataTypeDetector._compute_numeric_stats(values)
+        numbers = [
+            float(v.replace('$', '').replace(',', '')) for v in values
+        ]
+
+        assert stats['min'] == min(numbers)
+        assert stats['max'] == max(numbers)
+        assert stats['mean'] == pytest.approx(statistics.mean(numbers))
+        assert stats['median'] == statistics.median(numbers)
+        expected_stdev = statistics.stdev(numbers) if len(numbers) > 1 else 0.0
+        assert stats['stdev'] == pytest.approx(expected_stdev)
+
+
+class TestConfigurationSerialization:
+    """Tests for saving and loading configurations."""
+
+    @staticmethod
+    def _asdict_reference(column: ColumnMetadata):
+        """Serialize a column the way to_dict() and save() did with asdict()."""
+        def convert_sets(obj):
+            if isinstance(obj, dict):
+                return {k: convert_sets(v) for k, v in obj.items()}
+            if isinstance(obj, list):
+                return [convert_sets(item) for item in obj]
+            if isinstance(obj, set):
+                return sorted(obj)
+            return obj
+
+        result = dataclasses.asdict(column)
+        result['data_type'] = column.data_type.value
+        return convert_sets(result)
+
+    @pytest.fixture
+    def columns(self):
+        return [
+            ColumnMetadata(
+                name='status', index=0, data_type=DataType.ENUM, nullable=True,
+                null_percentage=0.25, unique_count=3, total_count=8,
+                sample_values=['open', 'closed'],
+                patterns={'enum_values': {'open', 'closed', 'pending'}},
+                statistics={'seen': {'b', 'a'}, 'groups': [{'y', 'x'}, 'z'],
+                            'nested': {'inner': {'2', '1'}}},
+                enum_values={'open', 'closed', 'pending'},
+                max_length=7, min_length=4,
+            ),
+            ColumnMetadata(
+                name='amount', index=1, data_type=DataType.DECIMAL,
+                total_count=8, sample_values=['1.50'],
+                patterns={'date_format': '%Y-%m-%d'},
+                statistics={'min': 1.5, 'max': 9.25, 'mean': 4.0},
+            ),
+            ColumnMetadata(name='empty', index=2, data_type=DataType.EMPTY),
+        ]
+
+    def test_to_dict_matches_asdict(self, columns) -> None:
+        """to_dict() gives what asdict() plus set conversion gave."""
+        for column in columns:
+            result = column.to_dict()
+
+            assert result == self._asdict_reference(column)
+            assert list(result) == [f.name for f in dataclasses.fields(ColumnMetadata)]
+
+    def test_save_load_round_trip(self, tmp_path: Path, columns) -> None:
+        """A saved configuration loads back equal to the original."""
+        config = CSVConfiguration(
+            source_file='data.csv', delimiter=',', quotechar='"',
+            has_header=True, encoding='utf-8', line_count=8, columns=columns,
+        )
+        path = tmp_path / 'config.json'
+
+        config.save(path)
+        saved = json.loads(path.read_text(encoding='utf-8'))
+        loaded = CSVConfiguration.load(path)
+
+        assert saved['columns'] == [self._asdict_reference(c) for c in columns]
+        assert loaded.columns[0].enum_values == {'open', 'closed', 'pending'}
+        assert loaded.columns[0].patterns['enum_values'] == {'open', 'closed', 'pending'}
+        assert [c.to_dict() for c in loaded.columns] == saved['columns']
+        assert dataclasses.replace(loaded, columns=[]) == dataclasses.replace(config, columns=[])
+
+
+class TestUniqueCounting:
+    """Tests for exact and approximate distinct counting."""
+
+    def test_hyperloglog_estimate_is_close(self) -> None:
+        """The sketch estimate stays within a few percent of the truth."""
+        sketch = HyperLogLog()
+        sketch.update(f"value-{i}" for i in range(20000))
+
+        assert sketch.count() == pytest.approx(20000, rel=0.05)
+
+    def test_hyperloglog_merge(self) -> None:
+        """Merged sketches estimate the size of the union."""
+        first, second = HyperLogLog(), HyperLogLog()
+        first.update(str(i) for i in range(0, 6000))
+        second.update(str(i) for i in range(3000, 9000))
+
+        first.merge(second)
+
+        assert first.count() == pytest.approx(9000, rel=0.05)
+
+    def test_count_unique_switches_to_sketch(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Columns above the exact limit report an estimated count."""
+        path = _write_csv(tmp_path / "ids.csv", [['id']])
+        analyzer = CSVAnalyzer(path)
+        monkeypatch.setattr(CSVAnalyzer, 'EXACT_UNIQUE_LIMIT', 100)
+        values = [str(i % 3000) for i in range(6000)]
+
+        count, unique_values, samples = analyzer._count_unique(values)
+
+        assert unique_values is None
+        assert count == pytest.approx(3000, rel=0.05)
+        assert len(samples) == 10
+
+    def test_count_unique_is_exact_below_limit(self, tmp_path: Path) -> None:
+        """Small columns keep the exact set of unique values."""
+        path = _write_csv(tmp_path / "ids.csv", [['id']])
+        analyzer = CSVAnalyzer(path)
+
+        count, unique_values, samples = analyzer._count_unique(['a', 'b', 'a', 'c'])
+
+        assert count == 3
+        assert unique_values == {'a', 'b', 'c'}
+        assert sorted(samples) == ['a', 'b', 'c']
+
+
+class TestFindSimilarConfigs:
+    """Tests for the cached configuration comparison."""
+
+    @pytest.fixture
+    def config(self, tmp_path: Path):
+        """Analyze a small CSV and return its configuration."""
+        rows = [['id', 'name']] + [[str(i), f'name{i}'] for i in range(30)]
+        return CSVAnalyzer(_write_csv(tmp_path / "source.csv", rows)).analyze()
+
+    def test_results_are_cached_and_refreshed(self, tmp_path: Path, config) -> None:
+        """Unchanged files come from the cache; changed files are re-read."""
+        config_dir = tmp_path / "configs"
+        config.save(config_dir / "same_config.json")
+        (config_dir / "broken.json").write_text("not json")
+
+        first = ConfigurationComparator.find_similar_configs(config, config_dir)
+        second = ConfigurationComparator.find_similar_configs(config, config_dir)
+
+        assert (config_dir / ConfigurationComparator.CACHE_FILENAME).exists()
+        assert first == second == [(str(config_dir / "same_config.json"), 1.0)]
+
+        # Rewrite the file with a different structure
+        config.columns = config.columns[:1]
+        config.delimiter = ';'
+        config.save(config_dir / "same_config.json")
+
+        assert ConfigurationComparator.find_similar_configs(config, config_dir) == [
+            (str(config_dir / "same_config.json"), 1.0)
+        ]
+        assert ConfigurationComparator.find_similar_configs(
+            CSVAnalyzer(tmp_path / "source.csv").analyze(), config_dir
+        ) == []
+
+    def test_identical_configs_are_compared_once(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        config
+    ) -> None:
+        """Configurations with the same signature share one comparison."""
+        config_dir = tmp_path / "configs"
+        for name in ("run1.json", "run2.json", "run3.json"):
+            config.save(config_dir / name)
+
+        calls = []
+        compare_configs = ConfigurationComparator.compare_configs
+        monkeypatch.setattr(
+            ConfigurationComparator,
+            'compare_configs',
+            lambda *args: calls.append(args) or compare_configs(*args)
+        )
+
+        results = ConfigurationComparator.find_similar_configs(config, config_dir)
+
+        assert len(calls) == 1
+        assert sorted(results) == [
+            (str(config_dir / name), 1.0)
+            for name in ("run1.json", "run2.json", "run3.json")
+        ]
+
+
+class TestDataGenerator:
+    """Tests for synthetic data generation."""
+
+    def test_seed_alone_determines_rows(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The same seed gives the same rows, whatever the global random state."""
+        rows = [['id', 'price', 'status', 'email']]
+        rows += [
+            [str(i), f"{i * 0.75:.2f}", ['open', 'closed', 'pending'][i % 3],
+             f'user{i}@example.com']
+            for i in range(100)
+        ]
+        config = CSVAnalyzer(_write_csv(tmp_path / "source.csv", rows)).analyze()
+        monkeypatch.setattr(DataGenerator, 'GENERATE_CHUNK_ROWS', 7)
+
+        first = DataGenerator(config, seed=5).generate_rows(20)
+        random_state = random.getstate()
+        random.seed(99)
+        second = DataGenerator(config, seed=5).generate_rows(20)
+        random.setstate(random_state)
+
+        assert first == second
+        assert len(first) == 20
+        assert all(len(row) == 4 for row in first)
+        assert {row[2] for row in first} <= {'open', 'closed', 'pending'}
+
+    def test_workers_do_not_change_output(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A seed gives the same file for any number of workers."""
+        rows = [['id', 'status']] + [[str(i), ['a', 'b'][i % 2]] for i in range(50)]
+        config = CSVAnalyzer(_write_csv(tmp_path / "source.csv", rows)).analyze()
+        monkeypatch.setattr(DataGenerator, 'GENERATE_CHUNK_ROWS', 10)
+
+        DataGenerator(config, seed=3).generate_csv(tmp_path / "one.csv", 45)
+        DataGenerator(config, seed=3, workers=2).generate_csv(tmp_path / "two.csv", 45)
+        DataGenerator(config, seed=3, workers=3).generate_csv(tmp_path / "three.csv", 45)
+
+        text = (tmp_path / "one.csv").read_text()
+        assert text == (tmp_path / "two.csv").read_text()
+        assert text == (tmp_path / "three.csv").read_text()
+        assert len(text.splitlines()) == 46
+
+    def test_parquet_output_is_typed(self, tmp_path: Path) -> None:
+        """Numeric columns are typed and empty values are nulls in Parquet."""
+        pa_parquet = pytest.importorskip("pyarrow.parquet")
+        rows = [['id', 'price', 'note']]
+        rows += [[str(i), f"{i * 0.5:.2f}", '' if i % 4 else f'n{i}'] for i in range(40)]
+        config = CSVAnalyzer(_write_csv(tmp_path / "source.csv", rows)).analyze()
+
+        DataGenerator(config, seed=1).generate_table_file(tmp_path / "out.parquet", 30)
+
+        table = pa_parquet.read_table(tmp_path / "out.parquet")
+        assert table.num_rows == 30
+        assert [str(t) for t in table.schema.types] == ['int64', 'double', 'string']
+        assert table.column('note').null_count > 0
@@ -0,0 +1,117 @@
+"""Tests for the analysis cache of the analyze_csv command-line tool."""
+
+import csv
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import analyze_csv
+from lib.csv_analyzer_lib import CSVAnalyzer
+
+
+def _write_csv(path: Path, rows: List[List[str]]) -> Path:
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows(rows)
+    return path
+
+
+@pytest.fixture
+def input_csv(tmp_path: Path) -> Path:
+    rows = [['id', 'name']] + [[str(i), f'name {i}'] for i in range(50)]
+    return _write_csv(tmp_path / "data.csv", rows)
+
+
+@pytest.fixture
+def analyze_calls(monkeypatch: pytest.MonkeyPatch) -> List[Path]:
+    """Record the file of every CSVAnalyzer.analyze() call."""
+    calls: List[Path] = []
+    original = CSVAnalyzer.analyze
+
+    def counting_analyze(self):
+        calls.append(self.filepath)
+        return original(self)
+
+    monkeypatch.setattr(CSVAnalyzer, 'analyze', counting_analyze)
+    return calls
+
+
+def _cache_entries(directory: Path) -> List[Path]:
+    return sorted((directory / '.analysis_cache').glob('*.json'))
+
+
+class TestAnalysisCache:
+    """Tests for reusing analyses of unchanged files."""
+
+    def test_unchanged_file_is_read_from_cache(
+        self, input_csv: Path, analyze_calls: List[Path]
+    ) -> None:
+        """A second run on the same file does not analyze it again."""
+        output = input_csv.parent / "config.json"
+
+        assert analyze_csv.analyze_csv_file(str(input_csv), str(output)) == 0
+        first = output.read_text()
+        assert analyze_csv.analyze_csv_file(str(input_csv), str(output)) == 0
+
+        assert len(analyze_calls) == 1
+        assert len(_cache_entries(input_csv.parent)) == 1
+        assert output.read_text() == first
+
+    def test_changed_file_replaces_cache_entry(
+        self, input_csv: Path, analyze_calls: List[Path]
+    ) -> None:
+        """A changed file is analyzed again and its old entry is removed."""
+        output = input_csv.parent / "config.json"
+        analyze_csv.analyze_csv_file(str(input_csv), str(output))
+        old_entries = _cache_entries(input_csv.parent)
+
+        _write_csv(input_csv, [['id', 'price']] + [[str(i), f'{i}.50'] for i in range(80)])
+        assert analyze_csv.analyze_csv_file(str(input_csv), str(output)) == 0
+
+        assert len(analyze_calls) == 2
+        new_entries = _cache_entries(input_csv.parent)
+        assert len(new_entries) == 1
+        assert new_entries != old_entries
+
+    def test_no_cache_option_always_analyzes(
+        self,
+        input_csv: Path,
+        analyze_calls: List[Path],
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """--no-cache neither reads nor writes the cache."""
+        output = input_csv.parent / "config.json"
+        analyze_csv.analyze_csv_file(str(input_csv), str(output))
+
+        argv = ['analyze_csv.py', str(input_csv), '-o', str(output), '--no-cache']
+        monkeypatch.setattr(sys, 'argv', argv)
+        assert analyze_csv.main() == 0
+        assert analyze_csv.main() == 0
+
+        assert len(analyze_calls) == 3
+        assert len(_cache_entries(input_csv.parent)) == 1
+
+    def test_failed_cache_write_does_not_fail_run(
+        self,
+        input_csv: Path,
+        analyze_calls: List[Path],
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An unwritable cache is treated as no cache."""
+        output = input_csv.parent / "config.json"
+        original_save = analyze_csv.CSVConfiguration.save
+
+        def save(self, filepath):
+            if '.analysis_cache' in str(filepath):
+                raise PermissionError(f"read-only: {filepath}")
+            original_save(self, filepath)
+
+        monkeypatch.setattr(analyze_csv.CSVConfiguration, 'save', save)
+
+        assert analyze_csv.analyze_csv_file(str(input_csv), str(output)) == 0
+        assert analyze_csv.analyze_csv_file(str(input_csv), str(output)) == 0
+
+        assert output.exists()
+        assert len(analyze_calls) == 2
+        assert _cache_entries(input_csv.parent) == []
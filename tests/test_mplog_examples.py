@@ -0,0 +1,133 @@
+"""Tests for the batched queue logging in examples/mplog_examples.py."""
+
+import logging
+import multiprocessing
+import sys
+from pathlib import Path
+from queue import Empty, Full
+from typing import Iterator, List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "examples"))
+
+import mplog_examples  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def restore_root_logger() -> Iterator[None]:
+    """Undo the queue handler setup_logging() installs on the root logger."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        if handler not in handlers:
+            handler.close()
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+class FlakyQueue:
+    """A queue whose first put and get fail as if it were full or empty.
+
+    Puts of a batch longer than max_batch always fail, like a faster-fifo
+    message bigger than the whole queue.
+    """
+
+    def __init__(self, max_batch: int = 1000) -> None:
+        self.items: List[object] = []
+        self.max_batch = max_batch
+        self.put_failures = 1
+        self.get_failures = 1
+
+    def put(self, item: object) -> None:
+        if self.put_failures or len(item) > self.max_batch:
+            self.put_failures = 0
+            raise Full
+        self.items.append(item)
+
+    def get(self, block: bool) -> object:
+        if self.get_failures:
+            self.get_failures -= 1
+            raise Empty
+        return self.items.pop(0)
+
+
+queue_kinds = [
+    pytest.param(False, id="multiprocessing"),
+    pytest.param(True, id="faster-fifo", marks=pytest.mark.skipif(
+        mplog_examples.FasterFifoQueue is None, reason="faster-fifo not installed"
+    )),
+]
+
+
+class TestBatchedLogging:
+    """Tests that batching never loses records."""
+
+    @pytest.mark.parametrize("use_faster_fifo", queue_kinds)
+    def test_worker_records_all_reach_log_file(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        use_faster_fifo: bool
+    ) -> None:
+        """Every record of a worker is written once it has flushed and exited."""
+        # A small faster-fifo queue fills up, so workers must wait for room
+        monkeypatch.setattr(mplog_examples, "FASTER_FIFO_QUEUE_BYTES", 64 * 1024)
+        log_file = tmp_path / "workers.log"
+        queue, listener = mplog_examples.setup_logging(
+            str(log_file), console=False, use_faster_fifo=use_faster_fifo
+        )
+
+        num_messages = 2 * mplog_examples.LOG_BATCH_SIZE + 50
+        workers = [
+            multiprocessing.Process(
+                target=mplog_examples.worker_process,
+                args=(queue, worker_id, True, num_messages)
+            )
+            for worker_id in (1, 2)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        listener.stop()
+
+        lines = log_file.read_text().splitlines()
+        assert [worker.exitcode for worker in workers] == [0, 0]
+        assert sum("Burst message" in line for line in lines) == 2 * num_messages
+        assert sum("Worker finished." in line for line in lines) == 2
+
+    # A max_batch of 1 stands for a queue too small for any whole batch
+    @pytest.mark.parametrize("max_batch", [10, 1])
+    def test_flush_waits_for_a_full_queue(self, max_batch: int) -> None:
+        """A batch is put again when the queue is full instead of failing."""
+        queue = FlakyQueue(max_batch)
+        handler = mplog_examples.BatchingQueueHandler(queue, batch_size=10)
+        logger = logging.getLogger("test_flush_waits_for_a_full_queue")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+
+        try:
+            for i in range(3):
+                logger.info("message %d", i)
+            handler.flush()
+        finally:
+            logger.removeHandler(handler)
+
+        assert [r.msg for batch in queue.items for r in batch] == [
+            "message 0", "message 1", "message 2"
+        ]
+        assert all(len(batch) <= max_batch for batch in queue.items)
+        assert handler.buffer == []
+
+    def test_listener_keeps_waiting_after_get_timeout(self) -> None:
+        """An Empty from a blocking get does not end the listener."""
+        queue = FlakyQueue()
+        queue.items.append(["batch"])
+        listener = mplog_examples.BatchQueueListener(queue)
+
+        assert listener.dequeue(True) == ["batch"]